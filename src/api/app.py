@@ -37,10 +37,9 @@ from src.api.websocket import gamification_manager
 from src.core.database import init_database, close_database
 from src.core.mcp_binder import MCPBinder, init_mcp_binder, get_mcp_binder
 from src.clients.conductor_client import ConductorClient
-from src.config.settings import CONDUCTOR_CONFIG, MONGODB_CONFIG, SERVER_CONFIG
+from src.config.settings import CONDUCTOR_CONFIG, MONGODB_CONFIG, SERVER_CONFIG, get_motor_client_options
 from src.utils.mcp_utils import init_agent
 from src.services.councilor_scheduler import CouncilorBackendScheduler
-from src.services.mcp_registry_service import MCPRegistryService
 from src.services.mcp_mesh_service import mesh_service
 from src.mcps.mcp_manager import MCPManager
 from src.services.sse_event_consumer import SSEEventConsumer
@@ -466,15 +465,48 @@ async def lifespan(app: FastAPI):
         tasks_collection.create_index([("agent_id", 1), ("created_at", -1)])
         tasks_collection.create_index("is_councilor_execution")
         tasks_collection.create_index([("is_councilor_execution", 1), ("created_at", -1)])
+        # Partial index for councilor execution reads (hinted by name in CouncilorService,
+        # which falls back to unhinted reads when it is missing)
+        try:
+            tasks_collection.create_index(
+                [("agent_id", 1), ("is_councilor_execution", 1), ("created_at", -1)],
+                name="councilor_exec_agent_created",
+                partialFilterExpression={"is_councilor_execution": True}
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Could not create partial councilor execution index on tasks (conflicting existing index?): {e}")
         logger.info("Created indexes on tasks collection")
 
+        # Personas: one per agent (create_persona relies on the unique index instead of a
+        # pre-insert lookup) and the list sort
+        personas_collection = mongo_db["personas"]
+        try:
+            personas_collection.create_index("agent_id", unique=True)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not create unique index on personas.agent_id (may have duplicates): {e}")
+        personas_collection.create_index([("updated_at", -1)])
+        logger.info("Created indexes on personas collection")
+
+        # Persona versions: create_version relies on the unique (agent_id, version) index
+        # to reject duplicate versions
+        persona_versions_collection = mongo_db["persona_versions"]
+        try:
+            persona_versions_collection.create_index([("agent_id", 1), ("version", -1)], unique=True)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not create unique index on persona_versions (may have duplicates): {e}")
+        persona_versions_collection.create_index([("timestamp", -1)])
+        logger.info("Created indexes on persona_versions collection")
+
         # Initialize screenplay service
         init_screenplay_service(mongo_db)
         logger.info("Initialized ScreenplayService with MongoDB connection")
 
-        # Initialize MCP Registry service
-        init_mcp_registry_service(mongo_db)
-        registry_service = MCPRegistryService(mongo_db)
+        # Initialize database for persona service (its Motor database also backs the MCP Registry)
+        motor_db = init_database()
+        logger.info("Initialized database connection for persona service")
+
+        # Initialize MCP Registry service (one instance shared by the router and the binder)
+        registry_service = init_mcp_registry_service(motor_db)
         logger.info("Initialized MCPRegistryService with MongoDB connection")
 
         # Initialize MCP Binder (core component for agent-MCP bindings)
@@ -493,10 +525,6 @@ async def lifespan(app: FastAPI):
 
         sse_event_consumer = SSEEventConsumer(on_event_callback=broadcast_tool_event)
         logger.info("Initialized SSEEventConsumer for tool call live events")
-
-        # Initialize database for persona service
-        init_database()
-        logger.info("Initialized database connection for persona service")
     except Exception as e:
         logger.error(f"Failed to connect to MongoDB: {e}")
         mongo_client = None
@@ -512,7 +540,7 @@ async def lifespan(app: FastAPI):
         try:
             from motor.motor_asyncio import AsyncIOMotorClient
             # Create async Motor client for scheduler
-            async_mongo_client = AsyncIOMotorClient(MONGODB_CONFIG["url"])
+            async_mongo_client = AsyncIOMotorClient(MONGODB_CONFIG["url"], **get_motor_client_options())
             async_mongo_db = async_mongo_client[MONGODB_CONFIG["database"]]
 
             councilor_scheduler = CouncilorBackendScheduler(async_mongo_db, conductor_client)
@@ -529,6 +557,11 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ Failed to start MCP Mesh Scanner: {e}")
 
+    # Start MCP Registry stale-heartbeat monitor and config cache invalidation
+    if mongo_db is not None:
+        await registry_service.start_stale_monitor()
+        await registry_service.start_config_watch()
+
     # Start MCP servers in daemon thread
     # This starts all new MCPs (5007-5009) plus legacy MCP (8006)
     mcp_thread = threading.Thread(target=start_mcp_servers, daemon=True, name="MCP-Servers-Thread")
@@ -554,6 +587,12 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error stopping MCP Mesh Scanner: {e}")
 
+    # Stop MCP Registry stale-heartbeat monitor, config cache invalidation and health-check client
+    if mongo_db is not None:
+        await registry_service.stop_stale_monitor()
+        await registry_service.stop_config_watch()
+        await registry_service.close()
+
     # Close Conductor client
     if conductor_client:
         await conductor_client.close()
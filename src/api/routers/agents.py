@@ -470,6 +470,10 @@ async def delete_agent(agent_id: str):
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail=f"Failed to delete agent: {agent_id}")
 
+        from src.services import councilor_service, persona_validator
+        councilor_service.invalidate_agent_cache(agent_id)
+        persona_validator.invalidate_agent_cache(agent_id)
+
         logger.info(f"✅ Agent deleted successfully: {agent_id}")
 
         return {
@@ -11,6 +11,7 @@ Provides endpoints for:
 import logging
 from datetime import datetime
 from typing import Optional
+from bson import ObjectId
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
@@ -139,8 +140,9 @@ async def promote_to_councilor_instance(
             else agent.get("definition", {}).get("name", agent_id)
         )
 
-        # Generate unique IDs
-        timestamp = int(datetime.utcnow().timestamp() * 1000)
+        # Generate unique IDs (one clock read shared by the IDs and every timestamp below)
+        now = datetime.utcnow()
+        timestamp = int(now.timestamp() * 1000)
         instance_id = f"councilor_{agent_id}_{timestamp}"
 
         # 2. Create screenplay for councilor
@@ -162,8 +164,10 @@ async def promote_to_councilor_instance(
 *Este screenplay foi criado automaticamente para rastrear execuções do conselheiro.*
 """
 
-        now = datetime.utcnow()
+        # _id generated client-side: no need to read it back from the insert result
+        screenplay_oid = ObjectId()
         screenplay_doc = {
+            "_id": screenplay_oid,
             "name": screenplay_name,
             "description": f"Screenplay para conselheiro: {councilor_config.title}",
             "tags": ["councilor", "auto-generated"],
@@ -174,8 +178,10 @@ async def promote_to_councilor_instance(
             "updatedAt": now,
         }
 
-        screenplay_result = await screenplays_collection.insert_one(screenplay_doc)
-        screenplay_id = str(screenplay_result.inserted_id)
+        # Inserted before the conversation is created, so Conductor never sees a
+        # screenplay_id that does not exist yet
+        await screenplays_collection.insert_one(screenplay_doc)
+        screenplay_id = str(screenplay_oid)
         logger.info(f"✅ [PROMOTE] Created screenplay: {screenplay_id}")
 
         # 3. Create conversation via Conductor API
@@ -195,27 +201,29 @@ async def promote_to_councilor_instance(
                     json=conversation_payload
                 )
 
-                if response.status_code not in (200, 201):
-                    logger.error(f"❌ [PROMOTE] Failed to create conversation: {response.status_code} - {response.text}")
-                    # Rollback: delete screenplay
-                    await screenplays_collection.delete_one({"_id": screenplay_result.inserted_id})
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail=f"Failed to create conversation: {response.text}"
-                    )
+            if response.status_code not in (200, 201):
+                logger.error(f"❌ [PROMOTE] Failed to create conversation: {response.status_code} - {response.text}")
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Failed to create conversation: {response.text}"
+                )
 
-                conversation_data = response.json()
-                conversation_id = conversation_data.get("conversation_id") or conversation_data.get("id")
-                logger.info(f"✅ [PROMOTE] Created conversation: {conversation_id}")
+            conversation_data = response.json()
+            conversation_id = conversation_data.get("conversation_id") or conversation_data.get("id")
+            logger.info(f"✅ [PROMOTE] Created conversation: {conversation_id}")
 
         except httpx.RequestError as e:
             logger.error(f"❌ [PROMOTE] Connection error to Conductor API: {e}")
             # Rollback: delete screenplay
-            await screenplays_collection.delete_one({"_id": screenplay_result.inserted_id})
+            await screenplays_collection.delete_one({"_id": screenplay_oid})
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail=f"Could not connect to Conductor API: {str(e)}"
             )
+        except Exception:
+            # Rollback: delete screenplay (error status, unreadable response, ...)
+            await screenplays_collection.delete_one({"_id": screenplay_oid})
+            raise
 
         # 4. Create agent_instance via internal call (same structure as POST /api/agents/instances)
         # This ensures councilor instances have the SAME structure as chat instances
@@ -787,7 +795,7 @@ async def list_agents(
 
     **Query Parameters:**
     - `is_councilor`: Filter by councilor status
-      - `true`: Only councilors
+      - `true`: Only councilors (each with its `latest_execution`)
       - `false`: Only non-councilors
       - Not provided: All agents
 
@@ -796,6 +804,8 @@ async def list_agents(
     """
     try:
         logger.info(f"📋 Listing agents (is_councilor={is_councilor})")
+        if is_councilor:
+            return await service.list_councilors()
         return await service.list_all_agents(is_councilor=is_councilor)
     except Exception as e:
         logger.error(f"❌ Error listing agents: {e}")
@@ -1130,6 +1140,7 @@ async def save_execution(
 async def get_councilor_report(
     agent_id: str = Path(..., description="Agent ID"),
     limit: int = Query(10, ge=1, le=100, description="Number of recent executions to include"),
+    include_output: bool = Query(True, description="Include each execution's output"),
     service: CouncilorService = Depends(get_councilor_service)
 ):
     """
@@ -1140,6 +1151,7 @@ async def get_councilor_report(
 
     **Query Parameters:**
     - `limit`: Number of recent executions to include (1-100, default: 10)
+    - `include_output`: Include each execution's output (default: true; false returns a lighter report)
 
     **Returns:**
     - Councilor report with:
@@ -1155,7 +1167,7 @@ async def get_councilor_report(
     try:
         logger.info(f"📋 Getting report for councilor '{agent_id}'")
 
-        report = await service.get_councilor_report(agent_id, limit)
+        report = await service.get_councilor_report(agent_id, limit, include_output)
         return report
 
     except ValueError as e:
@@ -11,8 +11,9 @@ Provides endpoints for:
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pymongo.database import Database
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from src.models.mcp_registry import (
     MCPType,
@@ -38,11 +39,12 @@ router = APIRouter(prefix="/mcp", tags=["MCP Registry"])
 _registry_service: Optional[MCPRegistryService] = None
 
 
-def init_mcp_registry_service(db: Database):
+def init_mcp_registry_service(db: AsyncIOMotorDatabase) -> MCPRegistryService:
     """Initialize the MCP Registry service with database connection."""
     global _registry_service
     _registry_service = MCPRegistryService(db)
     logger.info("MCP Registry service initialized")
+    return _registry_service
 
 
 def get_registry_service() -> MCPRegistryService:
@@ -76,7 +78,7 @@ async def register_mcp(
     Internal MCPs (prospector, database, conductor) cannot be overwritten.
     """
     try:
-        entry = service.register(request)
+        entry = await service.register(request)
         logger.info(f"MCP registered: {request.name} at {request.url}")
         return entry
     except ValueError as e:
@@ -103,7 +105,7 @@ async def unregister_mcp(
     Internal MCPs cannot be unregistered.
     """
     try:
-        success = service.unregister(name)
+        success = await service.unregister(name)
         if not success:
             raise HTTPException(status_code=404, detail=f"MCP '{name}' not found")
         logger.info(f"MCP unregistered: {name}")
@@ -134,7 +136,7 @@ async def heartbeat(
     MCPs that don't send heartbeats for 90 seconds are marked unhealthy.
     """
     tools_count = request.tools_count if request else None
-    success = service.heartbeat(name, tools_count)
+    success = await service.heartbeat(name, tools_count)
 
     if not success:
         raise HTTPException(status_code=404, detail=f"MCP '{name}' not found")
@@ -163,14 +165,14 @@ async def list_mcps(
     Returns both internal MCPs (hosted in gateway) and external MCPs (sidecars).
     Supports filtering by type, category, and status.
     """
-    items = service.list_all(
+    items = await service.list_all(
         type_filter=type,
         category_filter=category,
         status_filter=status,
         healthy_only=healthy_only
     )
 
-    stats = service.get_stats()
+    stats = await service.get_stats()
 
     return MCPListResponse(
         items=items,
@@ -191,10 +193,12 @@ async def get_mcp_mesh():
     Get the current topology of the active MCP Service Mesh.
     This bypasses passive heartbeat registries and relies on the active background scanner.
     """
-    return {
-        "mesh_nodes": mesh_service.get_mesh_topology_as_dict(),
-        "total_active": len(mesh_service.get_mesh_topology())
-    }
+    # Nodes are already JSON-ready: serialize directly with orjson, skipping jsonable_encoder
+    mesh_nodes = mesh_service.get_mesh_topology_as_dict()
+    return Response(
+        content=orjson.dumps({"mesh_nodes": mesh_nodes, "total_active": len(mesh_nodes)}),
+        media_type="application/json"
+    )
 
 
 @router.get(
@@ -231,7 +235,7 @@ async def get_mcp_config(
             detail="Either instance_id or agent_id must be provided"
         )
 
-    config = service.get_mcp_config(instance_id=instance_id, agent_id=agent_id)
+    config = await service.get_mcp_config(instance_id=instance_id, agent_id=agent_id)
     logger.info(f"MCP config requested: instance={instance_id}, agent={agent_id}, mcps={list(config.mcpServers.keys())}")
     return config
 
@@ -251,7 +255,7 @@ async def get_mcp(
 
     Returns the full registration entry including URL, status, and metadata.
     """
-    entry = service.get_by_name(name)
+    entry = await service.get_by_name(name)
     if not entry:
         raise HTTPException(status_code=404, detail=f"MCP '{name}' not found")
     return entry
@@ -295,7 +299,7 @@ async def resolve_mcps(
     Used by the Conductor to convert mcp_configs (list of names) to actual URLs.
     Returns both resolved URLs and any names that couldn't be found.
     """
-    resolved, not_found = service.resolve_names(request.names)
+    resolved, not_found = await service.resolve_names(request.names)
 
     if not_found:
         logger.warning(f"Could not resolve MCPs: {not_found}")
@@ -319,7 +323,7 @@ async def get_stats(
     service: MCPRegistryService = Depends(get_registry_service)
 ):
     """Get statistics about the MCP registry."""
-    return service.get_stats()
+    return await service.get_stats()
 
 
 @router.post(
@@ -337,5 +341,22 @@ async def cleanup_stale(
     Removes external MCPs that haven't sent a heartbeat in the specified time.
     Internal MCPs are never removed.
     """
-    count = service.cleanup_stale_entries(max_age_hours)
+    count = await service.cleanup_stale_entries(max_age_hours)
     return {"removed": count}
+
+
+@router.post(
+    "/health/sweep",
+    response_model=list[MCPHealthResponse],
+    summary="Check health of all external MCPs",
+    description="Probe every external MCP concurrently and record the results in one batch."
+)
+async def sweep_health(
+    service: MCPRegistryService = Depends(get_registry_service)
+):
+    """
+    Actively check health of all external MCP servers.
+
+    Probes run in parallel and their statuses are written back with a single bulk write.
+    """
+    return await service.sweep_health()
@@ -12,10 +12,23 @@ import time
 import uuid
 from typing import Dict, Set, Any
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 logger = logging.getLogger(__name__)
 
+# Naive datetimes in payloads are UTC (datetime.utcnow()) and are emitted with a "Z" suffix
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _encode_event(event_type: str, data: dict) -> str:
+    """Serialize an event envelope to a JSON text frame using orjson"""
+    return orjson.dumps({
+        "type": event_type,
+        "data": data,
+        "timestamp": time.time()
+    }, option=_ORJSON_OPTIONS).decode()
+
 
 class GamificationConnectionManager:
     """Manages WebSocket connections for gamification events"""
@@ -55,6 +68,7 @@ class GamificationConnectionManager:
 
         dead_clients = []
         sent_count = 0
+        message = None
 
         for client_id, websocket in self.active_connections.items():
             # Check if client is subscribed to this event type
@@ -63,11 +77,10 @@ class GamificationConnectionManager:
                 continue
 
             try:
-                await websocket.send_json({
-                    "type": event_type,
-                    "data": data,
-                    "timestamp": time.time()
-                })
+                # Serialize once, lazily, and reuse the same frame for every client
+                if message is None:
+                    message = _encode_event(event_type, data)
+                await websocket.send_text(message)
                 sent_count += 1
             except Exception as e:
                 logger.error(f"❌ Error sending to client {client_id}: {e}")
@@ -91,11 +104,7 @@ class GamificationConnectionManager:
         websocket = self.active_connections.get(client_id)
         if websocket:
             try:
-                await websocket.send_json({
-                    "type": event_type,
-                    "data": data,
-                    "timestamp": time.time()
-                })
+                await websocket.send_text(_encode_event(event_type, data))
                 logger.debug(f"📤 Sent {event_type} to client {client_id}")
             except Exception as e:
                 logger.error(f"❌ Error sending to client {client_id}: {e}")
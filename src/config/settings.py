@@ -27,6 +27,10 @@ def load_config():
         "mongodb": {
             "url": os.getenv("MONGODB_URL", "mongodb://localhost:27017/conductor_state"),
             "database": "conductor_state",
+            # Async (Motor) connection pool sizing; wait_queue_timeout_ms=None waits indefinitely
+            "max_pool_size": 100,
+            "min_pool_size": 0,
+            "wait_queue_timeout_ms": None,
         },
     }
 
@@ -71,6 +75,18 @@ def load_config():
 
     config["mongodb"]["url"] = os.getenv("MONGODB_URL", config["mongodb"]["url"])
     config["mongodb"]["database"] = os.getenv("MONGODB_DATABASE", config["mongodb"]["database"])
+    config["mongodb"]["max_pool_size"] = int(
+        os.getenv("MONGODB_MAX_POOL_SIZE", config["mongodb"].get("max_pool_size", 100))
+    )
+    config["mongodb"]["min_pool_size"] = int(
+        os.getenv("MONGODB_MIN_POOL_SIZE", config["mongodb"].get("min_pool_size", 0))
+    )
+    wait_queue_timeout_ms = os.getenv(
+        "MONGODB_WAIT_QUEUE_TIMEOUT_MS", config["mongodb"].get("wait_queue_timeout_ms")
+    )
+    config["mongodb"]["wait_queue_timeout_ms"] = (
+        int(wait_queue_timeout_ms) if wait_queue_timeout_ms is not None else None
+    )
 
     return config
 
@@ -89,6 +105,17 @@ logger.info(f"Conductor project path: {CONDUCTOR_CONFIG['project_path']}")
 logger.info(f"MongoDB: {MONGODB_CONFIG['url']}/{MONGODB_CONFIG['database']}")
 
 
+def get_motor_client_options() -> dict:
+    """Connection pool kwargs for AsyncIOMotorClient, from MONGODB_CONFIG."""
+    options = {
+        "maxPoolSize": MONGODB_CONFIG["max_pool_size"],
+        "minPoolSize": MONGODB_CONFIG["min_pool_size"],
+    }
+    if MONGODB_CONFIG["wait_queue_timeout_ms"] is not None:
+        options["waitQueueTimeoutMS"] = MONGODB_CONFIG["wait_queue_timeout_ms"]
+    return options
+
+
 # MongoDB client singleton
 _mongo_client = None
 
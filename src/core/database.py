@@ -5,7 +5,7 @@ Database dependency for FastAPI
 from fastapi import Depends
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from pymongo import MongoClient
-from src.config.settings import MONGODB_CONFIG
+from src.config.settings import MONGODB_CONFIG, get_motor_client_options
 
 # Global MongoDB client
 mongo_client: MongoClient | None = None
@@ -45,7 +45,7 @@ def init_database():
         from motor.motor_asyncio import AsyncIOMotorClient
         
         # Create async MongoDB client
-        mongo_client = AsyncIOMotorClient(MONGODB_CONFIG["url"])
+        mongo_client = AsyncIOMotorClient(MONGODB_CONFIG["url"], **get_motor_client_options())
         mongo_db = mongo_client[MONGODB_CONFIG["database"]]
         
         return mongo_db
@@ -155,7 +155,7 @@ class MCPBinder:
             logger.warning(f"[BINDER] Truncated MCPs to {policy.max_concurrent_mcps} per policy")
 
         # Resolve MCP names to URLs
-        resolved, not_found = self.registry.resolve_names(mcp_names)
+        resolved, not_found = await self.registry.resolve_names(mcp_names)
 
         if not_found:
             logger.warning(f"[BINDER] MCPs not found in registry: {not_found}")
@@ -274,7 +274,7 @@ class MCPBinder:
             return False
 
         # Resolve
-        resolved, not_found = self.registry.resolve_names([mcp_name])
+        resolved, not_found = await self.registry.resolve_names([mcp_name])
         if mcp_name in not_found:
             logger.error(f"[BINDER] MCP {mcp_name} not found in registry")
             return False
@@ -347,7 +347,7 @@ class MCPBinder:
 
         # Re-resolve all MCPs
         mcp_names = list(binding.mcps.keys())
-        resolved, not_found = self.registry.resolve_names(mcp_names)
+        resolved, not_found = await self.registry.resolve_names(mcp_names)
 
         # Update URLs and check health
         for name in mcp_names:
@@ -236,6 +236,7 @@ class AgentWithCouncilorResponse(BaseModel):
     stats: Optional[AgentStats] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    latest_execution: CouncilorExecutionResponse | None = None  # Only filled by list_councilors
 
     class Config:
         from_attributes = True
@@ -12,17 +12,80 @@ Features:
 - Real-time events: Broadcasts execution events via WebSocket
 """
 
+import asyncio
+import functools
 import logging
 import re
-from datetime import datetime
+import time
+from datetime import UTC, datetime
 from typing import Optional
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+from src.api.websocket import gamification_manager
 
 logger = logging.getLogger(__name__)
 
+# Severity keywords matched case-insensitively against agent output
+_ERROR_KEYWORDS = (
+    'crítico', 'erro', 'falha', 'failed', 'error',
+    'critical', 'fatal', 'exception'
+)
+_WARNING_KEYWORDS = (
+    'alerta', 'atenção', 'warning', 'aviso',
+    'vulnerab', 'deprecated', 'caution'
+)
+# Single pattern so the output is scanned once; match.lastgroup tells the class apart.
+# re.IGNORECASE folds case inside the matcher (Unicode-aware, so "CRÍTICO" and
+# "ATENÇÃO" match too): the output is never copied with .lower()
+_SEVERITY_RE = re.compile(
+    '(?P<error>' + '|'.join(map(re.escape, _ERROR_KEYWORDS)) + ')'
+    '|(?P<warning>' + '|'.join(map(re.escape, _WARNING_KEYWORDS)) + ')',
+    re.IGNORECASE
+)
+
+# Only the fields read by schedule_councilor / the instance execution path
+_AGENT_SCHEDULE_PROJECTION = {"_id": 0, "agent_id": 1, "councilor_config": 1, "definition.name": 1}
+_AGENT_COUNCILOR_PROJECTION = {**_AGENT_SCHEDULE_PROJECTION, "is_councilor": 1}
+_INSTANCE_SCHEDULE_PROJECTION = {
+    "_id": 0, "instance_id": 1, "agent_id": 1, "screenplay_id": 1, "conversation_id": 1,
+    "councilor_config": 1, "customization": 1, "cwd": 1
+}
+_LOAD_BATCH_SIZE = 100
+
+# Cap on the prompt stored in error task documents (bounded document size)
+_ERROR_PROMPT_MAX_CHARS = 4096
+
+_INTERVAL_RE = re.compile(r'^(\d+)([mhd])$')
+_INTERVAL_UNITS = {'m': 'minutes', 'h': 'hours', 'd': 'days'}
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_interval(value: str) -> tuple:
+    """Parse an interval string like "30m" into (IntervalTrigger kwarg, amount)"""
+    match = _INTERVAL_RE.match(value)
+    if not match:
+        raise ValueError(f"Invalid interval format: {value}. Expected format: <number><unit> (e.g., 30m, 1h, 2d)")
+
+    num, unit = match.groups()
+    return _INTERVAL_UNITS[unit], int(num)
+
+
+def _trigger_summary(trigger) -> str:
+    """Compact trigger description, e.g. "interval:1800s" or "cron:minute=*/5 hour=9" """
+    if isinstance(trigger, IntervalTrigger):
+        return f"interval:{int(trigger.interval.total_seconds())}s"
+    if isinstance(trigger, CronTrigger):
+        expressions = [
+            f"{field.name}={field}" for field in trigger.fields
+            if not field.is_default and str(field) != "*"
+        ]
+        return "cron:" + (" ".join(expressions) or "*")
+    return type(trigger).__name__
+
 
 class CouncilorBackendScheduler:
     """
@@ -32,6 +95,10 @@ class CouncilorBackendScheduler:
     run reliably even across server restarts.
     """
 
+    # Severity scan window (characters) for long agent outputs
+    SEVERITY_HEAD_CHARS = 4096
+    SEVERITY_TAIL_CHARS = 4096
+
     def __init__(self, db: AsyncIOMotorDatabase, conductor_client):
         """
         Initialize the scheduler
@@ -46,7 +113,8 @@ class CouncilorBackendScheduler:
         self.tasks_collection = db.tasks  # Use tasks collection instead of councilor_executions
 
         # Configure APScheduler with in-memory job store
-        # Note: MongoDB jobstore doesn't work with async objects like ConductorClient
+        # Note: MongoDB jobstore doesn't work with async objects like ConductorClient, and its
+        # synchronous pymongo calls would block the event loop (and be shared across replicas)
         # Jobs are recreated from MongoDB agents collection on startup, so we don't lose them
         self.scheduler = AsyncIOScheduler(timezone='UTC')
         logger.info("🏛️ Councilor Backend Scheduler initialized (uses tasks collection)")
@@ -54,20 +122,39 @@ class CouncilorBackendScheduler:
     async def start(self):
         """Start the scheduler and load active councilors"""
         try:
-            # Load active councilors from database
-            await self.load_councilors()
-
-            # Start APScheduler
+            # Start APScheduler paused so the bulk load doesn't wake it up per add_job
             if not self.scheduler.running:
-                self.scheduler.start()
-                logger.info("✅ Councilor Scheduler started")
+                self.scheduler.start(paused=True)
             else:
                 logger.info("ℹ️ Scheduler already running")
+                self.scheduler.pause()
+
+            # Load active councilors from database
+            await self.load_councilors()
+
+            # Resume once: a single wakeup plans every loaded job
+            self.scheduler.resume()
+            logger.info(f"✅ Councilor Scheduler started with {len(self.scheduler.get_jobs())} jobs")
+
+            # Indexes backing the per-execution lookups (idempotent, after jobs are live)
+            await self.ensure_indexes()
 
         except Exception as e:
             logger.error(f"❌ Failed to start scheduler: {e}")
             raise
 
+    async def ensure_indexes(self):
+        """Create the MongoDB indexes used by the scheduler's per-execution queries"""
+        try:
+            await asyncio.gather(
+                self.agents_collection.create_index("agent_id", unique=True),
+                self.db.agent_instances.create_index("instance_id", unique=True),
+                self.tasks_collection.create_index([("agent_id", 1), ("created_at", -1)])
+            )
+            logger.debug("✅ Scheduler indexes ensured")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to create scheduler indexes: {e}")
+
     async def load_councilors(self):
         """Load all active councilors from database and schedule their tasks"""
         try:
@@ -75,52 +162,78 @@ class CouncilorBackendScheduler:
             # NEW: Load from agent_instances (is_councilor_instance=True)
             # ============================================================
             agent_instances = self.db.agent_instances
-            instances_cursor = agent_instances.find({
-                "is_councilor_instance": True,
-                "councilor_config.schedule.enabled": True,
-                "$or": [
-                    {"isDeleted": {"$ne": True}},
-                    {"isDeleted": {"$exists": False}}
-                ]
-            })
+            instances_cursor = agent_instances.find(
+                {
+                    "is_councilor_instance": True,
+                    "councilor_config.schedule.enabled": True,
+                    "$or": [
+                        {"isDeleted": {"$ne": True}},
+                        {"isDeleted": {"$exists": False}}
+                    ]
+                },
+                projection=_INSTANCE_SCHEDULE_PROJECTION
+            ).batch_size(_LOAD_BATCH_SIZE)
 
-            councilor_instances = await instances_cursor.to_list(length=None)
-            logger.info(f"📋 Loading {len(councilor_instances)} councilor instances from agent_instances")
+            instances_count = await self._schedule_from_cursor(
+                instances_cursor, self.schedule_councilor_instance, "instance_id", "councilor instance"
+            )
 
-            for instance in councilor_instances:
-                try:
-                    await self.schedule_councilor_instance(instance)
-                except Exception as e:
-                    instance_id = instance.get("instance_id", "unknown")
-                    logger.error(f"❌ Failed to schedule councilor instance {instance_id}: {e}")
+            logger.info(f"📋 Loaded {instances_count} councilor instances from agent_instances")
 
             # ============================================================
             # LEGACY: Also load from agents (is_councilor=True) for backwards compatibility
             # This will be deprecated once all councilors are migrated to instances
             # ============================================================
-            cursor = self.agents_collection.find({
-                "is_councilor": True,
-                "councilor_config.schedule.enabled": True
-            })
-
-            legacy_councilors = await cursor.to_list(length=None)
+            cursor = self.agents_collection.find(
+                {
+                    "is_councilor": True,
+                    "councilor_config.schedule.enabled": True
+                },
+                projection=_AGENT_SCHEDULE_PROJECTION
+            ).batch_size(_LOAD_BATCH_SIZE)
 
-            if legacy_councilors:
-                logger.info(f"📋 Loading {len(legacy_councilors)} legacy councilors from agents collection")
+            legacy_count = await self._schedule_from_cursor(
+                cursor, self.schedule_councilor, "agent_id", "legacy councilor"
+            )
 
-                for councilor in legacy_councilors:
-                    try:
-                        await self.schedule_councilor(councilor)
-                    except Exception as e:
-                        agent_id = councilor.get("agent_id", "unknown")
-                        logger.error(f"❌ Failed to schedule legacy councilor {agent_id}: {e}")
+            if legacy_count:
+                logger.info(f"📋 Loaded {legacy_count} legacy councilors from agents collection")
 
-            total = len(councilor_instances) + len(legacy_councilors)
-            logger.info(f"✅ Loaded {total} total councilors ({len(councilor_instances)} instances, {len(legacy_councilors)} legacy)")
+            total = instances_count + legacy_count
+            logger.info(f"✅ Loaded {total} total councilors ({instances_count} instances, {legacy_count} legacy)")
 
         except Exception as e:
             logger.error(f"❌ Failed to load councilors: {e}")
 
+    async def _schedule_from_cursor(self, cursor, schedule_fn, id_field: str, label: str) -> int:
+        """
+        Schedule every document of a cursor concurrently
+
+        Scheduling starts as each document arrives, so it overlaps with
+        fetching the next cursor batch. Failures are logged per document.
+
+        Args:
+            cursor: Motor cursor over councilor documents
+            schedule_fn: Coroutine function that schedules one document
+            id_field: Document field used to identify failures in logs
+            label: Human-readable document kind for logs
+
+        Returns:
+            Number of documents read from the cursor
+        """
+        docs = []
+        pending = []
+        async for doc in cursor:
+            docs.append(doc)
+            pending.append(asyncio.ensure_future(schedule_fn(doc)))
+
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        for doc, result in zip(docs, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"❌ Failed to schedule {label} {doc.get(id_field, 'unknown')}: {result}")
+
+        return len(docs)
+
     async def schedule_councilor(self, councilor: dict):
         """
         Schedule a councilor task
@@ -150,12 +263,8 @@ class CouncilorBackendScheduler:
 
         # Create trigger based on schedule type
         try:
-            if schedule["type"] == "interval":
-                trigger = self._parse_interval_trigger(schedule["value"])
-            elif schedule["type"] == "cron":
-                trigger = CronTrigger.from_crontab(schedule["value"])
-            else:
-                logger.error(f"❌ Unknown schedule type: {schedule['type']}")
+            trigger = self._build_trigger(schedule)
+            if trigger is None:
                 return
 
             # Add job to scheduler
@@ -172,7 +281,7 @@ class CouncilorBackendScheduler:
                 jobstore='default'
             )
 
-            logger.info(
+            logger.debug(
                 f"⏰ Scheduled: {agent_id} - "
                 f"{schedule['type']}={schedule['value']}"
             )
@@ -221,19 +330,17 @@ class CouncilorBackendScheduler:
 
         # Create trigger based on schedule type
         try:
-            if schedule["type"] == "interval":
-                trigger = self._parse_interval_trigger(schedule["value"])
-            elif schedule["type"] == "cron":
-                trigger = CronTrigger.from_crontab(schedule["value"])
-            else:
-                logger.error(f"❌ Unknown schedule type: {schedule['type']}")
+            trigger = self._build_trigger(schedule)
+            if trigger is None:
                 return
 
             # Get display name
             display_name = customization.get("display_name") if customization else None
             if not display_name:
                 # Try to get from agent template
-                agent = await self.agents_collection.find_one({"agent_id": agent_id})
+                agent = await self.agents_collection.find_one(
+                    {"agent_id": agent_id}, {"_id": 0, "definition.name": 1}
+                )
                 display_name = agent.get("definition", {}).get("name", agent_id) if agent else agent_id
 
             # Add job to scheduler with full instance data
@@ -249,7 +356,7 @@ class CouncilorBackendScheduler:
                 jobstore='default'
             )
 
-            logger.info(
+            logger.debug(
                 f"⏰ Scheduled instance: {instance_id} ({agent_id}) - "
                 f"{schedule['type']}={schedule['value']}"
             )
@@ -271,6 +378,9 @@ class CouncilorBackendScheduler:
 
         Args:
             instance: Full instance document with all IDs
+
+        Returns:
+            Updated instance statistics, or None if they could not be updated
         """
         import httpx
         import os
@@ -288,53 +398,36 @@ class CouncilorBackendScheduler:
         display_name = customization.get("display_name") if customization else agent_id
         task_name = task.get("name", "Unknown Task")
 
-        start_time = datetime.utcnow()
-        execution_id = f"exec_{instance_id}_{int(start_time.timestamp() * 1000)}"
+        # One wall-clock read for IDs/timestamps, a monotonic clock for duration
+        start_ns = time.time_ns()
+        start_perf = time.perf_counter_ns()
+        start_time = datetime.fromtimestamp(start_ns / 1e9, tz=UTC)
+        execution_id = f"exec_{instance_id}_{start_ns // 1_000_000}"
         task_id = str(ObjectId())  # Generate task_id like gateway does
 
         logger.info(f"🔎 Executing councilor instance task: {display_name} ({instance_id})")
 
         # 🔔 Emit "councilor_started" event via WebSocket with all IDs
-        try:
-            from src.api.websocket import gamification_manager
-            await gamification_manager.broadcast("councilor_started", {
-                "councilor_id": instance_id,
-                "agent_id": agent_id,
-                "task_name": task_name,
-                "display_name": display_name,
-                "execution_id": execution_id,
-                "task_id": task_id,  # Include task_id for navigation
-                "started_at": start_time.isoformat(),
-                # Include IDs for navigation
-                "screenplay_id": screenplay_id,
-                "conversation_id": conversation_id,
-                "instance_id": instance_id
-            })
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to broadcast councilor_started event: {e}")
+        await self._safe_broadcast("councilor_started", {
+            "councilor_id": instance_id,
+            "agent_id": agent_id,
+            "task_name": task_name,
+            "display_name": display_name,
+            "execution_id": execution_id,
+            "task_id": task_id,  # Include task_id for navigation
+            "started_at": start_time,
+            # Include IDs for navigation
+            "screenplay_id": screenplay_id,
+            "conversation_id": conversation_id,
+            "instance_id": instance_id
+        })
 
         try:
             # Get prompt from task config
             prompt_text = task.get("prompt", "Analyze the project and provide insights")
 
             # 🔥 Inject Live MCP Mesh Topology Context
-            try:
-                from src.services.mcp_mesh_service import mesh_service
-                active_mesh = mesh_service.get_mesh_topology()
-                if active_mesh:
-                    mesh_info = "\n\n=== LIVE MCP SERVICE MESH ===\n"
-                    mesh_info += "The following MCP sidecars are currently active and available on the network:\n"
-                    for node in active_mesh:
-                        port_str = ""
-                        try:
-                            # Extract port from URL like http://host.docker.internal:13000/sse
-                            port_str = node.url.split(":")[2].split("/")[0]
-                        except:
-                            pass
-                        mesh_info += f"- Service: {node.name}" + (f" (Port {port_str})" if port_str else "") + f" | Tools: {node.tools_count}\n"
-                    prompt_text += mesh_info
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to inject MCP Mesh into prompt for instance {instance_id}: {e}")
+            prompt_text += self._build_mesh_context(f"instance {instance_id}")
 
             # Get Conductor API URL
             conductor_api_url = os.getenv("CONDUCTOR_API_URL", "http://primoia-conductor-api:8000")
@@ -372,8 +465,8 @@ class CouncilorBackendScheduler:
                 response.raise_for_status()
                 result = response.json()
 
-            end_time = datetime.utcnow()
-            duration_ms = int((end_time - start_time).total_seconds() * 1000)
+            end_time = datetime.now(UTC)
+            duration_ms = (time.perf_counter_ns() - start_perf) // 1_000_000
 
             # Extract result data
             output = result.get("result", "") if isinstance(result, dict) else str(result)
@@ -387,7 +480,7 @@ class CouncilorBackendScheduler:
             logger.info(f"   - Exit code: {exit_code}")
 
             # Update instance statistics
-            await self._update_instance_stats(instance_id, exit_code == 0, duration_ms)
+            stats = await self._update_instance_stats(instance_id, exit_code == 0, duration_ms)
 
             # 💬 Save messages to conversation (same as user flow)
             # This makes councilor executions visible in the chat
@@ -401,140 +494,148 @@ class CouncilorBackendScheduler:
             )
 
             # 🔔 Emit "councilor_completed" event via WebSocket with all IDs
-            try:
-                from src.api.websocket import gamification_manager
-                await gamification_manager.broadcast("councilor_completed", {
-                    "councilor_id": instance_id,
-                    "agent_id": agent_id,
-                    "task_name": task_name,
-                    "display_name": display_name,
-                    "execution_id": execution_id,
-                    "task_id": task_id,  # Include task_id for navigation
-                    "status": "completed",
-                    "severity": severity,
-                    "started_at": start_time.isoformat(),
-                    "completed_at": end_time.isoformat(),
-                    "duration_ms": duration_ms,
-                    # Include IDs for navigation
-                    "screenplay_id": screenplay_id,
-                    "conversation_id": conversation_id,
-                    "instance_id": instance_id
-                })
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to broadcast councilor_completed event: {e}")
+            await self._safe_broadcast("councilor_completed", {
+                "councilor_id": instance_id,
+                "agent_id": agent_id,
+                "task_name": task_name,
+                "display_name": display_name,
+                "execution_id": execution_id,
+                "task_id": task_id,  # Include task_id for navigation
+                "status": "completed",
+                "severity": severity,
+                "started_at": start_time,
+                "completed_at": end_time,
+                "duration_ms": duration_ms,
+                # Include IDs for navigation
+                "screenplay_id": screenplay_id,
+                "conversation_id": conversation_id,
+                "instance_id": instance_id
+            })
+
+            return stats
 
         except httpx.HTTPStatusError as e:
             logger.error(f"❌ Conductor API error for councilor {instance_id}: {e.response.status_code}")
             logger.error(f"   - Response: {e.response.text[:500] if e.response.text else 'empty'}")
-            await self._handle_councilor_error(instance, instance_id, agent_id, task_name, display_name, execution_id, task_id, start_time, screenplay_id, conversation_id, str(e))
+            return await self._handle_councilor_error(instance, instance_id, agent_id, task_name, display_name, execution_id, task_id, start_time, screenplay_id, conversation_id, str(e))
 
         except httpx.RequestError as e:
             logger.error(f"❌ Connection error to Conductor API for councilor {instance_id}: {e}")
-            await self._handle_councilor_error(instance, instance_id, agent_id, task_name, display_name, execution_id, task_id, start_time, screenplay_id, conversation_id, str(e))
+            return await self._handle_councilor_error(instance, instance_id, agent_id, task_name, display_name, execution_id, task_id, start_time, screenplay_id, conversation_id, str(e))
 
         except Exception as e:
             logger.error(f"❌ Error executing councilor instance task {instance_id}: {e}", exc_info=True)
-            await self._handle_councilor_error(instance, instance_id, agent_id, task_name, display_name, execution_id, task_id, start_time, screenplay_id, conversation_id, str(e))
+            return await self._handle_councilor_error(instance, instance_id, agent_id, task_name, display_name, execution_id, task_id, start_time, screenplay_id, conversation_id, str(e))
 
     async def _handle_councilor_error(self, instance: dict, instance_id: str, agent_id: str, task_name: str, display_name: str, execution_id: str, task_id: str, start_time: datetime, screenplay_id: str, conversation_id: str, error_message: str):
-        """Handle councilor execution error - update stats and broadcast event"""
-        end_time = datetime.utcnow()
+        """Handle councilor execution error - update stats, broadcast event and return the updated stats"""
+        end_time = datetime.now(UTC)
         error_duration_ms = int((end_time - start_time).total_seconds() * 1000)
 
         # Update stats with failure
-        await self._update_instance_stats(instance_id, success=False, duration_ms=error_duration_ms)
+        stats = await self._update_instance_stats(instance_id, success=False, duration_ms=error_duration_ms)
 
         # 🔔 Emit "councilor_error" event via WebSocket with all IDs
-        try:
-            from src.api.websocket import gamification_manager
-            await gamification_manager.broadcast("councilor_error", {
-                "councilor_id": instance_id,
-                "agent_id": agent_id,
-                "task_name": task_name,
-                "display_name": display_name,
-                "execution_id": execution_id,
-                "task_id": task_id,
-                "status": "error",
-                "severity": "error",
-                "error": error_message,
-                "started_at": start_time.isoformat(),
-                "completed_at": end_time.isoformat(),
-                # Include IDs for navigation
-                "screenplay_id": screenplay_id,
-                "conversation_id": conversation_id,
-                "instance_id": instance_id
-            })
-        except Exception as broadcast_err:
-            logger.warning(f"⚠️ Failed to broadcast councilor_error event: {broadcast_err}")
+        await self._safe_broadcast("councilor_error", {
+            "councilor_id": instance_id,
+            "agent_id": agent_id,
+            "task_name": task_name,
+            "display_name": display_name,
+            "execution_id": execution_id,
+            "task_id": task_id,
+            "status": "error",
+            "severity": "error",
+            "error": error_message,
+            "started_at": start_time,
+            "completed_at": end_time,
+            # Include IDs for navigation
+            "screenplay_id": screenplay_id,
+            "conversation_id": conversation_id,
+            "instance_id": instance_id
+        })
+
+        return stats
 
     async def _update_instance_stats(self, instance_id: str, success: bool, duration_ms: int = 0):
         """
         Update councilor instance execution statistics (normalized structure).
 
+        Uses a single aggregation-pipeline update so the counters are computed
+        server-side from the current document, without a preceding read.
+
         Args:
             instance_id: Instance ID
             success: Whether execution was successful
             duration_ms: Execution duration in milliseconds
+
+        Returns:
+            Updated statistics dict, or None if the instance was not updated
         """
         try:
-            agent_instances = self.db.agent_instances
-            instance = await agent_instances.find_one({"instance_id": instance_id})
-
-            if not instance:
-                logger.warning(f"Instance {instance_id} not found for stats update")
-                return
+            now_iso = datetime.utcnow().isoformat()
+            success_inc = 1 if success else 0
 
-            # Get current statistics (support both old 'stats' and new 'statistics')
-            statistics = instance.get("statistics", instance.get("stats", {
-                "task_count": 0,
-                "total_execution_time": 0.0,
-                "average_execution_time": 0.0,
-                "success_count": 0,
-                "error_count": 0,
-                "total_executions": 0,
-                "success_rate": 0.0,
-                "last_execution": None
-            }))
-
-            # Calculate new statistics
-            now = datetime.utcnow()
-            task_count = statistics.get("task_count", statistics.get("total_executions", 0)) + 1
-            total_time = statistics.get("total_execution_time", 0.0) + duration_ms
-            avg_time = total_time / task_count if task_count > 0 else 0.0
-            success_count = statistics.get("success_count", 0) + (1 if success else 0)
-            error_count = statistics.get("error_count", 0) + (0 if success else 1)
-            success_rate = (success_count / task_count) * 100.0 if task_count > 0 else 0.0
-
-            # Update in database with normalized structure
-            await agent_instances.update_one(
+            updated = await self.db.agent_instances.find_one_and_update(
                 {"instance_id": instance_id},
-                {"$set": {
-                    # Normalized statistics (same as regular agent_instances)
-                    "statistics.task_count": task_count,
-                    "statistics.total_execution_time": total_time,
-                    "statistics.average_execution_time": round(avg_time, 2),
-                    "statistics.last_task_duration": duration_ms,
-                    "statistics.last_task_completed_at": now.isoformat(),
-                    "statistics.success_count": success_count,
-                    "statistics.error_count": error_count,
-                    "statistics.last_exit_code": 0 if success else 1,
-                    # Councilor-specific (for backwards compatibility)
-                    "statistics.total_executions": task_count,
-                    "statistics.success_rate": round(success_rate, 1),
-                    "statistics.last_execution": now.isoformat(),
-                    # Top-level fields
-                    "last_execution": now.isoformat(),
-                    "updated_at": now.isoformat()
-                }}
+                [
+                    # Seed statistics (support both old 'stats' and new 'statistics')
+                    {"$set": {
+                        "statistics": {"$ifNull": ["$statistics", {"$ifNull": ["$stats", {}]}]}
+                    }},
+                    {"$set": {
+                        # Normalized statistics (same as regular agent_instances)
+                        "statistics.task_count": {"$add": [
+                            {"$ifNull": [
+                                "$statistics.task_count",
+                                {"$ifNull": ["$statistics.total_executions", 0]}
+                            ]},
+                            1
+                        ]},
+                        "statistics.total_execution_time": {"$add": [
+                            {"$ifNull": ["$statistics.total_execution_time", 0.0]}, duration_ms
+                        ]},
+                        "statistics.last_task_duration": duration_ms,
+                        "statistics.last_task_completed_at": now_iso,
+                        "statistics.success_count": {"$add": [
+                            {"$ifNull": ["$statistics.success_count", 0]}, success_inc
+                        ]},
+                        "statistics.error_count": {"$add": [
+                            {"$ifNull": ["$statistics.error_count", 0]}, 1 - success_inc
+                        ]},
+                        "statistics.last_exit_code": 0 if success else 1,
+                        "statistics.last_execution": now_iso,
+                        # Top-level fields
+                        "last_execution": now_iso,
+                        "updated_at": now_iso
+                    }},
+                    {"$set": {
+                        "statistics.average_execution_time": {"$round": [
+                            {"$divide": ["$statistics.total_execution_time", "$statistics.task_count"]}, 2
+                        ]},
+                        # Councilor-specific (for backwards compatibility)
+                        "statistics.total_executions": "$statistics.task_count",
+                        "statistics.success_rate": {"$round": [
+                            {"$multiply": [
+                                {"$divide": ["$statistics.success_count", "$statistics.task_count"]}, 100
+                            ]},
+                            1
+                        ]}
+                    }}
+                ],
+                projection={"_id": 0, "statistics": 1},
+                return_document=ReturnDocument.AFTER
             )
 
-            logger.debug(
-                f"📊 Statistics updated for instance {instance_id}: "
-                f"{task_count} executions, {success_rate:.1f}% success, avg {avg_time:.0f}ms"
-            )
+            if updated is None:
+                logger.warning(f"Instance {instance_id} not found for stats update")
+                return None
+
+            logger.debug(f"📊 Statistics updated for instance {instance_id} (success={success}, {duration_ms}ms)")
+            return updated.get("statistics", {})
 
         except Exception as e:
             logger.warning(f"⚠️ Failed to update statistics for instance {instance_id}: {e}")
+            return None
 
     async def _save_to_conversation(
         self,
@@ -600,6 +701,55 @@ class CouncilorBackendScheduler:
             # Don't fail the execution if saving to conversation fails
             logger.warning(f"⚠️ Failed to save messages to conversation: {e}")
 
+    def _build_trigger(self, schedule: dict):
+        """
+        Build the APScheduler trigger for a councilor schedule
+
+        Args:
+            schedule: Schedule dict with "type" ("interval" or "cron") and "value"
+
+        Returns:
+            Trigger instance, or None if the schedule type is unknown
+        """
+        if schedule["type"] == "interval":
+            return self._parse_interval_trigger(schedule["value"])
+        if schedule["type"] == "cron":
+            return CronTrigger.from_crontab(schedule["value"])
+
+        logger.error(f"❌ Unknown schedule type: {schedule['type']}")
+        return None
+
+    def _build_mesh_context(self, owner: str) -> str:
+        """
+        Build the live MCP mesh topology block appended to councilor prompts
+
+        Args:
+            owner: Human-readable councilor label used in the warning log
+
+        Returns:
+            Mesh context text, or an empty string if no sidecar is active
+        """
+        try:
+            from src.services.mcp_mesh_service import mesh_service
+            active_mesh = mesh_service.get_mesh_topology()
+            if not active_mesh:
+                return ""
+
+            mesh_info = "\n\n=== LIVE MCP SERVICE MESH ===\n"
+            mesh_info += "The following MCP sidecars are currently active and available on the network:\n"
+            for node in active_mesh:
+                port_str = ""
+                try:
+                    # Extract port from URL like http://host.docker.internal:13000/sse
+                    port_str = node.url.split(":")[2].split("/")[0]
+                except:
+                    pass
+                mesh_info += f"- Service: {node.name}" + (f" (Port {port_str})" if port_str else "") + f" | Tools: {node.tools_count}\n"
+            return mesh_info
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to inject MCP Mesh into prompt for {owner}: {e}")
+            return ""
+
     def _parse_interval_trigger(self, value: str) -> IntervalTrigger:
         """
         Convert interval string to APScheduler trigger
@@ -615,21 +765,10 @@ class CouncilorBackendScheduler:
             "1h"  -> IntervalTrigger(hours=1)
             "2d"  -> IntervalTrigger(days=2)
         """
-        match = re.match(r'^(\d+)(m|h|d)$', value)
-        if not match:
-            raise ValueError(f"Invalid interval format: {value}. Expected format: <number><unit> (e.g., 30m, 1h, 2d)")
-
-        num, unit = match.groups()
-        num = int(num)
-
-        if unit == 'm':
-            return IntervalTrigger(minutes=num)
-        elif unit == 'h':
-            return IntervalTrigger(hours=num)
-        elif unit == 'd':
-            return IntervalTrigger(days=num)
-        else:
-            raise ValueError(f"Unknown unit: {unit}")
+        # Parsing is cached; the trigger itself is built fresh because
+        # IntervalTrigger pins its start_date at construction time
+        unit, num = _parse_interval(value)
+        return IntervalTrigger(**{unit: num})
 
     async def _execute_councilor_task(self, agent_id: str, config: dict):
         """
@@ -640,30 +779,37 @@ class CouncilorBackendScheduler:
         Args:
             agent_id: Agent ID of the councilor
             config: Councilor configuration dict
+
+        Returns:
+            Updated agent stats, or None if they could not be updated
         """
         task = config.get("task", {})
         customization = config.get("customization", {})
         display_name = customization.get("display_name", agent_id)
         task_name = task.get("name", "Unknown Task")
 
-        start_time = datetime.utcnow()
+        # One wall-clock read for IDs/timestamps, a monotonic clock for duration
+        start_ns = time.time_ns()
+        start_perf = time.perf_counter_ns()
+        start_time = datetime.fromtimestamp(start_ns / 1e9, tz=UTC)
         # Use milliseconds for unique execution_id to avoid collisions
-        execution_id = f"exec_{agent_id}_{int(start_time.timestamp() * 1000)}"
+        start_ms = start_ns // 1_000_000
+        execution_id = f"exec_{agent_id}_{start_ms}"
+        run_instance_id = f"councilor_{agent_id}_{start_ms}"
 
-        logger.info(f"🔎 Executing councilor task: {display_name} ({agent_id})")
+        # Resolved before the try so the error path can always record it
+        prompt_text = task.get("prompt", "Analyze the project and provide insights")
+
+        logger.info("🔎 Executing councilor task: %s (%s)", display_name, agent_id)
 
         # 🔔 Emit "councilor_started" event via WebSocket
-        try:
-            from src.api.websocket import gamification_manager
-            await gamification_manager.broadcast("councilor_started", {
-                "councilor_id": agent_id,
-                "task_name": task_name,
-                "display_name": display_name,
-                "execution_id": execution_id,
-                "started_at": start_time.isoformat()
-            })
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to broadcast councilor_started event: {e}")
+        await self._safe_broadcast("councilor_started", {
+            "councilor_id": agent_id,
+            "task_name": task_name,
+            "display_name": display_name,
+            "execution_id": execution_id,
+            "started_at": start_time
+        })
 
         try:
             # Execute agent via Conductor API
@@ -672,126 +818,123 @@ class CouncilorBackendScheduler:
             # 2. Insert task into MongoDB tasks collection with the complete prompt
             # 3. Wait for watcher to execute via LLM
             # 4. Return the result
-            prompt_text = task.get("prompt", "Analyze the project and provide insights")
 
             # 🔥 Inject Live MCP Mesh Topology Context
-            try:
-                from src.services.mcp_mesh_service import mesh_service
-                active_mesh = mesh_service.get_mesh_topology()
-                if active_mesh:
-                    mesh_info = "\n\n=== LIVE MCP SERVICE MESH ===\n"
-                    mesh_info += "The following MCP sidecars are currently active and available on the network:\n"
-                    for node in active_mesh:
-                        port_str = ""
-                        try:
-                            # Extract port from URL like http://host.docker.internal:13000/sse
-                            port_str = node.url.split(":")[2].split("/")[0]
-                        except:
-                            pass
-                        mesh_info += f"- Service: {node.name}" + (f" (Port {port_str})" if port_str else "") + f" | Tools: {node.tools_count}\n"
-                    prompt_text += mesh_info
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to inject MCP Mesh into prompt for legacy councilor {agent_id}: {e}")
-
-            logger.info(f"🔍 [COUNCILOR] Calling Conductor API for {agent_id}")
-            logger.info(f"   - Input text: {prompt_text[:100]}...")
-            logger.info(f"   - Conductor will build full prompt with PromptEngine")
+            prompt_text += self._build_mesh_context(f"legacy councilor {agent_id}")
+
+            logger.info("🔍 [COUNCILOR] Calling Conductor API for %s", agent_id)
+            logger.info("   - Input text: %.100s...", prompt_text)
+            logger.info("   - Conductor will build full prompt with PromptEngine")
 
             result = await self.conductor_client.execute_agent(
                 agent_name=agent_id,
                 prompt=prompt_text,  # ← This is just user input, Conductor will build full prompt
-                instance_id=f"councilor_{agent_id}_{int(start_time.timestamp() * 1000)}",
+                instance_id=run_instance_id,
                 context_mode="stateless",
                 timeout=1800
             )
 
-            end_time = datetime.utcnow()
-            duration_ms = int((end_time - start_time).total_seconds() * 1000)
+            end_time = datetime.now(UTC)
+            duration_ms = (time.perf_counter_ns() - start_perf) // 1_000_000
 
             # Analyze severity of the result
             output = result.get("result", "") if isinstance(result, dict) else str(result)
             severity = self._analyze_severity(output)
 
-            logger.info(f"✅ [COUNCILOR] Execution completed for {agent_id}")
-            logger.info(f"   - Severity: {severity}")
-            logger.info(f"   - Duration: {duration_ms}ms")
-            logger.info(f"   - Note: Task already saved in MongoDB by Conductor API with full prompt")
+            logger.info("✅ [COUNCILOR] Execution completed for %s", agent_id)
+            logger.info("   - Severity: %s", severity)
+            logger.info("   - Duration: %sms", duration_ms)
+            logger.info("   - Note: Task already saved in MongoDB by Conductor API with full prompt")
 
             # NOTE: We don't insert to tasks collection here anymore!
             # The Conductor API already inserted the task with the COMPLETE prompt from PromptEngine.
             # Inserting again would create a duplicate with wrong prompt.
 
             # Update agent statistics
-            await self._update_agent_stats(agent_id, severity == "success")
+            stats = await self._update_agent_stats(agent_id, severity == "success")
 
             logger.info(
-                f"✅ Councilor task completed: {display_name} "
-                f"(severity={severity}, duration={duration_ms}ms)"
+                "✅ Councilor task completed: %s (severity=%s, duration=%sms)",
+                display_name, severity, duration_ms
             )
 
             # 🔔 Emit "councilor_completed" event via WebSocket
-            try:
-                from src.api.websocket import gamification_manager
-                await gamification_manager.broadcast("councilor_completed", {
-                    "councilor_id": agent_id,
-                    "task_name": task_name,
-                    "display_name": display_name,
-                    "execution_id": execution_id,
-                    "status": "completed",
-                    "severity": severity,
-                    "started_at": start_time.isoformat(),
-                    "completed_at": end_time.isoformat(),
-                    "duration_ms": duration_ms
-                })
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to broadcast councilor_completed event: {e}")
+            await self._safe_broadcast("councilor_completed", {
+                "councilor_id": agent_id,
+                "task_name": task_name,
+                "display_name": display_name,
+                "execution_id": execution_id,
+                "status": "completed",
+                "severity": severity,
+                "started_at": start_time,
+                "completed_at": end_time,
+                "duration_ms": duration_ms
+            })
 
             # TODO: Send notifications based on config.notifications
 
+            return stats
+
         except Exception as e:
-            logger.error(f"❌ Error executing councilor task {agent_id}: {e}", exc_info=True)
+            # Only pay for traceback formatting when debugging
+            logger.error(
+                "❌ Error executing councilor task %s: %s", agent_id, e,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
 
-            end_time = datetime.utcnow()
+            end_time = datetime.now(UTC)
+            duration_ns = time.perf_counter_ns() - start_perf
 
-            # Save error result to tasks collection
-            await self.tasks_collection.insert_one({
+            # Error result for the tasks collection
+            error_task = {
                 "task_id": execution_id,
                 "agent_id": agent_id,
-                "instance_id": f"councilor_{agent_id}_{int(start_time.timestamp() * 1000)}",
+                "instance_id": run_instance_id,
                 "is_councilor_execution": True,  # Flag to identify councilor tasks
                 "councilor_config": {
                     "task_name": task_name,
                     "display_name": display_name
                 },
-                "prompt": prompt_text,  # ← NOVO: Salva o prompt usado (mesmo em caso de erro)
+                # ← NOVO: Salva o prompt usado (mesmo em caso de erro), limitado em tamanho
+                "prompt": prompt_text[:_ERROR_PROMPT_MAX_CHARS],
+                "prompt_truncated": len(prompt_text) > _ERROR_PROMPT_MAX_CHARS,
                 "status": "error",
                 "severity": "error",
                 "result": None,
                 "error": str(e),
                 "created_at": start_time,
                 "completed_at": end_time,
-                "duration": (end_time - start_time).total_seconds()
-            })
+                "duration": duration_ns / 1e9
+            }
 
-            # Update stats with failure
-            await self._update_agent_stats(agent_id, success=False)
+            # Save error result and update stats with failure (different collections, so
+            # no bulk_write; overlap the two round trips instead)
+            _, stats = await asyncio.gather(
+                self.tasks_collection.insert_one(error_task),
+                self._update_agent_stats(agent_id, success=False)
+            )
 
             # 🔔 Emit "councilor_error" event via WebSocket
-            try:
-                from src.api.websocket import gamification_manager
-                await gamification_manager.broadcast("councilor_error", {
-                    "councilor_id": agent_id,
-                    "task_name": task_name,
-                    "display_name": display_name,
-                    "execution_id": execution_id,
-                    "status": "error",
-                    "severity": "error",
-                    "error": str(e),
-                    "started_at": start_time.isoformat(),
-                    "completed_at": datetime.utcnow().isoformat()
-                })
-            except Exception as broadcast_err:
-                logger.warning(f"⚠️ Failed to broadcast councilor_error event: {broadcast_err}")
+            await self._safe_broadcast("councilor_error", {
+                "councilor_id": agent_id,
+                "task_name": task_name,
+                "display_name": display_name,
+                "execution_id": execution_id,
+                "status": "error",
+                "severity": "error",
+                "error": str(e),
+                "started_at": start_time,
+                "completed_at": end_time
+            })
+
+            return stats
+
+    async def _safe_broadcast(self, event: str, payload: dict) -> None:
+        """Broadcast a WebSocket event; failures are logged, never raised"""
+        try:
+            await gamification_manager.broadcast(event, payload)
+        except Exception as e:
+            logger.warning("⚠️ Failed to broadcast %s event: %s", event, e)
 
     def _analyze_severity(self, output: str) -> str:
         """
@@ -806,71 +949,76 @@ class CouncilorBackendScheduler:
         if not output:
             return "success"
 
-        lower_output = output.lower()
+        # We only scan head+tail; keywords appearing solely in the middle of a
+        # long LLM output are ignored by design
+        if len(output) > self.SEVERITY_HEAD_CHARS + self.SEVERITY_TAIL_CHARS:
+            output = output[:self.SEVERITY_HEAD_CHARS] + "\n" + output[-self.SEVERITY_TAIL_CHARS:]
 
-        # Check for error indicators
-        error_keywords = [
-            'crítico', 'erro', 'falha', 'failed', 'error',
-            'critical', 'fatal', 'exception'
-        ]
-        if any(keyword in lower_output for keyword in error_keywords):
-            return 'error'
-
-        # Check for warning indicators
-        warning_keywords = [
-            'alerta', 'atenção', 'warning', 'aviso',
-            'vulnerab', 'deprecated', 'caution'
-        ]
-        if any(keyword in lower_output for keyword in warning_keywords):
-            return 'warning'
+        # One pass: stop at the first error indicator, remember any warning indicator
+        severity = 'success'
+        for match in _SEVERITY_RE.finditer(output):
+            if match.lastgroup == 'error':
+                return 'error'
+            severity = 'warning'
 
-        return 'success'
+        return severity
 
     async def _update_agent_stats(self, agent_id: str, success: bool):
         """
         Update agent execution statistics
 
+        Maintains an exact stats.success_count counter and derives
+        stats.success_rate from it in a single atomic pipeline update.
+        Agents written before success_count existed are seeded from their
+        previous success_rate.
+
         Args:
             agent_id: Agent ID
             success: Whether execution was successful
+
+        Returns:
+            Updated stats dict, or None if the agent was not updated
         """
         try:
-            agent = await self.agents_collection.find_one({"agent_id": agent_id})
+            success_inc = 1 if success else 0
+            total = {"$ifNull": ["$stats.total_executions", 0]}
 
-            if not agent:
-                logger.warning(f"Agent {agent_id} not found for stats update")
-                return
-
-            stats = agent.get("stats", {
-                "total_executions": 0,
-                "success_rate": 0.0,
-                "last_execution": None
-            })
-
-            # Calculate new statistics
-            total = stats.get("total_executions", 0) + 1
-            old_rate = stats.get("success_rate", 0.0)
-            old_successes = int((old_rate / 100.0) * (total - 1)) if total > 1 else 0
-            new_successes = old_successes + (1 if success else 0)
-            new_rate = (new_successes / total) * 100.0
-
-            # Update in database
-            await self.agents_collection.update_one(
+            updated = await self.agents_collection.find_one_and_update(
                 {"agent_id": agent_id},
-                {"$set": {
-                    "stats.total_executions": total,
-                    "stats.last_execution": datetime.utcnow(),
-                    "stats.success_rate": round(new_rate, 1)
-                }}
+                [
+                    {"$set": {
+                        "stats.total_executions": {"$add": [total, 1]},
+                        "stats.success_count": {"$add": [
+                            {"$ifNull": [
+                                "$stats.success_count",
+                                {"$toInt": {"$round": [{"$multiply": [
+                                    {"$divide": [{"$ifNull": ["$stats.success_rate", 0]}, 100]}, total
+                                ]}, 0]}}
+                            ]},
+                            success_inc
+                        ]},
+                        "stats.last_execution": "$$NOW"
+                    }},
+                    {"$set": {
+                        "stats.success_rate": {"$round": [{"$multiply": [
+                            {"$divide": ["$stats.success_count", "$stats.total_executions"]}, 100
+                        ]}, 1]}
+                    }}
+                ],
+                projection={"_id": 0, "stats": 1},
+                return_document=ReturnDocument.AFTER
             )
 
-            logger.debug(
-                f"📊 Stats updated for {agent_id}: "
-                f"{total} executions, {new_rate:.1f}% success"
-            )
+            if updated is None:
+                logger.warning("Agent %s not found for stats update", agent_id)
+                return None
+
+            logger.debug("📊 Stats updated for %s (success=%s)", agent_id, success)
+            return updated.get("stats", {})
 
         except Exception as e:
-            logger.warning(f"⚠️ Failed to update stats for {agent_id}: {e}")
+            logger.warning("⚠️ Failed to update stats for %s: %s", agent_id, e)
+            return None
 
     async def pause_councilor(self, agent_id: str):
         """
@@ -923,7 +1071,9 @@ class CouncilorBackendScheduler:
         """
         try:
             # Fetch fresh config from database
-            councilor = await self.agents_collection.find_one({"agent_id": agent_id})
+            councilor = await self.agents_collection.find_one(
+                {"agent_id": agent_id}, _AGENT_COUNCILOR_PROJECTION
+            )
 
             if not councilor:
                 logger.warning(f"Councilor {agent_id} not found")
@@ -948,15 +1098,16 @@ class CouncilorBackendScheduler:
         Returns:
             List of job info dictionaries
         """
-        jobs = []
-        for job in self.scheduler.get_jobs():
-            jobs.append({
+        # Pending jobs (scheduler not started yet) have no next_run_time attribute
+        return [
+            {
                 "id": job.id,
                 "name": job.name,
-                "next_run_time": job.next_run_time.isoformat() if job.next_run_time else None,
-                "trigger": str(job.trigger)
-            })
-        return jobs
+                "next_run_time": getattr(job, "next_run_time", None) and job.next_run_time.isoformat(),
+                "trigger": _trigger_summary(job.trigger)
+            }
+            for job in self.scheduler.get_jobs()
+        ]
 
     async def execute_councilor_now(self, agent_id: str, instance_id: str = None) -> dict:
         """
@@ -977,14 +1128,10 @@ class CouncilorBackendScheduler:
                 instance = await self.db.agent_instances.find_one({
                     "instance_id": instance_id,
                     "is_councilor_instance": True
-                })
+                }, _INSTANCE_SCHEDULE_PROJECTION)
                 if instance:
                     logger.info(f"🏛️ [EXECUTE NOW] Found councilor instance: {instance_id}")
-                    await self._execute_councilor_instance_task(instance)
-
-                    # Get updated stats
-                    updated_instance = await self.db.agent_instances.find_one({"instance_id": instance_id})
-                    stats = updated_instance.get("statistics", {}) if updated_instance else {}
+                    stats = await self._execute_councilor_instance_task(instance) or {}
 
                     return {
                         "status": "completed",
@@ -1001,15 +1148,11 @@ class CouncilorBackendScheduler:
                     {"isDeleted": {"$ne": True}},
                     {"isDeleted": {"$exists": False}}
                 ]
-            })
+            }, _INSTANCE_SCHEDULE_PROJECTION)
 
             if instance:
                 logger.info(f"🏛️ [EXECUTE NOW] Found councilor instance by agent_id: {instance.get('instance_id')}")
-                await self._execute_councilor_instance_task(instance)
-
-                # Get updated stats
-                updated_instance = await self.db.agent_instances.find_one({"instance_id": instance.get("instance_id")})
-                stats = updated_instance.get("statistics", {}) if updated_instance else {}
+                stats = await self._execute_councilor_instance_task(instance) or {}
 
                 return {
                     "status": "completed",
@@ -1019,7 +1162,9 @@ class CouncilorBackendScheduler:
                 }
 
             # LEGACY: Fetch councilor from agents collection
-            councilor = await self.agents_collection.find_one({"agent_id": agent_id})
+            councilor = await self.agents_collection.find_one(
+                {"agent_id": agent_id}, _AGENT_COUNCILOR_PROJECTION
+            )
 
             if not councilor:
                 raise ValueError(f"Councilor {agent_id} not found")
@@ -1031,12 +1176,8 @@ class CouncilorBackendScheduler:
             if not config:
                 raise ValueError(f"Councilor {agent_id} has no configuration")
 
-            # Execute the task directly (bypassing scheduler)
-            await self._execute_councilor_task(agent_id, config)
-
-            # Get updated stats
-            updated_agent = await self.agents_collection.find_one({"agent_id": agent_id})
-            stats = updated_agent.get("stats", {}) if updated_agent else {}
+            # Execute the task directly (bypassing scheduler); returns the updated stats
+            stats = await self._execute_councilor_task(agent_id, config) or {}
 
             return {
                 "status": "completed",
@@ -8,11 +8,16 @@ Handles:
 - Generating reports
 """
 
+import asyncio
 import logging
-from datetime import datetime
-from typing import List, Optional
-from bson import ObjectId
-from pymongo.errors import DuplicateKeyError
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from datetime import UTC, datetime
+from typing import Any, List, Optional
+from bson import CodecOptions, ObjectId
+from bson.raw_bson import RawBSONDocument
+from cachetools import TTLCache
+from pymongo import ReturnDocument, WriteConcern
+from pymongo.errors import DuplicateKeyError, OperationFailure
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from ..models.councilor import (
@@ -30,6 +35,73 @@ from ..models.councilor import (
 
 logger = logging.getLogger(__name__)
 
+# Only the stored fields AgentWithCouncilorResponse exposes (keyed by alias, e.g. "_id")
+_AGENT_RESPONSE_PROJECTION = {
+    (field.alias or name): 1 for name, field in AgentWithCouncilorResponse.model_fields.items()
+    if name != "latest_execution"
+}
+# Projected agent docs are small: large batches keep getMore round trips rare on big listings
+_LIST_BATCH_SIZE = 500
+
+# Task -> CouncilorExecutionResponse mapping, done server-side by the find projection:
+# returned documents already have the response fields (missing optional values come back null)
+_EXECUTION_TASK_PROJECTION = {
+    "_id": 0,
+    "execution_id": {"$toString": "$_id"},
+    "councilor_id": "$agent_id",
+    "started_at": {"$ifNull": ["$created_at", None]},
+    "completed_at": {"$ifNull": ["$completed_at", None]},
+    "status": {"$ifNull": ["$status", None]},
+    "severity": {"$ifNull": ["$severity", "success"]},
+    "output": {"$ifNull": ["$result", ""]},
+    "error": {"$cond": [{"$eq": ["$status", "error"]}, {"$ifNull": ["$result", ""]}, None]},
+    "duration_ms": {"$cond": [
+        {"$ifNull": ["$duration", False]}, {"$toInt": {"$multiply": ["$duration", 1000]}}, None
+    ]},
+    "created_at": {"$ifNull": ["$created_at", None]}
+}
+# Same without the (potentially large) output; result still arrives as error for failed executions
+_EXECUTION_SUMMARY_PROJECTION = {**_EXECUTION_TASK_PROJECTION, "output": {"$literal": None}}
+# Latest execution as embedded in list_councilors (same shape, plus the response's _id)
+_LATEST_EXECUTION_PROJECTION = {**_EXECUTION_SUMMARY_PROJECTION, "_id": {"$toString": "$_id"}}
+# Hard ceiling on executions returned per call
+_MAX_EXECUTIONS_LIMIT = 200
+# Partial tasks index used for execution reads (created at app startup, see src/api/app.py):
+# it only covers councilor executions, so it stays small next to the regular agent tasks.
+# agent_id and is_councilor_execution are equality predicates, so sorting on created_at
+# needs no in-memory sort
+_EXECUTION_INDEX_NAME = "councilor_exec_agent_created"
+_EXECUTION_SORT = [("created_at", -1)]
+# Agent fields read by get_councilor_report
+# (display_name is resolved server-side, so the customization subdocument is not transferred)
+_REPORT_AGENT_PROJECTION = {
+    "_id": 0, "is_councilor": 1, "stats": 1,
+    "display_name": {"$ifNull": ["$customization.display_name", "$name"]}
+}
+
+# Short-lived cache of agent_ids known to exist (CouncilorService is created per request,
+# so the cache lives at module level). Only positive answers are cached, so a newly
+# created agent is never reported missing; deletions call invalidate_agent_cache().
+_AGENT_EXISTS_TTL_SECONDS = 5
+_agent_exists_cache = TTLCache(maxsize=1024, ttl=_AGENT_EXISTS_TTL_SECONDS)
+# In-flight lookups, so concurrent checks for the same agent share one query
+_agent_exists_pending: dict = {}
+# In-flight execution queries keyed by (councilor_id, limit, include_output): concurrent
+# identical reads attach to the running query instead of issuing their own (nothing is cached)
+_executions_pending: dict = {}
+
+
+# Read-mostly dashboard responses (councilor list, reports), coalescing polling bursts;
+# cleared whenever a councilor is promoted, demoted or reconfigured
+_RESPONSE_CACHE_TTL_SECONDS = 5
+_response_cache = TTLCache(maxsize=256, ttl=_RESPONSE_CACHE_TTL_SECONDS)
+
+
+def invalidate_agent_cache(agent_id: str):
+    """Forget the cached existence of an agent (call after deleting it)"""
+    _agent_exists_cache.pop(agent_id, None)
+    _response_cache.clear()
+
 
 class CouncilorService:
     """Service for managing councilors"""
@@ -37,59 +109,148 @@ class CouncilorService:
     def __init__(self, db: AsyncIOMotorDatabase):
         self.db = db
         self.agents_collection = db.agents
+        # Stats writes are best-effort telemetry: acknowledged by the primary only (w=1),
+        # never waiting on a stricter deployment default such as w="majority".
+        # Not w=0: _update_agent_stats needs matched_count to choose between the $inc fast
+        # path and the seeding pipeline, and save_execution uses it as its existence check
+        self.stats_collection = self.agents_collection.with_options(write_concern=WriteConcern(w=1))
         self.tasks_collection = db.tasks  # Use tasks instead of councilor_executions
-
-    async def ensure_indexes(self):
-        """Create MongoDB indexes for performance"""
-        try:
-            # Agent indexes
-            await self.agents_collection.create_index("agent_id", unique=True)
-            await self.agents_collection.create_index("is_councilor")
-
-            # Task indexes for councilor executions
-            await self.tasks_collection.create_index([
-                ("agent_id", 1),
-                ("is_councilor_execution", 1),
-                ("created_at", -1)
-            ])
-            await self.tasks_collection.create_index("severity")
-
-            logger.info("✅ Councilor indexes created successfully")
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to create indexes: {e}")
+        # Read-only view of tasks returning undecoded BSON (decoded on first field access)
+        self.raw_tasks_collection = self.tasks_collection.with_options(
+            codec_options=CodecOptions(document_class=RawBSONDocument)
+        )
 
     # ========== Agent Validation ==========
 
-    async def _get_agent(self, agent_id: str) -> dict:
-        """Get agent by agent_id, raise ValueError if not found"""
-        agent = await self.agents_collection.find_one({"agent_id": agent_id})
+    async def _get_agent(self, agent_id: str, projection: dict | None = None) -> dict:
+        """Get agent by agent_id (optionally projected), raise ValueError if not found"""
+        agent = await self.agents_collection.find_one({"agent_id": agent_id}, projection)
         if not agent:
             raise ValueError(f"Agent with agent_id '{agent_id}' not found")
         return agent
 
     async def _agent_exists(self, agent_id: str) -> bool:
-        """Check if agent exists"""
-        count = await self.agents_collection.count_documents({"agent_id": agent_id})
-        return count > 0
+        """Check if agent exists (cached briefly, see _agent_exists_cache)"""
+        if agent_id in _agent_exists_cache:
+            return True
+
+        pending = _agent_exists_pending.get(agent_id)
+        if pending is None:
+            pending = asyncio.ensure_future(self._lookup_agent_exists(agent_id))
+            _agent_exists_pending[agent_id] = pending
+            pending.add_done_callback(lambda _: _agent_exists_pending.pop(agent_id, None))
+
+        return await asyncio.shield(pending)
+
+    async def _lookup_agent_exists(self, agent_id: str) -> bool:
+        """Query agent existence (covered by the unique agent_id index) and cache a hit"""
+        agent = await self.agents_collection.find_one({"agent_id": agent_id}, {"_id": 0, "agent_id": 1})
+        if agent is None:
+            return False
+        _agent_exists_cache[agent_id] = True
+        return True
+
+    async def _cached(self, key: tuple, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Return a cached response for key, building it with factory on a miss (see _response_cache)"""
+        if key in _response_cache:
+            return _response_cache[key]
+        response = await factory()
+        _response_cache[key] = response
+        return response
+
+    async def _update_agent(
+        self,
+        agent_id: str,
+        require_councilor: bool,
+        update,
+        projection: dict = _AGENT_RESPONSE_PROJECTION
+    ) -> dict:
+        """
+        Atomically update an agent whose councilor status matches and return the updated document
+
+        Args:
+            agent_id: Agent ID
+            require_councilor: Whether the agent must currently be a councilor (False: must not be)
+            update: Update document or aggregation pipeline
+            projection: Projection for the returned document (defaults to the response fields)
+
+        Returns:
+            Updated agent document
+
+        Raises:
+            ValueError: If the agent does not exist or has the wrong councilor status
+        """
+        updated = await self.agents_collection.find_one_and_update(
+            {"agent_id": agent_id, "is_councilor": True if require_councilor else {"$ne": True}},
+            update,
+            projection=projection,
+            return_document=ReturnDocument.AFTER
+        )
+        if updated is not None:
+            # Every promote/demote/config/schedule change goes through here
+            _response_cache.clear()
+            return updated
+
+        # No match: a cheap lookup only to pick the right error message
+        if await self.agents_collection.find_one({"agent_id": agent_id}, {"_id": 1}) is None:
+            raise ValueError(f"Agent with agent_id '{agent_id}' not found")
+        if require_councilor:
+            raise ValueError(f"Agent '{agent_id}' is not a councilor")
+        raise ValueError(f"Agent '{agent_id}' is already a councilor")
 
     # ========== List Operations ==========
 
+    async def iter_agents(self, query: dict) -> AsyncIterator[AgentWithCouncilorResponse]:
+        """
+        Stream agents matching query as response models, one cursor batch at a time
+
+        Args:
+            query: MongoDB filter for the agents collection
+
+        Yields:
+            AgentWithCouncilorResponse for each matching agent
+        """
+        cursor = self.agents_collection.find(query, _AGENT_RESPONSE_PROJECTION).batch_size(_LIST_BATCH_SIZE)
+        async for agent in cursor:
+            yield self._agent_to_response(agent)
+
     async def list_councilors(self) -> AgentListResponse:
-        """List all agents that are councilors"""
-        try:
-            cursor = self.agents_collection.find({"is_councilor": True})
-            agents = await cursor.to_list(length=None)
+        """List all agents that are councilors (cached briefly, see _response_cache)"""
+        return await self._cached(("councilors",), self._list_councilors)
 
-            councilors = []
-            for agent in agents:
-                councilors.append(self._agent_to_response(agent))
+    async def _list_councilors(self) -> AgentListResponse:
+        try:
+            # One aggregation attaches each councilor's latest execution instead of one query
+            # per councilor (let + $expr equality so the sub-pipeline can still use the
+            # partial execution index, without needing MongoDB 5.0's localField + pipeline form)
+            cursor = self.agents_collection.aggregate([
+                {"$match": {"is_councilor": True}},
+                {"$project": _AGENT_RESPONSE_PROJECTION},
+                {"$lookup": {
+                    "from": self.tasks_collection.name,
+                    "let": {"agent_id": "$agent_id"},
+                    "pipeline": [
+                        {"$match": {
+                            "is_councilor_execution": True,
+                            "$expr": {"$eq": ["$agent_id", "$$agent_id"]}
+                        }},
+                        {"$sort": {"created_at": -1}},
+                        {"$limit": 1},
+                        {"$project": _LATEST_EXECUTION_PROJECTION}
+                    ],
+                    "as": "latest_execution"
+                }},
+                {"$set": {"latest_execution": {"$first": "$latest_execution"}}}
+            ]).batch_size(_LIST_BATCH_SIZE)
+
+            councilors = [self._agent_to_response(agent) async for agent in cursor]
 
             return AgentListResponse(
                 agents=councilors,
                 count=len(councilors)
             )
         except Exception as e:
-            logger.error(f"❌ Error listing councilors: {e}")
+            logger.error("❌ Error listing councilors: %s", e)
             raise
 
     async def list_all_agents(self, is_councilor: Optional[bool] = None) -> AgentListResponse:
@@ -99,19 +260,14 @@ class CouncilorService:
             if is_councilor is not None:
                 query["is_councilor"] = is_councilor
 
-            cursor = self.agents_collection.find(query)
-            agents = await cursor.to_list(length=None)
-
-            agent_responses = []
-            for agent in agents:
-                agent_responses.append(self._agent_to_response(agent))
+            agent_responses = [agent async for agent in self.iter_agents(query)]
 
             return AgentListResponse(
                 agents=agent_responses,
                 count=len(agent_responses)
             )
         except Exception as e:
-            logger.error(f"❌ Error listing agents: {e}")
+            logger.error("❌ Error listing agents: %s", e)
             raise
 
     # ========== Promote/Demote Operations ==========
@@ -123,94 +279,69 @@ class CouncilorService:
     ) -> AgentWithCouncilorResponse:
         """Promote an agent to councilor"""
         try:
-            # Validate agent exists
-            agent = await self._get_agent(agent_id)
-
-            # Check if already a councilor
-            if agent.get("is_councilor"):
-                raise ValueError(f"Agent '{agent_id}' is already a councilor")
-
-            # Prepare update data
+            # Prepare update data (one model_dump for the whole request)
+            dumped = request.model_dump()
             update_data = {
                 "is_councilor": True,
-                "councilor_config": request.councilor_config.model_dump(),
-                "updated_at": datetime.utcnow()
+                "councilor_config": dumped["councilor_config"]
             }
 
             # Add customization if provided
-            if request.customization:
-                update_data["customization"] = request.customization.model_dump()
-
-            # Initialize stats if not exists
-            if "stats" not in agent:
-                update_data["stats"] = {
-                    "total_executions": 0,
-                    "last_execution": None,
-                    "success_rate": 0.0
+            if dumped["customization"]:
+                update_data["customization"] = dumped["customization"]
+
+            # Single atomic update (pipeline form so stats are only initialized when missing);
+            # user-provided values are wrapped in $literal so "$..." strings are not field paths.
+            # Timestamps come from the server clock ($$NOW; $currentDate is not allowed in pipelines)
+            updated_agent = await self._update_agent(agent_id, False, [{
+                "$set": {
+                    **{field: {"$literal": value} for field, value in update_data.items()},
+                    "updated_at": "$$NOW",
+                    "stats": {"$ifNull": ["$stats", {"$literal": {
+                        "total_executions": 0,
+                        "success_count": 0,
+                        "last_execution": None,
+                        "success_rate": 0.0
+                    }}]}
                 }
+            }])
 
-            # Update agent in database
-            result = await self.agents_collection.update_one(
-                {"agent_id": agent_id},
-                {"$set": update_data}
-            )
-
-            if result.modified_count == 0:
-                raise ValueError("Failed to update agent")
-
-            # Get updated agent
-            updated_agent = await self._get_agent(agent_id)
-
-            logger.info(f"✅ Agent '{agent_id}' promoted to councilor")
+            logger.info("✅ Agent '%s' promoted to councilor", agent_id)
 
             return self._agent_to_response(updated_agent)
 
         except ValueError as e:
-            logger.warning(f"⚠️ Validation error promoting agent: {e}")
+            logger.warning("⚠️ Validation error promoting agent: %s", e)
             raise
         except Exception as e:
-            logger.error(f"❌ Error promoting agent to councilor: {e}")
+            logger.error("❌ Error promoting agent to councilor: %s", e)
             raise
 
     async def demote_councilor(self, agent_id: str) -> AgentWithCouncilorResponse:
         """Remove councilor status from an agent"""
         try:
-            # Validate agent exists
-            agent = await self._get_agent(agent_id)
-
-            # Check if is councilor
-            if not agent.get("is_councilor"):
-                raise ValueError(f"Agent '{agent_id}' is not a councilor")
-
-            # Update agent in database
-            result = await self.agents_collection.update_one(
-                {"agent_id": agent_id},
-                {
-                    "$set": {
-                        "is_councilor": False,
-                        "updated_at": datetime.utcnow()
-                    },
-                    "$unset": {
-                        "councilor_config": ""
-                    }
+            # Update agent in database (filter enforces current councilor status)
+            updated_agent = await self._update_agent(agent_id, True, {
+                "$set": {
+                    "is_councilor": False
+                },
+                "$unset": {
+                    "councilor_config": ""
+                },
+                "$currentDate": {
+                    "updated_at": True
                 }
-            )
-
-            if result.modified_count == 0:
-                raise ValueError("Failed to update agent")
-
-            # Get updated agent
-            updated_agent = await self._get_agent(agent_id)
+            })
 
-            logger.info(f"✅ Agent '{agent_id}' demoted from councilor")
+            logger.info("✅ Agent '%s' demoted from councilor", agent_id)
 
             return self._agent_to_response(updated_agent)
 
         except ValueError as e:
-            logger.warning(f"⚠️ Validation error demoting councilor: {e}")
+            logger.warning("⚠️ Validation error demoting councilor: %s", e)
             raise
         except Exception as e:
-            logger.error(f"❌ Error demoting councilor: {e}")
+            logger.error("❌ Error demoting councilor: %s", e)
             raise
 
     # ========== Configuration Updates ==========
@@ -222,44 +353,32 @@ class CouncilorService:
     ) -> AgentWithCouncilorResponse:
         """Update councilor configuration"""
         try:
-            # Validate agent exists and is councilor
-            agent = await self._get_agent(agent_id)
-            if not agent.get("is_councilor"):
-                raise ValueError(f"Agent '{agent_id}' is not a councilor")
-
-            # Build update data (only update provided fields)
-            update_data = {"updated_at": datetime.utcnow()}
-
-            if request.schedule is not None:
-                update_data["councilor_config.schedule"] = request.schedule.model_dump()
-
-            if request.task is not None:
-                update_data["councilor_config.task"] = request.task.model_dump()
-
-            if request.notifications is not None:
-                update_data["councilor_config.notifications"] = request.notifications.model_dump()
-
-            # Update agent
-            result = await self.agents_collection.update_one(
-                {"agent_id": agent_id},
-                {"$set": update_data}
-            )
+            # Build update data (only update provided fields; one model_dump for the whole request)
+            update_data = {
+                f"councilor_config.{field}": value
+                for field, value in request.model_dump().items()
+                if value is not None
+            }
 
-            if result.modified_count == 0:
-                raise ValueError("No changes made to configuration")
+            # Empty patch: fail before touching MongoDB
+            if not update_data:
+                raise ValueError("No fields provided to update")
 
-            # Get updated agent
-            updated_agent = await self._get_agent(agent_id)
+            # Update agent (filter enforces current councilor status; updated_at from the server clock)
+            updated_agent = await self._update_agent(agent_id, True, {
+                "$set": update_data,
+                "$currentDate": {"updated_at": True}
+            })
 
-            logger.info(f"✅ Councilor config updated for '{agent_id}'")
+            logger.info("✅ Councilor config updated for '%s'", agent_id)
 
             return self._agent_to_response(updated_agent)
 
         except ValueError as e:
-            logger.warning(f"⚠️ Validation error updating config: {e}")
+            logger.warning("⚠️ Validation error updating config: %s", e)
             raise
         except Exception as e:
-            logger.error(f"❌ Error updating councilor config: {e}")
+            logger.error("❌ Error updating councilor config: %s", e)
             raise
 
     async def update_schedule(
@@ -269,30 +388,23 @@ class CouncilorService:
     ) -> dict:
         """Pause or resume councilor schedule"""
         try:
-            # Validate agent exists and is councilor
-            agent = await self._get_agent(agent_id)
-            if not agent.get("is_councilor"):
-                raise ValueError(f"Agent '{agent_id}' is not a councilor")
-
-            # Update schedule enabled status
-            result = await self.agents_collection.update_one(
-                {"agent_id": agent_id},
+            # Update schedule enabled status (filter enforces current councilor status)
+            updated_agent = await self._update_agent(
+                agent_id,
+                True,
                 {
                     "$set": {
-                        "councilor_config.schedule.enabled": request.enabled,
-                        "updated_at": datetime.utcnow()
+                        "councilor_config.schedule.enabled": request.enabled
+                    },
+                    "$currentDate": {
+                        "updated_at": True
                     }
-                }
+                },
+                projection={"_id": 0, "councilor_config.schedule": 1}
             )
-
-            if result.modified_count == 0:
-                raise ValueError("Failed to update schedule")
-
-            # Get updated agent
-            updated_agent = await self._get_agent(agent_id)
             schedule = updated_agent["councilor_config"]["schedule"]
 
-            logger.info(f"✅ Schedule {'enabled' if request.enabled else 'paused'} for '{agent_id}'")
+            logger.info("✅ Schedule %s for '%s'", "enabled" if request.enabled else "paused", agent_id)
 
             return {
                 "type": schedule["type"],
@@ -301,10 +413,10 @@ class CouncilorService:
             }
 
         except ValueError as e:
-            logger.warning(f"⚠️ Validation error updating schedule: {e}")
+            logger.warning("⚠️ Validation error updating schedule: %s", e)
             raise
         except Exception as e:
-            logger.error(f"❌ Error updating schedule: {e}")
+            logger.error("❌ Error updating schedule: %s", e)
             raise
 
     # ========== Execution Management ==========
@@ -320,17 +432,15 @@ class CouncilorService:
         logger.warning("⚠️ save_execution is deprecated. Councilor executions are now saved in tasks collection during agent execution.")
 
         try:
-            # Validate councilor exists
-            if not await self._agent_exists(execution.councilor_id):
-                raise ValueError(f"Councilor '{execution.councilor_id}' not found")
-
-            # Update agent stats
-            await self._update_agent_stats(
+            # Update agent stats; the update's match result doubles as the existence check
+            matched = await self._update_agent_stats(
                 execution.councilor_id,
                 execution.severity == "success"
             )
+            if matched is False:
+                raise ValueError(f"Councilor '{execution.councilor_id}' not found")
 
-            logger.info(f"✅ Stats updated for councilor execution: {execution.execution_id}")
+            logger.info("✅ Stats updated for councilor execution: %s", execution.execution_id)
 
             # Return a mock response (dados já estão em tasks)
             return CouncilorExecutionResponse(
@@ -344,109 +454,138 @@ class CouncilorService:
                 output=execution.output,
                 error=execution.error,
                 duration_ms=execution.duration_ms,
-                created_at=datetime.utcnow()
+                created_at=datetime.now(UTC)
             )
 
         except ValueError as e:
-            logger.warning(f"⚠️ Validation error saving execution: {e}")
+            logger.warning("⚠️ Validation error saving execution: %s", e)
             raise
         except Exception as e:
-            logger.error(f"❌ Error saving execution: {e}")
+            logger.error("❌ Error saving execution: %s", e)
             raise
 
     async def get_executions(
         self,
         councilor_id: str,
-        limit: int = 10
+        limit: int = 10,
+        include_output: bool = False
     ) -> ExecutionListResponse:
-        """Get recent executions for a councilor from tasks collection"""
+        """
+        Get recent executions for a councilor from tasks collection
+
+        Args:
+            councilor_id: Agent ID of the councilor
+            limit: Number of executions (clamped to 1.._MAX_EXECUTIONS_LIMIT)
+            include_output: Whether to fetch and return each execution's output
+
+        Returns:
+            ExecutionListResponse, newest first
+        """
         try:
-            # Validate councilor exists
-            if not await self._agent_exists(councilor_id):
-                raise ValueError(f"Councilor '{councilor_id}' not found")
+            response = await self._get_executions_unchecked(councilor_id, limit, include_output)
 
-            # Query executions from tasks collection
-            cursor = self.tasks_collection.find({
-                "agent_id": councilor_id,
-                "is_councilor_execution": True
-            }).sort("created_at", -1).limit(limit)
-
-            tasks = await cursor.to_list(length=limit)
-
-            execution_responses = []
-            for task in tasks:
-                # Map task fields to execution format
-                exec_doc = {
-                    "_id": str(task["_id"]),
-                    "execution_id": str(task["_id"]),
-                    "councilor_id": task["agent_id"],
-                    "started_at": task.get("created_at"),
-                    "completed_at": task.get("completed_at"),
-                    "status": task.get("status"),
-                    "severity": task.get("severity", "success"),
-                    "output": task.get("result", ""),
-                    "error": task.get("result", "") if task.get("status") == "error" else None,
-                    "duration_ms": int(task.get("duration", 0) * 1000) if task.get("duration") else None,
-                    "created_at": task.get("created_at")
-                }
-                execution_responses.append(CouncilorExecutionResponse(**exec_doc))
+            # Executions imply the councilor exists: only an empty result needs the lookup
+            if not response.executions and not await self._agent_exists(councilor_id):
+                raise ValueError(f"Councilor '{councilor_id}' not found")
 
-            return ExecutionListResponse(
-                executions=execution_responses,
-                count=len(execution_responses)
-            )
+            return response
 
         except ValueError as e:
-            logger.warning(f"⚠️ Validation error getting executions: {e}")
+            logger.warning("⚠️ Validation error getting executions: %s", e)
             raise
         except Exception as e:
-            logger.error(f"❌ Error getting executions: {e}")
+            logger.error("❌ Error getting executions: %s", e)
             raise
 
+    async def _get_executions_unchecked(
+        self,
+        councilor_id: str,
+        limit: int,
+        include_output: bool
+    ) -> ExecutionListResponse:
+        """Query recent executions without validating the councilor (callers do that)"""
+        limit = min(max(limit, 1), _MAX_EXECUTIONS_LIMIT)
+        key = (councilor_id, limit, include_output)
+
+        pending = _executions_pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._query_executions(councilor_id, limit, include_output))
+            _executions_pending[key] = pending
+            pending.add_done_callback(lambda _: _executions_pending.pop(key, None))
+
+        return await asyncio.shield(pending)
+
+    @staticmethod
+    async def _with_execution_hint(read: Callable[[str | None], Awaitable[Any]]) -> Any:
+        """
+        Run an execution read hinted to the partial execution index
+
+        If the index does not exist (fresh database, failed index build) the server
+        rejects the hint; the read is then retried without it and left to the planner.
+        """
+        try:
+            return await read(_EXECUTION_INDEX_NAME)
+        except OperationFailure as e:
+            if "hint" not in str(e).lower():
+                raise
+            logger.warning("⚠️ Execution index %s unavailable, reading without hint: %s", _EXECUTION_INDEX_NAME, e)
+            return await read(None)
+
+    async def _query_executions(
+        self,
+        councilor_id: str,
+        limit: int,
+        include_output: bool
+    ) -> ExecutionListResponse:
+        """Run the recent-executions query (limit already clamped)"""
+        projection = _EXECUTION_TASK_PROJECTION if include_output else _EXECUTION_SUMMARY_PROJECTION
+
+        tasks = await self._with_execution_hint(
+            lambda hint: self.raw_tasks_collection.find({
+                "agent_id": councilor_id,
+                "is_councilor_execution": True
+            }, projection).sort(_EXECUTION_SORT).hint(hint).limit(limit).to_list(length=limit)
+        )
+
+        execution_responses = [self._task_to_execution(task) for task in tasks]
+
+        return ExecutionListResponse(
+            executions=execution_responses,
+            count=len(execution_responses)
+        )
+
     async def get_latest_execution(
         self,
         councilor_id: str
     ) -> Optional[CouncilorExecutionResponse]:
         """Get latest execution for a councilor from tasks collection"""
         try:
-            # Validate councilor exists
-            if not await self._agent_exists(councilor_id):
-                raise ValueError(f"Councilor '{councilor_id}' not found")
-
             # Query latest execution from tasks
-            task = await self.tasks_collection.find_one(
-                {
-                    "agent_id": councilor_id,
-                    "is_councilor_execution": True
-                },
-                sort=[("created_at", -1)]
+            task = await self._with_execution_hint(
+                lambda hint: self.raw_tasks_collection.find_one(
+                    {
+                        "agent_id": councilor_id,
+                        "is_councilor_execution": True
+                    },
+                    _EXECUTION_TASK_PROJECTION,
+                    sort=_EXECUTION_SORT,
+                    hint=hint
+                )
             )
 
             if not task:
+                # No execution yet: tell a missing councilor apart from an idle one
+                if not await self._agent_exists(councilor_id):
+                    raise ValueError(f"Councilor '{councilor_id}' not found")
                 return None
 
-            # Map task to execution format
-            exec_doc = {
-                "_id": str(task["_id"]),
-                "execution_id": str(task["_id"]),
-                "councilor_id": task["agent_id"],
-                "started_at": task.get("created_at"),
-                "completed_at": task.get("completed_at"),
-                "status": task.get("status"),
-                "severity": task.get("severity", "success"),
-                "output": task.get("result", ""),
-                "error": task.get("result", "") if task.get("status") == "error" else None,
-                "duration_ms": int(task.get("duration", 0) * 1000) if task.get("duration") else None,
-                "created_at": task.get("created_at")
-            }
-
-            return CouncilorExecutionResponse(**exec_doc)
+            return self._task_to_execution(task)
 
         except ValueError as e:
-            logger.warning(f"⚠️ Validation error getting latest execution: {e}")
+            logger.warning("⚠️ Validation error getting latest execution: %s", e)
             raise
         except Exception as e:
-            logger.error(f"❌ Error getting latest execution: {e}")
+            logger.error("❌ Error getting latest execution: %s", e)
             raise
 
     # ========== Reports ==========
@@ -454,27 +593,38 @@ class CouncilorService:
     async def get_councilor_report(
         self,
         agent_id: str,
-        limit: int = 10
+        limit: int = 10,
+        include_output: bool = True
+    ) -> CouncilorReportResponse:
+        """Get comprehensive report for a councilor (recent executions capped like get_executions)"""
+        return await self._cached(
+            ("report", agent_id, limit, include_output),
+            lambda: self._build_councilor_report(agent_id, limit, include_output)
+        )
+
+    async def _build_councilor_report(
+        self,
+        agent_id: str,
+        limit: int,
+        include_output: bool
     ) -> CouncilorReportResponse:
-        """Get comprehensive report for a councilor"""
         try:
-            # Get agent
-            agent = await self._get_agent(agent_id)
+            # Get agent and recent executions concurrently (_get_agent validates existence)
+            agent, executions_response = await asyncio.gather(
+                self._get_agent(agent_id, _REPORT_AGENT_PROJECTION),
+                self._get_executions_unchecked(agent_id, limit, include_output)
+            )
             if not agent.get("is_councilor"):
                 raise ValueError(f"Agent '{agent_id}' is not a councilor")
 
-            # Get recent executions
-            executions_response = await self.get_executions(agent_id, limit)
-
             # Get stats
-            stats = agent.get("stats", {
+            stats = self._derive_success_rate(agent.get("stats")) or {
                 "total_executions": 0,
                 "success_rate": 0.0
-            })
+            }
 
             # Get councilor name
-            customization = agent.get("customization", {})
-            councilor_name = customization.get("display_name", agent.get("name", agent_id))
+            councilor_name = agent.get("display_name") or agent_id
 
             # Calculate next execution (TODO: implement based on schedule)
             next_execution = None  # Would need scheduler logic
@@ -489,71 +639,118 @@ class CouncilorService:
             )
 
         except ValueError as e:
-            logger.warning(f"⚠️ Validation error getting report: {e}")
+            logger.warning("⚠️ Validation error getting report: %s", e)
             raise
         except Exception as e:
-            logger.error(f"❌ Error getting councilor report: {e}")
+            logger.error("❌ Error getting councilor report: %s", e)
             raise
 
     # ========== Helper Methods ==========
 
     async def _update_agent_stats(self, agent_id: str, success: bool):
-        """Update agent execution statistics based on tasks collection"""
-        try:
-            # Calculate stats from tasks collection
-            total = await self.tasks_collection.count_documents({
-                "agent_id": agent_id,
-                "is_councilor_execution": True,
-                "status": {"$in": ["completed", "error"]}
-            })
-
-            if total == 0:
-                logger.debug(f"📊 No completed executions for '{agent_id}'")
-                return
+        """
+        Update agent execution statistics
 
-            # Count successes (severity = success)
-            successes = await self.tasks_collection.count_documents({
-                "agent_id": agent_id,
-                "is_councilor_execution": True,
-                "severity": "success"
-            })
+        Increments the stats.total_executions / stats.success_count counters with
+        no preceding read. The steady state is a plain $inc (success_rate is then
+        derived on read, see _derive_success_rate); only agents without a
+        success_count yet go through the seeding pipeline, which initializes it
+        from their previous success_rate (same schema as the scheduler).
 
-            # Calculate success rate
-            success_rate = round((successes / total) * 100, 1) if total > 0 else 0.0
+        Returns:
+            True if the agent was updated, False if no agent matched,
+            None if the update itself failed
+        """
+        try:
+            success_inc = 1 if success else 0
 
-            # Get last execution time
-            last_task = await self.tasks_collection.find_one(
-                {"agent_id": agent_id, "is_councilor_execution": True},
-                sort=[("created_at", -1)]
+            result = await self.stats_collection.update_one(
+                {"agent_id": agent_id, "stats.success_count": {"$exists": True}},
+                {
+                    "$inc": {"stats.total_executions": 1, "stats.success_count": success_inc},
+                    "$currentDate": {"stats.last_execution": True}
+                }
             )
+            if result.matched_count:
+                logger.debug("📊 Stats updated for '%s' (success=%s)", agent_id, success)
+                return True
 
-            last_execution = last_task.get("created_at") if last_task else None
-
-            # Update agent stats
-            await self.agents_collection.update_one(
+            # First counted execution (or unknown agent): seed the counters server-side
+            result = await self.stats_collection.update_one(
                 {"agent_id": agent_id},
-                {
-                    "$set": {
-                        "stats.total_executions": total,
-                        "stats.last_execution": last_execution,
-                        "stats.success_rate": success_rate
-                    }
-                }
+                self._stats_seeding_pipeline(1, success_inc)
             )
 
-            logger.debug(f"📊 Stats updated for '{agent_id}': {total} executions, {success_rate:.1f}% success")
+            if result.matched_count == 0:
+                logger.debug("📊 No agent '%s' to update stats for", agent_id)
+                return False
+
+            logger.debug("📊 Stats updated for '%s' (success=%s)", agent_id, success)
+            return True
 
         except Exception as e:
-            logger.warning(f"⚠️ Failed to update stats for '{agent_id}': {e}")
+            logger.warning("⚠️ Failed to update stats for '%s': %s", agent_id, e)
+            return None
+
+    @staticmethod
+    def _stats_seeding_pipeline(executions: int, successes: int) -> list:
+        """
+        Pipeline update adding executions/successes to an agent's stats counters
+
+        Works whether or not stats.success_count exists yet (it is seeded from
+        the previous success_rate), and stores the resulting success_rate.
+        """
+        total = {"$ifNull": ["$stats.total_executions", 0]}
+        return [
+            {"$set": {
+                "stats.total_executions": {"$add": [total, executions]},
+                "stats.success_count": {"$add": [
+                    {"$ifNull": [
+                        "$stats.success_count",
+                        {"$toInt": {"$round": [{"$multiply": [
+                            {"$divide": [{"$ifNull": ["$stats.success_rate", 0]}, 100]}, total
+                        ]}, 0]}}
+                    ]},
+                    successes
+                ]},
+                "stats.last_execution": "$$NOW"
+            }},
+            {"$set": {
+                "stats.success_rate": {"$round": [{"$multiply": [
+                    {"$divide": ["$stats.success_count", "$stats.total_executions"]}, 100
+                ]}, 1]}
+            }}
+        ]
+
+    @staticmethod
+    def _derive_success_rate(stats: dict | None) -> dict | None:
+        """Recompute stats.success_rate from the counters (the $inc path does not store it)"""
+        if stats and stats.get("total_executions") and "success_count" in stats:
+            stats["success_rate"] = round(stats["success_count"] / stats["total_executions"] * 100, 1)
+        return stats
+
+    def _task_to_execution(self, task: Mapping) -> CouncilorExecutionResponse:
+        """
+        Wrap a task document shaped by _EXECUTION_TASK_PROJECTION (dict or RawBSONDocument)
+
+        Built with model_construct: the projection already produced every
+        response field as a flat value, so Pydantic validation is skipped.
+        """
+        return CouncilorExecutionResponse.model_construct(_id=task["execution_id"], **task)
 
     def _agent_to_response(self, agent: dict) -> AgentWithCouncilorResponse:
-        """Convert MongoDB agent document to response model"""
+        """
+        Convert MongoDB agent document to response model (the document is modified in place)
+
+        Unlike _task_to_execution this keeps full validation: the nested
+        councilor_config/customization/stats dicts must become models.
+        """
         # Convert ObjectId to string
-        agent_copy = dict(agent)
-        agent_copy["_id"] = str(agent_copy["_id"])
+        agent["_id"] = str(agent["_id"])
 
         # Ensure required fields exist
-        if "is_councilor" not in agent_copy:
-            agent_copy["is_councilor"] = False
+        agent.setdefault("is_councilor", False)
+        self._derive_success_rate(agent.get("stats"))
 
-        return AgentWithCouncilorResponse(**agent_copy)
+        # model_validate takes the document as-is (no **kwargs copy)
+        return AgentWithCouncilorResponse.model_validate(agent)
@@ -6,14 +6,24 @@ pings their health endpoints, and maintains an internal cache of the live topolo
 """
 
 import asyncio
+import contextlib
 import logging
+from collections.abc import Iterable
 from typing import Dict, List, Optional
 import httpx
+import orjson
 from datetime import datetime
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# Max probes in flight at once (bounds sockets and connect backlog while most ports are closed)
+_PROBE_CONCURRENCY = 20
+# TCP connect budget (seconds) before a port is considered closed and skipped
+_TCP_PREFLIGHT_TIMEOUT = 0.25
+# Scan cycles (30s each) between full port-range scans; other cycles only re-probe live ports
+_FULL_SCAN_EVERY = 10
+
 class MeshNode(BaseModel):
     name: str
     url: str
@@ -28,10 +38,17 @@ class MCPMeshService:
 
     def __init__(self):
         self._mesh_cache: Dict[str, MeshNode] = {}
+        # JSON-ready form of the cache, serialized once per scan instead of per API request
+        self._mesh_cache_dict: list[dict] = []
         self._is_running = False
         self._scan_task: Optional[asyncio.Task] = None
+        # Probe client kept across scans so live sidecars are probed over warm keep-alive connections
+        self._client: httpx.AsyncClient | None = None
         # Ports to scan based on Primoia architecture (13000 to 13099)
         self._port_range = range(13000, 13100)
+        # Ports that answered the last scan, re-probed every cycle (full range every _FULL_SCAN_EVERY)
+        self._live_ports: set[int] = set()
+        self._full_scan_counter = 0
         # Using host.docker.internal for local docker discovery, could be configurable
         self._host = "host.docker.internal" 
 
@@ -41,6 +58,7 @@ class MCPMeshService:
             return
         
         self._is_running = True
+        self._get_client()
         self._scan_task = asyncio.create_task(self._scan_loop())
         logger.info("📡 MCP Mesh Service started background scanner")
 
@@ -53,43 +71,94 @@ class MCPMeshService:
                 await self._scan_task
             except asyncio.CancelledError:
                 pass
+        if self._client:
+            await self._client.aclose()
+            self._client = None
         logger.info("🛑 MCP Mesh Service stopped background scanner")
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Returns the long-lived probe client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=3.0,
+                limits=httpx.Limits(
+                    max_connections=_PROBE_CONCURRENCY,
+                    max_keepalive_connections=_PROBE_CONCURRENCY,
+                    keepalive_expiry=60.0
+                ),
+                transport=httpx.AsyncHTTPTransport(retries=0)
+            )
+        return self._client
+
     async def _scan_loop(self):
         """Infinite loop for periodic scanning."""
         while self._is_running:
             try:
-                await self._refresh_mesh()
+                full_scan = self._full_scan_counter % _FULL_SCAN_EVERY == 0
+                self._full_scan_counter += 1
+                await self._refresh_mesh(None if full_scan else self._live_ports)
             except Exception as e:
                 logger.error(f"Error in MCP Mesh scan loop: {e}", exc_info=True)
             
             # Wait 30 seconds before next scan
             await asyncio.sleep(30)
 
-    async def _refresh_mesh(self):
-        """Performs a full scan of the expected sidecar ports and updates cache."""
-        logger.debug("Starting MCP Mesh topology scan...")
+    async def _refresh_mesh(self, ports: Iterable[int] | None = None):
+        """
+        Scans sidecar ports and updates cache.
+
+        Args:
+            ports: Ports to probe (defaults to the full port range). The cache is
+                replaced by the nodes found, so known nodes that stop answering drop out.
+        """
+        ports = self._port_range if ports is None else list(ports)
+        logger.debug(f"Starting MCP Mesh topology scan of {len(ports)} ports...")
         live_nodes = {}
+        live_ports = set()
         
         # In a real distributed mesh, we might query Docker API or Kubernetes,
         # but for this specific "Dual Facade" architecture, probing known ports is robust.
-        # To avoid blocking, we gather all requests concurrently
-        tasks = []
-        async with httpx.AsyncClient(timeout=3.0) as client:
-            for port in self._port_range:
+        # Probes run concurrently in a TaskGroup, at most _PROBE_CONCURRENCY at a time, and
+        # record their result as they complete; cancelling the scan (stop_background_scan)
+        # cancels every in-flight probe. A raw TCP connect screens out closed ports
+        # (the vast majority) before paying for an HTTP request; known-live ports skip it
+        # and reuse their keep-alive connection
+        semaphore = asyncio.Semaphore(_PROBE_CONCURRENCY)
+        known_live = self._live_ports
+
+        async def bounded_probe(client: httpx.AsyncClient, port: int):
+            async with semaphore:
+                if port not in known_live and not await self._tcp_open(self._host, port):
+                    return
                 # We probe the health endpoint of the sidecar
-                url = f"http://{self._host}:{port}/health"
-                tasks.append(self._probe_node(client, port, url))
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for result in results:
-                if isinstance(result, MeshNode):
-                    live_nodes[result.name] = result
+                result = await self._probe_node(client, port, f"http://{self._host}:{port}/health")
+            if isinstance(result, MeshNode):
+                live_nodes[result.name] = result
+                live_ports.add(port)
+
+        client = self._get_client()
+        async with asyncio.TaskGroup() as group:
+            for port in ports:
+                group.create_task(bounded_probe(client, port))
 
         self._mesh_cache = live_nodes
+        self._mesh_cache_dict = [node.model_dump(mode="json") for node in live_nodes.values()]
+        self._live_ports = live_ports
         logger.info(f"🕸️ MCP Mesh scanned: Found {len(self._mesh_cache)} live sidecars.")
 
+    @staticmethod
+    async def _tcp_open(host: str, port: int) -> bool:
+        """Checks whether a TCP connection to the port can be opened quickly."""
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), _TCP_PREFLIGHT_TIMEOUT)
+        except (OSError, TimeoutError):
+            return False
+        writer.close()
+        # Wait for the transport to close (bounded, errors on close don't change the result)
+        with contextlib.suppress(OSError, TimeoutError):
+            await asyncio.wait_for(writer.wait_closed(), _TCP_PREFLIGHT_TIMEOUT)
+        return True
+
     async def _probe_node(self, client: httpx.AsyncClient, port: int, url: str) -> Optional[MeshNode]:
         """Probes a specific port to see if an MCP Sidecar responds."""
         try:
@@ -99,7 +168,7 @@ class MCPMeshService:
             # If we get a response, it's a sidecar
             if response.status_code == 200:
                 latency_ms = (asyncio.get_event_loop().time() - start_time) * 1000
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 # We derive name from the sidecar's response or use port as fallback
                 name = data.get("name", f"sidecar-{port}")
@@ -126,7 +195,7 @@ class MCPMeshService:
     
     def get_mesh_topology_as_dict(self) -> List[dict]:
         """Returns the current snapshot as dictionaries for API responses."""
-        return [node.model_dump() for node in self._mesh_cache.values()]
+        return list(self._mesh_cache_dict)
 
 # Global singleton instance
 mesh_service = MCPMeshService()
@@ -6,18 +6,21 @@ Combines internal MCPs (defined in code) with external MCPs (self-registered sid
 """
 
 import asyncio
+import contextlib
 import logging
 from datetime import datetime, timedelta
 from typing import Optional
 
 import httpx
-from pymongo.collection import Collection
-from pymongo.database import Database
+from cachetools import TTLCache
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pydantic import TypeAdapter
+from pymongo import IndexModel, ReturnDocument, UpdateOne
+from pymongo.errors import OperationFailure
 
 from src.models.mcp_registry import (
     MCPType,
     MCPStatus,
-    MCPMetadata,
     MCPRegisterRequest,
     MCPRegistryEntry,
     MCPRegistryEntryResponse,
@@ -32,87 +35,202 @@ logger = logging.getLogger(__name__)
 # TTL for considering an MCP unhealthy (no heartbeat in this period)
 HEARTBEAT_TTL_SECONDS = 90  # 3 missed heartbeats at 30s interval
 
+# How often the background monitor marks silent external MCPs unhealthy
+STALE_CHECK_INTERVAL_SECONDS = 30
+
+# External MCPs without a heartbeat for this long are removed by MongoDB's TTL monitor
+STALE_ENTRY_MAX_AGE_HOURS = 24
+
+# resolve_names lookups are cached this long (registry writes through this service clear them earlier)
+NAME_CACHE_TTL_SECONDS = 5
+
+# Maximum number of health probes check_health_many runs at once
+HEALTH_CHECK_CONCURRENCY = 16
+
+# get_mcp_config results are cached this long (writes through this service and, on replica
+# sets, change-stream events on the collections it reads clear the cache earlier)
+MCP_CONFIG_CACHE_TTL_SECONDS = 10
+
+# Agent/instance fields an MCP config is built from (update paths such as "mcp_configs.0"
+# or a whole "definition" replacement included, but not e.g. "definition.name")
+_CONFIG_FIELD_PATTERN = r"^(agent_id|mcp_configs|definition\.mcp_configs)(\.|$)|^definition$"
+
+# Paths set or removed by an update event
+_CHANGED_FIELD_PATHS = {"$concatArrays": [
+    {"$map": {
+        "input": {"$objectToArray": {"$ifNull": ["$updateDescription.updatedFields", {}]}},
+        "in": "$$this.k"
+    }},
+    {"$ifNull": ["$updateDescription.removedFields", []]}
+]}
+
+# Changes that can alter a cached MCP config: any registry write, but only agent/instance
+# updates touching the fields above (stats and status updates on every execution are skipped)
+_CONFIG_CHANGE_PIPELINE = [{"$match": {"$or": [
+    {
+        "ns.coll": "mcp_registry",
+        "operationType": {"$in": ["insert", "update", "replace", "delete"]}
+    },
+    {
+        "ns.coll": {"$in": ["agents", "agent_instances"]},
+        "operationType": {"$in": ["insert", "replace", "delete"]}
+    },
+    {
+        "ns.coll": {"$in": ["agents", "agent_instances"]},
+        "operationType": "update",
+        "$expr": {"$gt": [{"$size": {"$filter": {
+            "input": _CHANGED_FIELD_PATHS,
+            "cond": {"$regexMatch": {"input": "$$this", "regex": _CONFIG_FIELD_PATTERN}}
+        }}}, 0]}
+    }
+]}}]
+
+# An agent template's MCP names: definition.mcp_configs, or top-level mcp_configs when that is empty
+_AGENT_MCP_NAMES = {"$let": {
+    "vars": {"definition_mcps": {"$ifNull": ["$definition.mcp_configs", []]}},
+    "in": {"$cond": [
+        {"$gt": [{"$size": "$$definition_mcps"}, 0]},
+        "$$definition_mcps",
+        {"$ifNull": ["$mcp_configs", []]}
+    ]}
+}}
+
+# Registry fields read to build an MCPRegistryEntryResponse (auth and host_url stay server-side),
+# shaped so the documents validate as-is: a missing status reads as unknown and the empty
+# metadata of MCPs registered without it as absent
+_ENTRY_RESPONSE_PROJECTION = {
+    "_id": 0, "name": 1, "type": 1, "url": 1, "backend_url": 1,
+    "status": {"$ifNull": ["$status", MCPStatus.UNKNOWN.value]},
+    "tools_count": 1, "last_heartbeat": 1, "registered_at": 1,
+    "metadata": {"$cond": [{"$eq": ["$metadata", {"$literal": {}}]}, "$$REMOVE", "$metadata"]}
+}
+
+# Validates a whole list_all result in one call
+_ENTRY_LIST_ADAPTER = TypeAdapter(list[MCPRegistryEntryResponse])
+
+# Documents per batch when listing the registry (fewer getMore round-trips)
+_LIST_BATCH_SIZE = 256
+
+# Single-field indexes superseded by the compound ones in _ensure_indexes
+_LEGACY_INDEXES = ("type_1", "status_1", "last_heartbeat_1", "metadata.category_1")
+
+# get_stats totals, counted server-side in one $group (any non-internal type counts as external)
+_STATS_GROUP = {
+    "_id": None,
+    "total": {"$sum": 1},
+    "internal": {"$sum": {"$cond": [{"$eq": ["$type", MCPType.INTERNAL.value]}, 1, 0]}},
+    "external": {"$sum": {"$cond": [{"$eq": ["$type", MCPType.INTERNAL.value]}, 0, 1]}},
+    **{
+        status.value: {"$sum": {"$cond": [{"$eq": [{"$ifNull": ["$status", MCPStatus.UNKNOWN.value]}, status.value]}, 1, 0]}}
+        for status in (MCPStatus.HEALTHY, MCPStatus.UNHEALTHY, MCPStatus.UNKNOWN)
+    }
+}
+
+# Registry fields needed to build an MCPServerConfig
+_SERVER_CONFIG_PROJECTION = {"_id": 0, "name": 1, "url": 1, "host_url": 1, "auth": 1}
+
 
 class MCPRegistryService:
     """Service class for managing the MCP Registry."""
 
     COLLECTION_NAME = "mcp_registry"
 
-    def __init__(self, db: Database):
+    def __init__(self, db: AsyncIOMotorDatabase):
         """
         Initialize the service with a MongoDB database.
 
         Args:
-            db: PyMongo database instance
+            db: Motor database instance
         """
         self.db = db
-        self.collection: Collection = db[self.COLLECTION_NAME]
+        self.collection: AsyncIOMotorCollection = db[self.COLLECTION_NAME]
+        self._stale_monitor_task: asyncio.Task | None = None
+        self._config_cache = TTLCache(maxsize=1024, ttl=MCP_CONFIG_CACHE_TTL_SECONDS)
+        # name -> URL of the available entry (None when missing or unhealthy), for resolve_names
+        self._name_cache = TTLCache(maxsize=1024, ttl=NAME_CACHE_TTL_SECONDS)
+        self._config_watch_task: asyncio.Task | None = None
+        self._http: httpx.AsyncClient | None = None
         self._ensure_indexes()
         self._sync_internal_mcps()
 
     def _ensure_indexes(self):
-        """Create necessary indexes for the mcp_registry collection."""
-        try:
-            # Unique index on name
-            self.collection.create_index("name", unique=True)
-            logger.info("Created unique index on mcp_registry.name")
-
-            # Index on type for filtering
-            self.collection.create_index("type")
-            logger.info("Created index on mcp_registry.type")
-
-            # Index on status for filtering
-            self.collection.create_index("status")
-            logger.info("Created index on mcp_registry.status")
+        """
+        Create necessary indexes for the mcp_registry collection.
 
-            # Index on last_heartbeat for TTL queries
-            self.collection.create_index("last_heartbeat")
-            logger.info("Created index on mcp_registry.last_heartbeat")
+        Runs once while the service is built, through the synchronous PyMongo
+        collection underneath Motor (as does _sync_internal_mcps).
+        """
+        collection = self.collection.delegate
+        # Drop the single-field indexes the compound ones replace (first: the TTL index
+        # below shares the last_heartbeat key and cannot coexist with the plain one)
+        for index_name in _LEGACY_INDEXES:
+            try:
+                collection.drop_index(index_name)
+                logger.info(f"Dropped superseded index mcp_registry.{index_name}")
+            except Exception:
+                pass  # Index doesn't exist, that's fine
 
-            # Compound index for category queries
-            self.collection.create_index("metadata.category")
-            logger.info("Created index on mcp_registry.metadata.category")
+        try:
+            # Compound indexes follow the query shapes (equality fields first, then range):
+            # resolve by name, list by type/status or category/type, stale checks by type + heartbeat age
+            collection.create_indexes([
+                IndexModel("name", unique=True),
+                IndexModel([("type", 1), ("status", 1)]),
+                IndexModel([("metadata.category", 1), ("type", 1)]),
+                IndexModel([("type", 1), ("last_heartbeat", 1)]),
+                # MongoDB removes external MCPs that stopped sending heartbeats
+                IndexModel(
+                    "last_heartbeat",
+                    name="external_heartbeat_ttl",
+                    expireAfterSeconds=STALE_ENTRY_MAX_AGE_HOURS * 3600,
+                    partialFilterExpression={"type": MCPType.EXTERNAL.value}
+                )
+            ])
+            logger.info("Created indexes on mcp_registry")
 
         except Exception as e:
             logger.warning(f"Index creation warning (may already exist): {e}")
 
     def _sync_internal_mcps(self):
         """Sync internal MCPs from MCP_REGISTRY to MongoDB."""
+        collection = self.collection.delegate
+        now = datetime.utcnow()
         try:
-            for name, config in MCP_REGISTRY.items():
-                port = config.get("port", 5000)
-                description = config.get("description", "")
-
-                entry = {
-                    "name": name,
-                    "type": MCPType.INTERNAL.value,
-                    "url": f"http://localhost:{port}/sse",
-                    "backend_url": config.get("target_url"),
-                    "status": MCPStatus.UNKNOWN.value,
-                    "tools_count": 0,
-                    "last_heartbeat": None,
-                    "registered_at": datetime.utcnow(),
-                    "metadata": {
-                        "category": "core",
-                        "description": description,
-                        "tags": ["internal", "core"]
-                    }
-                }
-
-                # Upsert - update if exists, insert if not
-                self.collection.update_one(
+            # Upsert - update if exists, insert if not (registered_at is only set on insert:
+            # the same path in $set and $setOnInsert is rejected as a conflict)
+            ops = [
+                UpdateOne(
                     {"name": name},
-                    {"$set": entry, "$setOnInsert": {"registered_at": datetime.utcnow()}},
+                    {
+                        "$set": {
+                            "name": name,
+                            "type": MCPType.INTERNAL.value,
+                            "url": f"http://localhost:{config.get('port', 5000)}/sse",
+                            "backend_url": config.get("target_url"),
+                            "status": MCPStatus.UNKNOWN.value,
+                            "tools_count": 0,
+                            "last_heartbeat": None,
+                            "metadata": {
+                                "category": "core",
+                                "description": config.get("description", ""),
+                                "tags": ["internal", "core"]
+                            }
+                        },
+                        "$setOnInsert": {"registered_at": now}
+                    },
                     upsert=True
                 )
-                logger.debug(f"Synced internal MCP: {name}")
+                for name, config in MCP_REGISTRY.items()
+            ]
+            if ops:
+                collection.bulk_write(ops, ordered=False)
 
             logger.info(f"Synced {len(MCP_REGISTRY)} internal MCPs to registry")
 
         except Exception as e:
             logger.error(f"Failed to sync internal MCPs: {e}", exc_info=True)
 
-    def register(self, request: MCPRegisterRequest) -> MCPRegistryEntry:
+    async def register(self, request: MCPRegisterRequest) -> MCPRegistryEntry:
         """
         Register a new external MCP server.
 
@@ -126,7 +244,7 @@ class MCPRegistryService:
             ValueError: If MCP with same name already exists as internal
         """
         # Check if this is an internal MCP (cannot be overwritten)
-        existing = self.collection.find_one({"name": request.name})
+        existing = await self.collection.find_one({"name": request.name})
         if existing and existing.get("type") == MCPType.INTERNAL.value:
             raise ValueError(f"Cannot register '{request.name}': name reserved for internal MCP")
 
@@ -146,16 +264,18 @@ class MCPRegistryService:
         }
 
         # Upsert - allows re-registration (e.g., after restart)
-        self.collection.update_one(
+        await self.collection.update_one(
             {"name": request.name},
             {"$set": entry},
             upsert=True
         )
+        self._config_cache.clear()
+        self._name_cache.pop(request.name, None)
 
         logger.info(f"Registered external MCP: {request.name} at {request.url}")
         return MCPRegistryEntry(**entry)
 
-    def unregister(self, name: str) -> bool:
+    async def unregister(self, name: str) -> bool:
         """
         Unregister an MCP server.
 
@@ -168,21 +288,23 @@ class MCPRegistryService:
         Raises:
             ValueError: If trying to unregister an internal MCP
         """
-        existing = self.collection.find_one({"name": name})
+        existing = await self.collection.find_one({"name": name})
         if not existing:
             return False
 
         if existing.get("type") == MCPType.INTERNAL.value:
             raise ValueError(f"Cannot unregister '{name}': internal MCPs cannot be removed")
 
-        result = self.collection.delete_one({"name": name})
+        result = await self.collection.delete_one({"name": name})
         if result.deleted_count > 0:
+            self._config_cache.clear()
+            self._name_cache.pop(name, None)
             logger.info(f"Unregistered MCP: {name}")
             return True
 
         return False
 
-    def heartbeat(self, name: str, tools_count: Optional[int] = None) -> bool:
+    async def heartbeat(self, name: str, tools_count: int | None = None) -> bool:
         """
         Update heartbeat for an MCP server.
 
@@ -200,14 +322,22 @@ class MCPRegistryService:
         if tools_count is not None:
             update["tools_count"] = tools_count
 
-        result = self.collection.update_one(
+        # The previous status tells whether this heartbeat revived the MCP (cached configs skip it)
+        previous = await self.collection.find_one_and_update(
             {"name": name},
-            {"$set": update}
+            {"$set": update},
+            projection={"_id": 0, "status": 1},
+            return_document=ReturnDocument.BEFORE
         )
+        if previous is None:
+            return False
 
-        return result.modified_count > 0 or result.matched_count > 0
+        if previous.get("status") != MCPStatus.HEALTHY.value:
+            self._config_cache.clear()
+            self._name_cache.pop(name, None)
+        return True
 
-    def get_by_name(self, name: str) -> Optional[MCPRegistryEntryResponse]:
+    async def get_by_name(self, name: str) -> MCPRegistryEntryResponse | None:
         """
         Get a single MCP entry by name.
 
@@ -217,26 +347,13 @@ class MCPRegistryService:
         Returns:
             MCP entry or None if not found
         """
-        doc = self.collection.find_one({"name": name})
+        doc = await self.collection.find_one({"name": name}, _ENTRY_RESPONSE_PROJECTION)
         if not doc:
             return None
 
-        # Check if status should be updated based on heartbeat TTL
-        doc = self._check_heartbeat_status(doc)
-
-        return MCPRegistryEntryResponse(
-            name=doc["name"],
-            type=MCPType(doc["type"]),
-            url=doc["url"],
-            backend_url=doc.get("backend_url"),
-            status=MCPStatus(doc.get("status", "unknown")),
-            tools_count=doc.get("tools_count", 0),
-            last_heartbeat=doc.get("last_heartbeat"),
-            registered_at=doc.get("registered_at"),
-            metadata=MCPMetadata(**doc.get("metadata", {})) if doc.get("metadata") else None
-        )
+        return MCPRegistryEntryResponse.model_validate(doc)
 
-    def list_all(
+    async def list_all(
         self,
         type_filter: Optional[MCPType] = None,
         category_filter: Optional[str] = None,
@@ -268,57 +385,102 @@ class MCPRegistryService:
         elif healthy_only:
             query["status"] = MCPStatus.HEALTHY.value
 
-        cursor = self.collection.find(query).sort("name", 1)
-        results = []
-
-        for doc in cursor:
-            doc = self._check_heartbeat_status(doc)
-            results.append(MCPRegistryEntryResponse(
-                name=doc["name"],
-                type=MCPType(doc["type"]),
-                url=doc["url"],
-                backend_url=doc.get("backend_url"),
-                status=MCPStatus(doc.get("status", "unknown")),
-                tools_count=doc.get("tools_count", 0),
-                last_heartbeat=doc.get("last_heartbeat"),
-                registered_at=doc.get("registered_at"),
-                metadata=MCPMetadata(**doc.get("metadata", {})) if doc.get("metadata") else None
-            ))
-
-        return results
+        cursor = self.collection.find(query, _ENTRY_RESPONSE_PROJECTION).sort("name", 1).batch_size(_LIST_BATCH_SIZE)
+        return _ENTRY_LIST_ADAPTER.validate_python(await cursor.to_list(None))
 
-    def _check_heartbeat_status(self, doc: dict) -> dict:
+    async def mark_stale_unhealthy(self) -> int:
         """
-        Check if MCP should be marked unhealthy based on heartbeat TTL.
-
-        Args:
-            doc: MongoDB document
+        Mark external MCPs without a recent heartbeat as unhealthy, in one update.
 
         Returns:
-            Updated document (may update status in DB)
+            Number of MCPs marked unhealthy
         """
-        if doc.get("type") == MCPType.INTERNAL.value:
-            # Internal MCPs don't use heartbeat, they're always considered available
-            return doc
+        threshold = datetime.utcnow() - timedelta(seconds=HEARTBEAT_TTL_SECONDS)
 
-        last_heartbeat = doc.get("last_heartbeat")
-        if not last_heartbeat:
-            return doc
+        result = await self.collection.update_many(
+            {
+                "type": MCPType.EXTERNAL.value,
+                "status": MCPStatus.HEALTHY.value,
+                "last_heartbeat": {"$lt": threshold}
+            },
+            {"$set": {"status": MCPStatus.UNHEALTHY.value}}
+        )
 
-        ttl_threshold = datetime.utcnow() - timedelta(seconds=HEARTBEAT_TTL_SECONDS)
+        if result.modified_count > 0:
+            self._config_cache.clear()
+            self._name_cache.clear()
+            logger.warning(f"Marked {result.modified_count} MCPs unhealthy (no heartbeat since {threshold})")
 
-        if last_heartbeat < ttl_threshold and doc.get("status") == MCPStatus.HEALTHY.value:
-            # Mark as unhealthy
-            self.collection.update_one(
-                {"name": doc["name"]},
-                {"$set": {"status": MCPStatus.UNHEALTHY.value}}
-            )
-            doc["status"] = MCPStatus.UNHEALTHY.value
-            logger.warning(f"MCP '{doc['name']}' marked unhealthy (no heartbeat since {last_heartbeat})")
+        return result.modified_count
+
+    async def start_stale_monitor(self):
+        """Starts the background task that periodically runs mark_stale_unhealthy."""
+        if self._stale_monitor_task is not None:
+            return
+
+        self._stale_monitor_task = asyncio.create_task(self._stale_monitor_loop())
+        logger.info("MCP Registry stale-heartbeat monitor started")
+
+    async def stop_stale_monitor(self):
+        """Stops the stale-heartbeat monitor task."""
+        if self._stale_monitor_task is None:
+            return
+
+        self._stale_monitor_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._stale_monitor_task
+        self._stale_monitor_task = None
+        logger.info("MCP Registry stale-heartbeat monitor stopped")
+
+    async def _stale_monitor_loop(self):
+        """Infinite loop marking stale MCPs every STALE_CHECK_INTERVAL_SECONDS."""
+        while True:
+            try:
+                await self.mark_stale_unhealthy()
+            except Exception as e:
+                logger.error(f"Error in MCP Registry stale-heartbeat monitor: {e}", exc_info=True)
+
+            await asyncio.sleep(STALE_CHECK_INTERVAL_SECONDS)
+
+    async def start_config_watch(self):
+        """Starts watching the collections behind get_mcp_config to invalidate its cache."""
+        if self._config_watch_task is not None:
+            return
+
+        self._config_watch_task = asyncio.create_task(self._watch_config_changes())
 
-        return doc
+    async def stop_config_watch(self):
+        """Stops the change-stream watcher."""
+        if self._config_watch_task is None:
+            return
 
-    def resolve_names(self, names: list[str]) -> tuple[dict[str, str], list[str]]:
+        self._config_watch_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._config_watch_task
+        self._config_watch_task = None
+
+    async def _watch_config_changes(self):
+        """
+        Clear the MCP config cache on every relevant change-stream event.
+
+        Change streams need a replica set; on a standalone server this returns
+        and the cache relies on its TTL.
+        """
+        try:
+            async with self.db.watch(_CONFIG_CHANGE_PIPELINE) as stream:
+                logger.info("MCP config cache invalidation via change streams started")
+                async for _ in stream:
+                    self._config_cache.clear()
+                    self._name_cache.clear()
+        except OperationFailure as e:
+            logger.info(
+                f"Change streams unavailable ({e}); MCP config cache relies on its "
+                f"{MCP_CONFIG_CACHE_TTL_SECONDS}s TTL"
+            )
+        except Exception as e:
+            logger.error(f"MCP config change-stream watcher failed: {e}", exc_info=True)
+
+    async def resolve_names(self, names: list[str]) -> tuple[dict[str, str], list[str]]:
         """
         Resolve a list of MCP names to their URLs.
 
@@ -327,19 +489,46 @@ class MCPRegistryService:
 
         Returns:
             Tuple of (resolved dict, not_found list)
+            (lookups are cached for NAME_CACHE_TTL_SECONDS)
         """
-        resolved = {}
-        not_found = []
-
+        urls = {}
+        missing = []
         for name in names:
-            doc = self.collection.find_one({"name": name})
-            if doc and doc.get("status") != MCPStatus.UNHEALTHY.value:
-                resolved[name] = doc["url"]
-            else:
-                not_found.append(name)
+            try:
+                urls[name] = self._name_cache[name]
+            except KeyError:
+                missing.append(name)
+
+        if missing:
+            found = {
+                doc["name"]: doc["url"]
+                async for doc in self._find_available(missing, {"_id": 0, "name": 1, "url": 1})
+            }
+            for name in missing:
+                urls[name] = self._name_cache[name] = found.get(name)
+
+        # Keep the caller's order
+        resolved = {name: urls[name] for name in names if urls[name]}
+        not_found = [name for name in names if not urls[name]]
 
         return resolved, not_found
 
+    def _find_available(self, names, projection: dict):
+        """
+        Fetch the non-unhealthy registry entries for a set of names in one query.
+
+        Args:
+            names: MCP names to look up
+            projection: Fields to return
+
+        Returns:
+            Cursor over the matching entries
+        """
+        return self.collection.find(
+            {"name": {"$in": list(names)}, "status": {"$ne": MCPStatus.UNHEALTHY.value}},
+            projection
+        )
+
     async def check_health(self, name: str, timeout: float = 5.0) -> MCPHealthResponse:
         """
         Actively check health of an MCP server.
@@ -351,115 +540,186 @@ class MCPRegistryService:
         Returns:
             Health check response
         """
-        entry = self.get_by_name(name)
+        entry = await self.get_by_name(name)
         if not entry:
-            return MCPHealthResponse(
-                name=name,
-                status=MCPStatus.UNKNOWN,
-                error="MCP not found in registry"
-            )
+            return self._not_found_health(name)
+
+        health, update = await self._probe_health(entry, timeout)
+        if update:
+            await self._apply_health_updates([(entry, update)])
+        return health
+
+    async def check_health_many(self, names: list[str], timeout: float = 5.0) -> list[MCPHealthResponse]:
+        """
+        Actively check health of several MCP servers concurrently.
+
+        Entries are read with one query, probed in parallel (at most
+        HEALTH_CHECK_CONCURRENCY at a time) and their status changes are
+        written back with a single bulk_write.
+
+        Args:
+            names: Names of the MCPs to check
+            timeout: Request timeout in seconds (per MCP)
 
+        Returns:
+            Health check responses, in the order of names
+        """
+        cursor = self.collection.find({"name": {"$in": list(names)}}, _ENTRY_RESPONSE_PROJECTION)
+        entries = [MCPRegistryEntryResponse.model_validate(doc) async for doc in cursor]
+        health = {result.name: result for result in await self._probe_entries(entries, timeout)}
+
+        return [health.get(name) or self._not_found_health(name) for name in names]
+
+    async def sweep_health(self, timeout: float = 5.0) -> list[MCPHealthResponse]:
+        """
+        Actively check health of every external MCP server.
+
+        Same batching as check_health_many: one read, parallel probes and a
+        single bulk_write of the resulting statuses.
+
+        Args:
+            timeout: Request timeout in seconds (per MCP)
+
+        Returns:
+            Health check responses, one per external MCP
+        """
+        cursor = self.collection.find(
+            {"type": MCPType.EXTERNAL.value}, _ENTRY_RESPONSE_PROJECTION
+        ).batch_size(_LIST_BATCH_SIZE)
+        entries = _ENTRY_LIST_ADAPTER.validate_python(await cursor.to_list(None))
+
+        return await self._probe_entries(entries, timeout)
+
+    async def _probe_entries(
+        self,
+        entries: list[MCPRegistryEntryResponse],
+        timeout: float
+    ) -> list[MCPHealthResponse]:
+        """Probe entries concurrently (at most HEALTH_CHECK_CONCURRENCY at a time) and write back their statuses."""
+        semaphore = asyncio.Semaphore(HEALTH_CHECK_CONCURRENCY)
+
+        async def bounded_probe(entry: MCPRegistryEntryResponse):
+            async with semaphore:
+                return await self._probe_health(entry, timeout)
+
+        results = await asyncio.gather(*(bounded_probe(entry) for entry in entries))
+
+        await self._apply_health_updates([
+            (entry, update) for entry, (_, update) in zip(entries, results, strict=True) if update
+        ])
+        return [health for health, _ in results]
+
+    @staticmethod
+    def _not_found_health(name: str) -> MCPHealthResponse:
+        """Health response for a name missing from the registry."""
+        return MCPHealthResponse(
+            name=name,
+            status=MCPStatus.UNKNOWN,
+            error="MCP not found in registry"
+        )
+
+    async def _probe_health(
+        self,
+        entry: MCPRegistryEntryResponse,
+        timeout: float
+    ) -> tuple[MCPHealthResponse, dict | None]:
+        """
+        Probe an MCP's health endpoint.
+
+        Returns:
+            The health response and the registry fields to $set for it
+            (None when the registry should be left as is)
+        """
         try:
             start = asyncio.get_event_loop().time()
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                # Try to connect to SSE endpoint
-                response = await client.get(entry.url.replace("/sse", "/health"))
-
-                latency_ms = (asyncio.get_event_loop().time() - start) * 1000
-
-                if response.status_code == 200:
-                    # Update status in registry
-                    self.collection.update_one(
-                        {"name": name},
-                        {"$set": {
-                            "status": MCPStatus.HEALTHY.value,
-                            "last_heartbeat": datetime.utcnow()
-                        }}
-                    )
-                    return MCPHealthResponse(
-                        name=name,
-                        status=MCPStatus.HEALTHY,
-                        latency_ms=round(latency_ms, 2),
-                        tools_count=entry.tools_count,
-                        last_heartbeat=datetime.utcnow()
-                    )
-                else:
-                    return MCPHealthResponse(
-                        name=name,
-                        status=MCPStatus.UNHEALTHY,
-                        latency_ms=round(latency_ms, 2),
-                        error=f"HTTP {response.status_code}"
-                    )
+            # GET rather than HEAD: sidecar /health routes are typically GET-only and answer HEAD with 405
+            response = await self._get_http_client().get(entry.url.replace("/sse", "/health"), timeout=timeout)
+
+            latency_ms = (asyncio.get_event_loop().time() - start) * 1000
+
+            if response.is_success:
+                now = datetime.utcnow()
+                return MCPHealthResponse(
+                    name=entry.name,
+                    status=MCPStatus.HEALTHY,
+                    latency_ms=round(latency_ms, 2),
+                    tools_count=entry.tools_count,
+                    last_heartbeat=now
+                ), {"status": MCPStatus.HEALTHY.value, "last_heartbeat": now}
+            else:
+                return MCPHealthResponse(
+                    name=entry.name,
+                    status=MCPStatus.UNHEALTHY,
+                    latency_ms=round(latency_ms, 2),
+                    error=f"HTTP {response.status_code}"
+                ), None
 
         except httpx.TimeoutException:
-            self._mark_unhealthy(name)
             return MCPHealthResponse(
-                name=name,
+                name=entry.name,
                 status=MCPStatus.UNHEALTHY,
                 error="Connection timeout"
-            )
+            ), {"status": MCPStatus.UNHEALTHY.value}
         except Exception as e:
-            self._mark_unhealthy(name)
             return MCPHealthResponse(
-                name=name,
+                name=entry.name,
                 status=MCPStatus.UNHEALTHY,
                 error=str(e)
-            )
+            ), {"status": MCPStatus.UNHEALTHY.value}
 
-    def _mark_unhealthy(self, name: str):
-        """Mark an MCP as unhealthy."""
-        self.collection.update_one(
-            {"name": name},
-            {"$set": {"status": MCPStatus.UNHEALTHY.value}}
+    async def _apply_health_updates(self, updates: list[tuple[MCPRegistryEntryResponse, dict]]):
+        """Write probed statuses back to the registry in one bulk_write."""
+        if not updates:
+            return
+
+        await self.collection.bulk_write(
+            [UpdateOne({"name": entry.name}, {"$set": update}) for entry, update in updates],
+            ordered=False
         )
+        # A status change alters which MCPs cached configs and name lookups include
+        changed = [entry.name for entry, update in updates if entry.status.value != update["status"]]
+        if changed:
+            self._config_cache.clear()
+            for name in changed:
+                self._name_cache.pop(name, None)
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Returns the long-lived health-check client, creating it on first use."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=5.0,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+            )
+        return self._http
 
-    def get_stats(self) -> dict:
+    async def close(self):
+        """Closes the health-check HTTP client."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def get_stats(self) -> dict:
         """
         Get registry statistics.
 
         Returns:
             Dict with counts by type and status
         """
-        pipeline = [
-            {
-                "$group": {
-                    "_id": {"type": "$type", "status": "$status"},
-                    "count": {"$sum": 1}
-                }
-            }
-        ]
-
-        results = list(self.collection.aggregate(pipeline))
-
-        stats = {
-            "total": 0,
-            "internal": 0,
-            "external": 0,
-            "healthy": 0,
-            "unhealthy": 0,
-            "unknown": 0
-        }
-
-        for r in results:
-            count = r["count"]
-            stats["total"] += count
-
-            if r["_id"]["type"] == MCPType.INTERNAL.value:
-                stats["internal"] += count
-            else:
-                stats["external"] += count
-
-            status = r["_id"].get("status", "unknown")
-            if status in stats:
-                stats[status] += count
+        results = await self.collection.aggregate([{"$group": _STATS_GROUP}]).to_list(1)
 
+        stats = {key: 0 for key in _STATS_GROUP if key != "_id"}
+        if results:
+            stats.update({key: results[0][key] for key in stats})
         return stats
 
-    def cleanup_stale_entries(self, max_age_hours: int = 24) -> int:
+    async def cleanup_stale_entries(self, max_age_hours: int = STALE_ENTRY_MAX_AGE_HOURS) -> int:
         """
         Remove external MCP entries that haven't sent heartbeat in a long time.
 
+        Entries older than STALE_ENTRY_MAX_AGE_HOURS are already expired by the
+        TTL index; this is for on-demand cleanup with a shorter age.
+
         Args:
             max_age_hours: Maximum age in hours since last heartbeat
 
@@ -468,17 +728,19 @@ class MCPRegistryService:
         """
         threshold = datetime.utcnow() - timedelta(hours=max_age_hours)
 
-        result = self.collection.delete_many({
+        result = await self.collection.delete_many({
             "type": MCPType.EXTERNAL.value,
             "last_heartbeat": {"$lt": threshold}
         })
 
         if result.deleted_count > 0:
+            self._config_cache.clear()
+            self._name_cache.clear()
             logger.info(f"Cleaned up {result.deleted_count} stale MCP entries")
 
         return result.deleted_count
 
-    def get_mcp_config(
+    async def get_mcp_config(
         self,
         instance_id: Optional[str] = None,
         agent_id: Optional[str] = None
@@ -496,46 +758,44 @@ class MCPRegistryService:
 
         Returns:
             MCPConfigResponse with mcpServers dict ready for Claude CLI
+            (cached for MCP_CONFIG_CACHE_TTL_SECONDS)
         """
-        mcp_names: set[str] = set()
-
-        # Get agents and instances collections
-        agents_collection = self.db["agents"]
-        instances_collection = self.db["agent_instances"]
-
-        # 1. If instance_id provided, get instance and its agent
+        key = (instance_id, agent_id)
+        config = self._config_cache.get(key)
+        if config is None:
+            config = await self._build_mcp_config(instance_id, agent_id)
+            self._config_cache[key] = config
+        return config
+
+    async def _build_mcp_config(self, instance_id: str | None, agent_id: str | None) -> MCPConfigResponse:
+        """Build the MCP config for get_mcp_config from the database."""
+        # One aggregation gathers the MCP names (instance extras + agent template) and joins
+        # the registry entries for them; it starts from the instance when one is given
+        results = []
         if instance_id:
-            instance = instances_collection.find_one({"instance_id": instance_id})
-            if instance:
-                # Get MCPs from instance
-                instance_mcps = instance.get("mcp_configs", [])
-                mcp_names.update(instance_mcps)
-                logger.debug(f"Instance {instance_id} MCPs: {instance_mcps}")
-
-                # Get agent_id from instance if not provided
-                if not agent_id:
-                    agent_id = instance.get("agent_id")
-
-        # 2. Get MCPs from agent template
-        if agent_id:
-            agent = agents_collection.find_one({"agent_id": agent_id})
-            if agent:
-                # MCPs can be in definition.mcp_configs or top-level mcp_configs
-                definition = agent.get("definition", {})
-                agent_mcps = definition.get("mcp_configs", []) or agent.get("mcp_configs", [])
-                mcp_names.update(agent_mcps)
-                logger.debug(f"Agent {agent_id} MCPs: {agent_mcps}")
+            results = await self.db["agent_instances"].aggregate(
+                self._instance_mcp_config_pipeline(instance_id, agent_id)
+            ).to_list(1)
+        if not results and agent_id:
+            results = await self.db["agents"].aggregate(self._agent_mcp_config_pipeline(agent_id)).to_list(1)
+        result = results[0] if results else None
+
+        if result:
+            agent_id = agent_id or result.get("agent_id")
+        mcp_names = set(result["mcp_names"]) if result else set()
+        logger.debug(f"MCPs for instance={instance_id}, agent={agent_id}: {sorted(mcp_names)}")
 
         if not mcp_names:
             logger.info(f"No MCPs configured for instance={instance_id}, agent={agent_id}")
             return MCPConfigResponse(mcpServers={})
 
-        # 3. Resolve MCPs from registry
+        # Resolve MCPs from the joined registry entries
         mcp_servers: dict[str, MCPServerConfig] = {}
+        docs = {doc["name"]: doc for doc in result["mcps"]}
 
         for name in mcp_names:
-            doc = self.collection.find_one({"name": name})
-            if doc and doc.get("status") != MCPStatus.UNHEALTHY.value:
+            doc = docs.get(name)
+            if doc:
                 # Usar host_url (para Claude CLI no host) se disponível, senão url
                 url = doc.get("host_url") or doc["url"]
                 auth = doc.get("auth")
@@ -552,3 +812,63 @@ class MCPRegistryService:
 
         logger.info(f"Built MCP config with {len(mcp_servers)} servers for instance={instance_id}, agent={agent_id}")
         return MCPConfigResponse(mcpServers=mcp_servers)
+
+    def _registry_lookup(self) -> dict:
+        """$lookup stage joining the available registry entries for the document's mcp_names."""
+        return {"$lookup": {
+            "from": self.COLLECTION_NAME,
+            "let": {"mcp_names": "$mcp_names"},
+            "pipeline": [
+                {"$match": {
+                    "status": {"$ne": MCPStatus.UNHEALTHY.value},
+                    "$expr": {"$in": ["$name", "$$mcp_names"]}
+                }},
+                {"$project": _SERVER_CONFIG_PROJECTION}
+            ],
+            "as": "mcps"
+        }}
+
+    def _agent_mcp_config_pipeline(self, agent_id: str) -> list[dict]:
+        """Pipeline (on agents) resolving an agent template's MCPs."""
+        return [
+            {"$match": {"agent_id": agent_id}},
+            {"$limit": 1},
+            {"$project": {"_id": 0, "agent_id": 1, "mcp_names": _AGENT_MCP_NAMES}},
+            self._registry_lookup()
+        ]
+
+    def _instance_mcp_config_pipeline(self, instance_id: str, agent_id: str | None) -> list[dict]:
+        """
+        Pipeline (on agent_instances) resolving an instance's MCPs.
+
+        The instance's own mcp_configs are merged with its agent template's
+        (agent_id, when given, overrides the instance's agent).
+        """
+        if agent_id:
+            agent_join = {"pipeline": [{"$match": {"agent_id": agent_id}}]}
+        else:
+            # The $type filter keeps an instance without agent_id from joining agents
+            # whose agent_id is null or missing
+            agent_join = {
+                "let": {"agent_id": "$agent_id"},
+                "pipeline": [{"$match": {
+                    "agent_id": {"$type": "string"},
+                    "$expr": {"$eq": ["$agent_id", "$$agent_id"]}
+                }}]
+            }
+        agent_join["pipeline"] += [{"$limit": 1}, {"$project": {"_id": 0, "mcp_names": _AGENT_MCP_NAMES}}]
+
+        return [
+            {"$match": {"instance_id": instance_id}},
+            {"$limit": 1},
+            {"$lookup": {"from": "agents", **agent_join, "as": "agent"}},
+            {"$project": {
+                "_id": 0,
+                "agent_id": 1,
+                "mcp_names": {"$setUnion": [
+                    {"$ifNull": ["$mcp_configs", []]},
+                    {"$ifNull": [{"$first": "$agent.mcp_names"}, []]}
+                ]}
+            }},
+            self._registry_lookup()
+        ]
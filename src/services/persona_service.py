@@ -3,8 +3,10 @@ Serviço de Persona
 SAGA-008 - Fase 1: Core APIs
 """
 
+import asyncio
 from datetime import datetime
 from typing import Optional, Dict, Any, List
+from pymongo import ReturnDocument
 from pymongo.errors import PyMongoError, DuplicateKeyError
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
@@ -45,37 +47,26 @@ class PersonaService:
         # Validar metadata
         validated_metadata = await self.validator.validate_persona_metadata(persona_data.metadata)
         
-        # Verificar se já existe persona para o agente
-        existing_persona = await self.personas_collection.find_one({
-            "agent_id": agent_id
-        })
-        
-        if existing_persona:
-            raise ValueError("Agente já possui uma persona. Use PUT para atualizar.")
-        
         # Preparar dados para inserção
+        now = datetime.utcnow()
         persona_doc = {
             "agent_id": agent_id,
             "content": persona_data.content.strip(),
             "metadata": validated_metadata,
             "version": 1,
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
+            "created_at": now,
+            "updated_at": now
         }
         
         try:
-            # Inserir persona
-            result = await self.personas_collection.insert_one(persona_doc)
+            # Inserir persona (insert_one preenche o _id no próprio documento)
+            await self.personas_collection.insert_one(persona_doc)
             
-            # Buscar persona criada
-            created_persona = await self.personas_collection.find_one({
-                "_id": result.inserted_id
-            })
-            
-            return self._doc_to_response(created_persona)
+            return self._doc_to_response(persona_doc)
             
         except DuplicateKeyError:
-            raise ValueError("Persona já existe para este agente")
+            # O índice único em personas.agent_id garante uma persona por agente
+            raise ValueError("Agente já possui uma persona. Use PUT para atualizar.")
         except PyMongoError as e:
             raise PyMongoError(f"Erro ao criar persona: {str(e)}")
     
@@ -130,14 +121,6 @@ class PersonaService:
         if not await self.validator.validate_agent_exists(agent_id):
             raise ValueError("Agente não encontrado")
         
-        # Buscar persona existente
-        existing_persona = await self.personas_collection.find_one({
-            "agent_id": agent_id
-        })
-        
-        if not existing_persona:
-            raise ValueError("Persona não encontrada para este agente")
-        
         # Preparar dados de atualização
         update_data = {}
         
@@ -154,29 +137,22 @@ class PersonaService:
         if not update_data:
             raise ValueError("Nenhum dado para atualizar")
         
-        # Incrementar versão
-        update_data["version"] = existing_persona["version"] + 1
         update_data["updated_at"] = datetime.utcnow()
         
         try:
-            # Atualizar persona
-            result = await self.personas_collection.update_one(
-                {"_id": existing_persona["_id"]},
-                {"$set": update_data}
+            # Atualizar persona e incrementar versão atomicamente, devolvendo o documento atualizado
+            updated_persona = await self.personas_collection.find_one_and_update(
+                {"agent_id": agent_id},
+                {"$set": update_data, "$inc": {"version": 1}},
+                return_document=ReturnDocument.AFTER
             )
-            
-            if result.modified_count == 0:
-                raise ValueError("Falha ao atualizar persona")
-            
-            # Buscar persona atualizada
-            updated_persona = await self.personas_collection.find_one({
-                "_id": existing_persona["_id"]
-            })
-            
-            return self._doc_to_response(updated_persona)
-            
         except PyMongoError as e:
             raise PyMongoError(f"Erro ao atualizar persona: {str(e)}")
+        
+        if not updated_persona:
+            raise ValueError("Persona não encontrada para este agente")
+        
+        return self._doc_to_response(updated_persona)
     
     async def delete_persona(self, agent_id: str) -> bool:
         """
@@ -245,14 +221,18 @@ class PersonaService:
                 "updated_at", -1
             ).skip(skip).limit(per_page)
             
-            personas_docs = await cursor.to_list(length=per_page)
+            # Contar total (sem filtro, a contagem estimada vem dos metadados da coleção)
+            if filter_query:
+                count = self.personas_collection.count_documents(filter_query)
+            else:
+                count = self.personas_collection.estimated_document_count()
+            
+            # Página e contagem em paralelo
+            personas_docs, total = await asyncio.gather(cursor.to_list(length=per_page), count)
             
             # Converter para response
             personas = [self._doc_to_response(doc) for doc in personas_docs]
             
-            # Contar total
-            total = await self.personas_collection.count_documents(filter_query)
-            
             # Calcular paginação
             has_next = (skip + per_page) < total
             has_prev = page > 1
@@ -273,13 +253,16 @@ class PersonaService:
         """
         Converte documento do MongoDB para PersonaResponse
         
+        Usa model_construct: o documento vem do banco, já validado na escrita,
+        e a resposta é validada de novo na borda da API (response_model).
+        
         Args:
             doc: Documento do MongoDB
             
         Returns:
             PersonaResponse: Persona convertida
         """
-        return PersonaResponse(
+        return PersonaResponse.model_construct(
             id=str(doc["_id"]),
             agent_id=doc["agent_id"],
             content=doc["content"],
@@ -4,11 +4,42 @@ SAGA-008 - Fase 1: Core APIs
 """
 
 from typing import Optional, Dict, Any
+from cachetools import TTLCache
 from pymongo.errors import PyMongoError
 import re
 import json
 
 
+# Elementos de Markdown contados nas estatísticas, reconhecidos em uma única passada: cada
+# trecho conta para o primeiro grupo que casar (negrito não conta como itálico, imagem não
+# conta como link, e nada dentro de um bloco de código é contado)
+_STATS_RE = re.compile(
+    r'(?P<code_blocks>(?s:```.*?```))'
+    r'|(?P<headers>^#+\s+)'
+    r'|(?P<lists>^\s*[-*+]\s+)'
+    r'|(?P<bold>\*\*.*?\*\*)'
+    r'|(?P<italic>\*.*?\*)'
+    r'|(?P<images>!\[.*?\]\(.*?\))'
+    r'|(?P<links>\[.*?\]\(.*?\))',
+    re.MULTILINE
+)
+_STATS_ELEMENTS = ("headers", "bold", "italic", "code_blocks", "links", "images", "lists")
+
+# Caracteres de controle inválidos (todos abaixo de 0x20, exceto tab, \n e \r)
+_INVALID_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+# agent_ids que sabidamente existem (o PersonaValidator é criado a cada requisição, então o
+# cache fica no módulo). Só respostas positivas são guardadas; remoções chamam invalidate_agent_cache().
+_AGENT_EXISTS_TTL_SECONDS = 30
+_agent_exists_cache = TTLCache(maxsize=4096, ttl=_AGENT_EXISTS_TTL_SECONDS)
+
+
+def invalidate_agent_cache(agent_id: str):
+    """Esquece a existência em cache de um agente (chamar após removê-lo)"""
+    _agent_exists_cache.pop(agent_id, None)
+
+
 class PersonaValidator:
     """Validador para operações de Persona"""
     
@@ -30,15 +61,10 @@ class PersonaValidator:
         Raises:
             ValueError: Se o agent_id não é válido
         """
-        if not agent_id:
-            raise ValueError("ID do agente é obrigatório")
+        self._check_agent_id(agent_id)
         
-        if not isinstance(agent_id, str):
-            raise ValueError("ID do agente deve ser uma string")
-        
-        # Validar formato do ID (string não vazia)
-        if not agent_id.strip():
-            raise ValueError("ID do agente não pode estar vazio")
+        if agent_id in _agent_exists_cache:
+            return True
         
         try:
             # Verificar se o agente existe
@@ -46,9 +72,14 @@ class PersonaValidator:
                 {"agent_id": agent_id},
                 {"_id": 1}
             )
-            return agent is not None
         except PyMongoError as e:
             raise ValueError(f"Erro ao verificar agente: {str(e)}")
+
+        if agent is None:
+            return False
+
+        _agent_exists_cache[agent_id] = True
+        return True
     
     async def validate_persona_content(self, content: str) -> Dict[str, Any]:
         """
@@ -152,9 +183,7 @@ class PersonaValidator:
         Raises:
             ValueError: Se não pode ser atualizada
         """
-        # Validar agent_id
-        if not await self.validate_agent_exists(agent_id):
-            raise ValueError("Agente não encontrado")
+        self._check_agent_id(agent_id)
         
         # Validar persona_id
         if not persona_id:
@@ -164,18 +193,62 @@ class PersonaValidator:
             raise ValueError("ID da persona deve ser uma string válida")
         
         try:
-            # Verificar se a persona existe e pertence ao agente
-            persona = await self.personas_collection.find_one({
-                "_id": persona_id,
-                "agent_id": agent_id
-            })
-            
-            if not persona:
-                raise ValueError("Persona não encontrada ou não pertence ao agente")
-            
-            return True
+            if agent_id in _agent_exists_cache:
+                # Agente já confirmado: basta verificar a persona
+                persona = await self.personas_collection.find_one(
+                    {"_id": persona_id, "agent_id": agent_id},
+                    {"_id": 1}
+                )
+                has_persona = persona is not None
+            else:
+                # Agente e persona verificados em uma única ida ao banco
+                result = await self.agents_collection.aggregate([
+                    {"$match": {"agent_id": agent_id}},
+                    {"$limit": 1},
+                    {"$lookup": {
+                        "from": "personas",
+                        "let": {"agent_id": "$agent_id"},
+                        "pipeline": [
+                            {"$match": {"_id": persona_id, "$expr": {"$eq": ["$agent_id", "$$agent_id"]}}},
+                            {"$project": {"_id": 1}}
+                        ],
+                        "as": "persona"
+                    }},
+                    {"$project": {"_id": 0, "has_persona": {"$gt": [{"$size": "$persona"}, 0]}}}
+                ]).to_list(1)
+
+                if not result:
+                    raise ValueError("Agente não encontrado")
+
+                _agent_exists_cache[agent_id] = True
+                has_persona = result[0]["has_persona"]
         except PyMongoError as e:
             raise ValueError(f"Erro ao verificar persona: {str(e)}")
+
+        if not has_persona:
+            raise ValueError("Persona não encontrada ou não pertence ao agente")
+
+        return True
+
+    def _check_agent_id(self, agent_id: str) -> None:
+        """
+        Valida o formato do agent_id
+
+        Args:
+            agent_id: ID do agente
+
+        Raises:
+            ValueError: Se o agent_id não é válido
+        """
+        if not agent_id:
+            raise ValueError("ID do agente é obrigatório")
+
+        if not isinstance(agent_id, str):
+            raise ValueError("ID do agente deve ser uma string")
+
+        # Validar formato do ID (string não vazia)
+        if not agent_id.strip():
+            raise ValueError("ID do agente não pode estar vazio")
     
     def _is_valid_content(self, content: str) -> bool:
         """
@@ -187,19 +260,8 @@ class PersonaValidator:
         Returns:
             bool: True se válido
         """
-        # Verificar caracteres de controle inválidos
-        invalid_chars = [
-            '\x00', '\x01', '\x02', '\x03', '\x04', '\x05', '\x06', '\x07',
-            '\x08', '\x0b', '\x0c', '\x0e', '\x0f', '\x10', '\x11', '\x12',
-            '\x13', '\x14', '\x15', '\x16', '\x17', '\x18', '\x19', '\x1a',
-            '\x1b', '\x1c', '\x1d', '\x1e', '\x1f'
-        ]
-        
-        for char in invalid_chars:
-            if char in content:
-                return False
-        
-        return True
+        # Verificar caracteres de controle inválidos (uma única passada)
+        return _INVALID_CHARS_RE.search(content) is None
     
     def _is_valid_markdown(self, content: str) -> bool:
         """
@@ -211,31 +273,9 @@ class PersonaValidator:
         Returns:
             bool: True se é Markdown válido
         """
-        if not content:
-            return False
-        
-        # Padrões básicos de Markdown
-        markdown_patterns = [
-            r'^#+\s+',  # Headers
-            r'\*\*.*?\*\*',  # Bold
-            r'\*.*?\*',  # Italic
-            r'`.*?`',  # Code
-            r'```.*?```',  # Code blocks
-            r'^\s*[-*+]\s+',  # Lists
-            r'^\s*\d+\.\s+',  # Numbered lists
-            r'\[.*?\]\(.*?\)',  # Links
-            r'!\[.*?\]\(.*?\)',  # Images
-            r'^\s*>\s+',  # Blockquotes
-            r'^\s*---\s*$',  # Horizontal rules
-        ]
-        
-        # Verificar se contém pelo menos um padrão de markdown
-        for pattern in markdown_patterns:
-            if re.search(pattern, content, re.MULTILINE | re.DOTALL):
-                return True
-        
-        # Texto simples também é válido
-        return True
+        # Qualquer texto não vazio é aceito (texto simples também é Markdown válido),
+        # então não há padrões a procurar
+        return bool(content) and not content.isspace()
     
     def _calculate_content_stats(self, content: str) -> Dict[str, Any]:
         """
@@ -251,25 +291,13 @@ class PersonaValidator:
         words = content.split()
         
         # Contar elementos de markdown
-        headers = len(re.findall(r'^#+\s+', content, re.MULTILINE))
-        bold = len(re.findall(r'\*\*.*?\*\*', content))
-        italic = len(re.findall(r'\*.*?\*', content))
-        code_blocks = len(re.findall(r'```.*?```', content, re.DOTALL))
-        links = len(re.findall(r'\[.*?\]\(.*?\)', content))
-        images = len(re.findall(r'!\[.*?\]\(.*?\)', content))
-        lists = len(re.findall(r'^\s*[-*+]\s+', content, re.MULTILINE))
+        markdown_elements = dict.fromkeys(_STATS_ELEMENTS, 0)
+        for match in _STATS_RE.finditer(content):
+            markdown_elements[match.lastgroup] += 1
         
         return {
             "lines": len(lines),
             "words": len(words),
             "characters": len(content),
-            "markdown_elements": {
-                "headers": headers,
-                "bold": bold,
-                "italic": italic,
-                "code_blocks": code_blocks,
-                "links": links,
-                "images": images,
-                "lists": lists
-            }
+            "markdown_elements": markdown_elements
         }
\ No newline at end of file
@@ -1,6 +1,7 @@
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from bson import ObjectId
+from pymongo import ReturnDocument
 from pymongo.collection import Collection
 from pymongo.database import Database
 from pymongo.errors import DuplicateKeyError, OperationFailure
@@ -24,49 +25,33 @@ class PersonaVersionService:
         self.agents_collection: Collection = db.agents
         self.personas_collection: Collection = db.personas
         
-        # Criar índices para performance
-        self._create_indexes()
-    
-    def _create_indexes(self):
-        """Cria índices para otimizar consultas"""
-        try:
-            # Índice composto para consultas por agente e versão
-            self.collection.create_index([
-                ("agent_id", 1),
-                ("version", -1)
-            ], unique=True)
-            
-            # Índice para consultas por timestamp
-            self.collection.create_index([("timestamp", -1)])
-            
-            # Índice para consultas por agente
-            self.collection.create_index([("agent_id", 1)])
-            
-        except Exception as e:
-            print(f"Erro ao criar índices: {e}")
+        # Índices (incluindo o único em agent_id + version) são criados no startup (src/api/app.py)
     
     async def create_version(self, version_data: PersonaVersionCreate) -> PersonaVersionResponse:
         """Cria uma nova versão de persona"""
         try:
-            # Verificar se o agente existe
-            agent = await self.agents_collection.find_one({"_id": ObjectId(version_data.agent_id)})
-            if not agent:
+            # Verificar agente e persona em uma única ida ao banco
+            checks = await self.agents_collection.aggregate([
+                {"$match": {"_id": ObjectId(version_data.agent_id)}},
+                {"$limit": 1},
+                {"$lookup": {
+                    "from": "personas",
+                    "pipeline": [
+                        {"$match": {"agent_id": version_data.agent_id}},
+                        {"$limit": 1},
+                        {"$project": {"_id": 1}}
+                    ],
+                    "as": "persona"
+                }},
+                {"$project": {"_id": 0, "has_persona": {"$gt": [{"$size": "$persona"}, 0]}}}
+            ]).to_list(1)
+            if not checks:
                 raise ValueError(f"Agente {version_data.agent_id} não encontrado")
-            
-            # Buscar persona atual do agente
-            persona = await self.personas_collection.find_one({"agent_id": version_data.agent_id})
-            if not persona:
+            if not checks[0]["has_persona"]:
                 raise ValueError(f"Persona não encontrada para o agente {version_data.agent_id}")
             
-            # Verificar se a versão já existe
-            existing_version = await self.collection.find_one({
-                "agent_id": version_data.agent_id,
-                "version": version_data.version
-            })
-            if existing_version:
-                raise ValueError(f"Versão {version_data.version} já existe para o agente {version_data.agent_id}")
-            
             # Criar documento da versão
+            now = datetime.utcnow()
             version_doc = {
                 "agent_id": version_data.agent_id,
                 "version": version_data.version,
@@ -75,16 +60,18 @@ class PersonaVersionService:
                 "metadata": version_data.metadata or {},
                 "created_by": version_data.created_by,
                 "change_description": version_data.change_description,
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
+                "created_at": now,
+                "updated_at": now
             }
             
-            # Inserir versão
-            result = await self.collection.insert_one(version_doc)
+            # Inserir versão (o índice único em agent_id + version rejeita duplicatas)
+            try:
+                result = await self.collection.insert_one(version_doc)
+            except DuplicateKeyError:
+                raise ValueError(f"Versão {version_data.version} já existe para o agente {version_data.agent_id}")
             
-            # Retornar versão criada
-            created_version = await self.collection.find_one({"_id": result.inserted_id})
-            return self._to_response(created_version)
+            version_doc["_id"] = result.inserted_id
+            return self._to_response(version_doc)
             
         except Exception as e:
             raise Exception(f"Erro ao criar versão: {str(e)}")
@@ -154,14 +141,6 @@ class PersonaVersionService:
     ) -> Optional[PersonaVersionResponse]:
         """Atualiza uma versão de persona"""
         try:
-            # Verificar se a versão existe
-            existing_version = await self.collection.find_one({
-                "agent_id": agent_id,
-                "version": version
-            })
-            if not existing_version:
-                return None
-            
             # Preparar dados de atualização
             update_doc = {
                 "updated_at": datetime.utcnow()
@@ -173,17 +152,14 @@ class PersonaVersionService:
             if update_data.change_description is not None:
                 update_doc["change_description"] = update_data.change_description
             
-            # Atualizar versão
-            await self.collection.update_one(
+            # Atualizar e retornar a versão atualizada
+            updated_version = await self.collection.find_one_and_update(
                 {"agent_id": agent_id, "version": version},
-                {"$set": update_doc}
+                {"$set": update_doc},
+                return_document=ReturnDocument.AFTER
             )
-            
-            # Retornar versão atualizada
-            updated_version = await self.collection.find_one({
-                "agent_id": agent_id,
-                "version": version
-            })
+            if not updated_version:
+                return None
             
             return self._to_response(updated_version)
             
@@ -18,7 +18,7 @@ from mcp_use import MCPAgent, MCPClient
 logger = logging.getLogger(__name__)
 
 
-def resolve_mcp_configs(mcp_names: list[str], registry_service=None) -> dict[str, str]:
+async def resolve_mcp_configs(mcp_names: list[str], registry_service=None) -> dict[str, str]:
     """
     Resolve MCP names to URLs using the MCP Registry.
 
@@ -34,7 +34,7 @@ def resolve_mcp_configs(mcp_names: list[str], registry_service=None) -> dict[str
 
     # If registry service provided, use it directly
     if registry_service:
-        resolved, not_found = registry_service.resolve_names(mcp_names)
+        resolved, not_found = await registry_service.resolve_names(mcp_names)
         if not_found:
             logger.warning(f"Could not resolve MCPs: {not_found}")
         return resolved
@@ -43,7 +43,7 @@ def resolve_mcp_configs(mcp_names: list[str], registry_service=None) -> dict[str
     try:
         from src.api.routers.mcp_registry import get_registry_service
         service = get_registry_service()
-        resolved, not_found = service.resolve_names(mcp_names)
+        resolved, not_found = await service.resolve_names(mcp_names)
         if not_found:
             logger.warning(f"Could not resolve MCPs: {not_found}")
         return resolved
@@ -52,7 +52,7 @@ def resolve_mcp_configs(mcp_names: list[str], registry_service=None) -> dict[str
         return {}
 
 
-def build_mcp_servers_config(
+async def build_mcp_servers_config(
     mcp_names: Optional[list[str]] = None,
     legacy_mcp_url: Optional[str] = None,
     registry_service=None
@@ -83,7 +83,7 @@ def build_mcp_servers_config(
 
     # Resolve and add named MCPs
     if mcp_names:
-        resolved = resolve_mcp_configs(mcp_names, registry_service)
+        resolved = await resolve_mcp_configs(mcp_names, registry_service)
         for name, url in resolved.items():
             mcp_servers[name] = {
                 "url": url,
@@ -143,7 +143,7 @@ def init_agent(agent_config: dict):
     return None
 
 
-def init_agent_with_mcps(
+async def init_agent_with_mcps(
     mcp_names: Optional[list[str]] = None,
     legacy_mcp_url: Optional[str] = None,
     registry_service=None
@@ -164,12 +164,12 @@ def init_agent_with_mcps(
 
     Example:
         # Agent that can use CRM and Billing MCPs
-        agent = init_agent_with_mcps(
+        agent = await init_agent_with_mcps(
             mcp_names=["crm", "billing"],
             legacy_mcp_url="http://localhost:8006/sse"
         )
     """
-    agent_config = build_mcp_servers_config(
+    agent_config = await build_mcp_servers_config(
         mcp_names=mcp_names,
         legacy_mcp_url=legacy_mcp_url,
         registry_service=registry_service
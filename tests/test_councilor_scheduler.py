@@ -0,0 +1,171 @@
+"""
+Testes unitários para CouncilorBackendScheduler
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.api.websocket import gamification_manager
+from src.services.councilor_scheduler import CouncilorBackendScheduler
+
+
+@pytest.fixture
+def mock_db():
+    """Mock do banco de dados"""
+    db = MagicMock()
+    db.agents = MagicMock()
+    db.tasks = MagicMock()
+    db.agent_instances = MagicMock()
+    return db
+
+
+@pytest.fixture
+def scheduler(mock_db):
+    """Instância do CouncilorBackendScheduler"""
+    return CouncilorBackendScheduler(mock_db, conductor_client=MagicMock())
+
+
+class TestAnalyzeSeverity:
+    """Testes para _analyze_severity"""
+
+    def test_empty_output_is_success(self, scheduler):
+        """Testa saída vazia"""
+        assert scheduler._analyze_severity("") == "success"
+        assert scheduler._analyze_severity(None) == "success"
+
+    def test_error_keywords(self, scheduler):
+        """Testa detecção de erro"""
+        assert scheduler._analyze_severity("Build FAILED after 3 steps") == "error"
+        assert scheduler._analyze_severity("Problema CRÍTICO encontrado") == "error"
+
+    def test_error_takes_precedence_over_warning(self, scheduler):
+        """Testa que erro tem prioridade sobre alerta"""
+        assert scheduler._analyze_severity("Warning: deprecated API; fatal crash") == "error"
+
+    def test_warning_keywords(self, scheduler):
+        """Testa detecção de alerta"""
+        assert scheduler._analyze_severity("Dependência Deprecated") == "warning"
+        assert scheduler._analyze_severity("ATENÇÃO: revisar configuração") == "warning"
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Crítico", "error"),
+        ("CRÍTICO", "error"),
+        ("Atenção", "warning"),
+        ("AtEnÇãO", "warning"),
+    ])
+    def test_accented_keywords_any_case(self, scheduler, text, expected):
+        """Testa palavras-chave acentuadas em qualquer caixa"""
+        assert scheduler._analyze_severity(f"Resultado: {text}") == expected
+
+    def test_long_output_scans_head_and_tail_only(self, scheduler):
+        """Testa que apenas início e fim de saídas longas são analisados"""
+        filler = "ok " * 5000
+        assert scheduler._analyze_severity("falha\n" + filler) == "error"
+        assert scheduler._analyze_severity(filler + "\nwarning") == "warning"
+        assert scheduler._analyze_severity(filler + " error " + filler) == "success"
+
+    def test_error_after_warning(self, scheduler):
+        """Testa erro encontrado depois de um alerta"""
+        assert scheduler._analyze_severity("aviso: lento\n...\nFalha ao conectar") == "error"
+
+    def test_clean_output_is_success(self, scheduler):
+        """Testa saída sem palavras-chave"""
+        assert scheduler._analyze_severity("Tudo certo, nenhum problema") == "success"
+
+
+class TestParseIntervalTrigger:
+    """Testes para _parse_interval_trigger"""
+
+    def test_valid_units(self, scheduler):
+        """Testa minutos, horas e dias"""
+        assert scheduler._parse_interval_trigger("30m").interval.total_seconds() == 30 * 60
+        assert scheduler._parse_interval_trigger("1h").interval.total_seconds() == 3600
+        assert scheduler._parse_interval_trigger("2d").interval.total_seconds() == 2 * 86400
+
+    def test_returns_fresh_trigger(self, scheduler):
+        """Testa que cada chamada cria um novo trigger"""
+        assert scheduler._parse_interval_trigger("5m") is not scheduler._parse_interval_trigger("5m")
+
+    @pytest.mark.parametrize("value", ["", "30", "m", "10x", "1.5h", " 5m"])
+    def test_invalid_format(self, scheduler, value):
+        """Testa formato inválido"""
+        with pytest.raises(ValueError, match="Invalid interval format"):
+            scheduler._parse_interval_trigger(value)
+
+
+class TestEnsureIndexes:
+    """Testes para ensure_indexes"""
+
+    @pytest.mark.asyncio
+    async def test_creates_lookup_indexes(self, scheduler, mock_db):
+        """Testa criação dos índices usados nas execuções"""
+        mock_db.agents.create_index = AsyncMock()
+        mock_db.agent_instances.create_index = AsyncMock()
+        mock_db.tasks.create_index = AsyncMock()
+
+        await scheduler.ensure_indexes()
+
+        mock_db.agents.create_index.assert_awaited_once_with("agent_id", unique=True)
+        mock_db.agent_instances.create_index.assert_awaited_once_with("instance_id", unique=True)
+        mock_db.tasks.create_index.assert_awaited_once_with([("agent_id", 1), ("created_at", -1)])
+
+    @pytest.mark.asyncio
+    async def test_failure_is_not_raised(self, scheduler, mock_db):
+        """Testa que falha na criação de índices não interrompe o scheduler"""
+        mock_db.agents.create_index = AsyncMock(side_effect=Exception("boom"))
+        mock_db.agent_instances.create_index = AsyncMock()
+        mock_db.tasks.create_index = AsyncMock()
+
+        await scheduler.ensure_indexes()
+
+
+class TestSafeBroadcast:
+    """Testes para _safe_broadcast"""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_failure_is_not_raised(self, scheduler, monkeypatch):
+        """Testa que falha no WebSocket não interrompe a execução"""
+        broadcast = AsyncMock(side_effect=Exception("socket closed"))
+        monkeypatch.setattr(gamification_manager, "broadcast", broadcast)
+
+        await scheduler._safe_broadcast("councilor_started", {"councilor_id": "a"})
+
+        broadcast.assert_awaited_once_with("councilor_started", {"councilor_id": "a"})
+
+
+class TestExecuteCouncilorTaskError:
+    """Testes para o caminho de erro de _execute_councilor_task"""
+
+    @pytest.mark.asyncio
+    async def test_error_task_prompt_is_capped(self, scheduler, mock_db, monkeypatch):
+        """Testa que o prompt salvo no documento de erro é truncado"""
+        monkeypatch.setattr(scheduler, "_build_mesh_context", lambda owner: "")
+        scheduler.conductor_client.execute_agent = AsyncMock(side_effect=RuntimeError("down"))
+        mock_db.tasks.insert_one = AsyncMock()
+        mock_db.agents.find_one_and_update = AsyncMock(return_value={"stats": {"total_executions": 1}})
+
+        stats = await scheduler._execute_councilor_task("agent_x", {"task": {"prompt": "x" * 10000}})
+
+        error_task = mock_db.tasks.insert_one.await_args.args[0]
+        assert len(error_task["prompt"]) == 4096
+        assert error_task["prompt_truncated"] is True
+        assert error_task["error"] == "down"
+        assert stats == {"total_executions": 1}
+
+
+class TestGetScheduledJobs:
+    """Testes para get_scheduled_jobs"""
+
+    def test_trigger_summary(self, scheduler):
+        """Testa resumo compacto dos triggers"""
+        scheduler.scheduler.add_job(lambda: None, trigger=scheduler._parse_interval_trigger("30m"), id="a", name="A")
+        scheduler.scheduler.add_job(
+            lambda: None, trigger=scheduler._build_trigger({"type": "cron", "value": "*/5 9 * * *"}), id="b", name="B"
+        )
+
+        jobs = {job["id"]: job for job in scheduler.get_scheduled_jobs()}
+
+        assert jobs["a"]["trigger"] == "interval:1800s"
+        assert jobs["b"]["trigger"] == "cron:hour=9 minute=*/5"
+
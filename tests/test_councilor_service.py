@@ -0,0 +1,451 @@
+"""
+Testes unitários para CouncilorService
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import OperationFailure
+
+from src.models.councilor import (
+    CouncilorExecutionCreate,
+    CouncilorExecutionResponse,
+    UpdateCouncilorConfigRequest,
+    UpdateScheduleRequest,
+)
+from src.services import councilor_service
+from src.services.councilor_service import CouncilorService
+
+
+class AsyncCursor:
+    """Cursor assíncrono simples para os testes"""
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    def batch_size(self, size):
+        return self
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self.docs:
+            yield doc
+
+
+@pytest.fixture
+def mock_db():
+    """Mock do banco de dados"""
+    db = MagicMock()
+    db.agents = MagicMock()
+    db.agents.with_options.return_value = db.agents
+    db.tasks = MagicMock()
+    return db
+
+
+@pytest.fixture(autouse=True)
+def clear_agent_cache():
+    """Limpa os caches do módulo entre os testes"""
+    councilor_service._agent_exists_cache.clear()
+    councilor_service._response_cache.clear()
+    yield
+    councilor_service._agent_exists_cache.clear()
+    councilor_service._response_cache.clear()
+
+
+@pytest.fixture
+def tasks_cursor(mock_db):
+    """Cursor encadeável (sort/hint/limit) da visão RawBSON de tasks, sem documentos"""
+    cursor = MagicMock()
+    cursor.sort.return_value = cursor
+    cursor.hint.return_value = cursor
+    cursor.limit.return_value = cursor
+    cursor.to_list = AsyncMock(return_value=[])
+    mock_db.tasks.with_options.return_value.find.return_value = cursor
+    return cursor
+
+
+@pytest.fixture
+def service(mock_db):
+    """Instância do CouncilorService"""
+    return CouncilorService(mock_db)
+
+
+class TestDemoteCouncilor:
+    """Testes para demote_councilor"""
+
+    @pytest.mark.asyncio
+    async def test_demote_single_round_trip(self, service, mock_db):
+        """Testa que o rebaixamento usa um único find_one_and_update"""
+        mock_db.agents.find_one_and_update = AsyncMock(return_value={
+            "_id": ObjectId(), "agent_id": "a", "is_councilor": False
+        })
+        mock_db.agents.find_one = AsyncMock()
+
+        response = await service.demote_councilor("a")
+
+        assert response.is_councilor is False
+        query, update = mock_db.agents.find_one_and_update.await_args.args
+        assert query == {"agent_id": "a", "is_councilor": True}
+        assert update["$currentDate"] == {"updated_at": True}
+        mock_db.agents.find_one.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_demote_not_councilor(self, service, mock_db):
+        """Testa erro quando o agente não é conselheiro"""
+        mock_db.agents.find_one_and_update = AsyncMock(return_value=None)
+        mock_db.agents.find_one = AsyncMock(return_value={"_id": ObjectId()})
+
+        with pytest.raises(ValueError, match="is not a councilor"):
+            await service.demote_councilor("a")
+
+    @pytest.mark.asyncio
+    async def test_demote_agent_not_found(self, service, mock_db):
+        """Testa erro quando o agente não existe"""
+        mock_db.agents.find_one_and_update = AsyncMock(return_value=None)
+        mock_db.agents.find_one = AsyncMock(return_value=None)
+
+        with pytest.raises(ValueError, match="not found"):
+            await service.demote_councilor("a")
+
+
+class TestUpdateSchedule:
+    """Testes para update_schedule"""
+
+    @pytest.mark.asyncio
+    async def test_update_schedule_returns_updated_schedule(self, service, mock_db):
+        """Testa retorno do agendamento atualizado"""
+        mock_db.agents.find_one_and_update = AsyncMock(return_value={
+            "councilor_config": {"schedule": {"type": "interval", "value": "30m", "enabled": False}}
+        })
+
+        result = await service.update_schedule("a", UpdateScheduleRequest(enabled=False))
+
+        assert result == {"type": "interval", "value": "30m", "enabled": False}
+
+
+class TestUpdateAgentStats:
+    """Testes para _update_agent_stats"""
+
+    @pytest.mark.asyncio
+    async def test_stats_updated_without_reads(self, service, mock_db):
+        """Testa incremento direto das estatísticas sem leituras prévias"""
+        mock_db.agents.update_one = AsyncMock(return_value=MagicMock(matched_count=1))
+        mock_db.tasks.count_documents = AsyncMock()
+
+        assert await service._update_agent_stats("a", success=True) is True
+
+        query, update = mock_db.agents.update_one.await_args.args
+        assert query == {"agent_id": "a", "stats.success_count": {"$exists": True}}
+        assert update["$inc"] == {"stats.total_executions": 1, "stats.success_count": 1}
+        mock_db.tasks.count_documents.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stats_seeded_on_first_execution(self, service, mock_db):
+        """Testa inicialização dos contadores via pipeline quando ainda não existem"""
+        mock_db.agents.update_one = AsyncMock(side_effect=[
+            MagicMock(matched_count=0), MagicMock(matched_count=1)
+        ])
+
+        assert await service._update_agent_stats("a", success=False) is True
+
+        query, pipeline = mock_db.agents.update_one.await_args.args
+        assert query == {"agent_id": "a"}
+        assert pipeline[0]["$set"]["stats.success_count"]["$add"][1] == 0
+
+    def test_success_rate_derived_on_read(self, service):
+        """Testa cálculo da taxa de sucesso a partir dos contadores"""
+        stats = {"total_executions": 3, "success_count": 2, "success_rate": 0.0}
+
+        assert service._derive_success_rate(stats)["success_rate"] == 66.7
+        assert service._derive_success_rate(None) is None
+
+
+class TestSaveExecution:
+    """Testes para save_execution"""
+
+    @pytest.fixture
+    def execution(self):
+        """Execução de exemplo"""
+        return CouncilorExecutionCreate(
+            execution_id="exec_1",
+            councilor_id="a",
+            started_at=datetime(2025, 1, 1),
+            status="completed",
+            severity="success"
+        )
+
+    @pytest.mark.asyncio
+    async def test_save_execution_single_round_trip(self, service, mock_db, execution):
+        """Testa que a validação usa o próprio update das estatísticas"""
+        mock_db.agents.update_one = AsyncMock(return_value=MagicMock(matched_count=1))
+        mock_db.agents.count_documents = AsyncMock()
+
+        response = await service.save_execution(execution)
+
+        assert response.execution_id == "exec_1"
+        mock_db.agents.update_one.assert_awaited_once()
+        mock_db.agents.count_documents.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_execution_unknown_councilor(self, service, mock_db, execution):
+        """Testa erro quando o conselheiro não existe"""
+        mock_db.agents.update_one = AsyncMock(return_value=MagicMock(matched_count=0))
+
+        with pytest.raises(ValueError, match="not found"):
+            await service.save_execution(execution)
+
+
+class TestAgentExists:
+    """Testes para _agent_exists"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("doc,expected", [({"agent_id": "a"}, True), (None, False)])
+    async def test_agent_exists_uses_projected_lookup(self, service, mock_db, doc, expected):
+        """Testa verificação de existência via find_one projetado"""
+        mock_db.agents.find_one = AsyncMock(return_value=doc)
+        mock_db.agents.count_documents = AsyncMock()
+
+        assert await service._agent_exists("a") is expected
+
+        mock_db.agents.find_one.assert_awaited_once_with({"agent_id": "a"}, {"_id": 0, "agent_id": 1})
+        mock_db.agents.count_documents.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_agent_exists_cached_and_coalesced(self, service, mock_db):
+        """Testa cache e agrupamento de consultas concorrentes"""
+        mock_db.agents.find_one = AsyncMock(return_value={"agent_id": "a"})
+
+        results = await asyncio.gather(*(service._agent_exists("a") for _ in range(5)))
+        assert all(results)
+        assert await service._agent_exists("a") is True
+        mock_db.agents.find_one.assert_awaited_once()
+
+        councilor_service.invalidate_agent_cache("a")
+        mock_db.agents.find_one = AsyncMock(return_value=None)
+        assert await service._agent_exists("a") is False
+
+
+class TestListAgents:
+    """Testes para list_councilors / list_all_agents"""
+
+    @pytest.mark.asyncio
+    async def test_list_all_agents_streams_projected_docs(self, service, mock_db):
+        """Testa listagem via cursor com projeção"""
+        mock_db.agents.find = MagicMock(return_value=AsyncCursor([
+            {"_id": ObjectId(), "agent_id": "a", "is_councilor": True},
+            {"_id": ObjectId(), "agent_id": "b", "is_councilor": True}
+        ]))
+
+        response = await service.list_all_agents(is_councilor=True)
+
+        assert response.count == 2
+        assert [agent.agent_id for agent in response.agents] == ["a", "b"]
+        query, projection = mock_db.agents.find.call_args.args
+        assert query == {"is_councilor": True}
+        assert projection["_id"] == 1 and projection["councilor_config"] == 1
+        assert "latest_execution" not in projection
+
+    @pytest.mark.asyncio
+    async def test_list_councilors_embeds_latest_execution(self, service, mock_db):
+        """Testa listagem de conselheiros com a última execução em uma única agregação"""
+        created_at = datetime(2025, 1, 1)
+        mock_db.tasks.name = "tasks"
+        mock_db.agents.aggregate = MagicMock(return_value=AsyncCursor([
+            {"_id": ObjectId(), "agent_id": "a", "is_councilor": True, "latest_execution": {
+                "_id": "t1", "execution_id": "t1", "councilor_id": "a", "started_at": created_at,
+                "completed_at": None, "status": "completed", "severity": "success", "output": None,
+                "error": None, "duration_ms": None, "created_at": created_at
+            }},
+            {"_id": ObjectId(), "agent_id": "b", "is_councilor": True}
+        ]))
+
+        response = await service.list_councilors()
+
+        assert response.agents[0].latest_execution.execution_id == "t1"
+        assert response.agents[1].latest_execution is None
+        pipeline = mock_db.agents.aggregate.call_args.args[0]
+        assert pipeline[0] == {"$match": {"is_councilor": True}}
+        lookup = pipeline[2]["$lookup"]
+        assert (lookup["from"], lookup["let"]) == ("tasks", {"agent_id": "$agent_id"})
+        assert lookup["pipeline"][:3] == [
+            {"$match": {"is_councilor_execution": True, "$expr": {"$eq": ["$agent_id", "$$agent_id"]}}},
+            {"$sort": {"created_at": -1}},
+            {"$limit": 1}
+        ]
+
+
+class TestTaskToExecution:
+    """Testes para _task_to_execution"""
+
+    def test_wraps_projected_fields(self, service):
+        """Testa encapsulamento do documento já mapeado pela projeção"""
+        created_at = datetime(2025, 1, 1)
+
+        execution = service._task_to_execution({
+            "execution_id": "t1", "councilor_id": "a", "started_at": created_at, "completed_at": None,
+            "status": "error", "severity": "success", "output": "boom", "error": "boom",
+            "duration_ms": 1500, "created_at": created_at
+        })
+
+        assert execution.id == execution.execution_id == "t1"
+        assert execution.error == "boom"
+        assert execution.duration_ms == 1500
+        assert execution.model_dump(by_alias=True)["_id"] == "t1"
+
+    def test_projection_maps_fields_server_side(self):
+        """Testa que a projeção produz os campos da resposta"""
+        projection = councilor_service._EXECUTION_TASK_PROJECTION
+        summary = councilor_service._EXECUTION_SUMMARY_PROJECTION
+
+        assert set(projection) - {"_id"} == set(CouncilorExecutionResponse.model_fields) - {"id"}
+        assert projection["_id"] == 0
+        assert summary["output"] == {"$literal": None}
+        assert summary["error"] == projection["error"]
+
+
+class TestGetExecutions:
+    """Testes para get_executions"""
+
+    @pytest.fixture(autouse=True)
+    def task_docs(self, tasks_cursor, mock_db):
+        """Uma execução concluída com saída (já no formato da projeção)"""
+        tasks_cursor.to_list.return_value = [{
+            "execution_id": "t1", "councilor_id": "a", "started_at": datetime(2025, 1, 1),
+            "completed_at": None, "status": "completed", "severity": "success", "output": "long output",
+            "error": None, "duration_ms": None, "created_at": datetime(2025, 1, 1)
+        }]
+        mock_db.agents.find_one = AsyncMock(return_value={"agent_id": "a"})
+
+    @pytest.mark.asyncio
+    async def test_limit_is_clamped_and_output_omitted(self, service, mock_db, tasks_cursor):
+        """Testa limite máximo e omissão da saída por padrão"""
+        response = await service.get_executions("a", limit=10_000)
+
+        tasks_cursor.limit.assert_called_once_with(200)
+        tasks_cursor.hint.assert_called_once_with("councilor_exec_agent_created")
+        projection = mock_db.tasks.with_options.return_value.find.call_args.args[1]
+        assert projection is councilor_service._EXECUTION_SUMMARY_PROJECTION
+        assert response.count == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_index_falls_back_to_planner(self, service, tasks_cursor):
+        """Testa nova leitura sem hint quando o índice de execuções não existe"""
+        tasks_cursor.to_list.side_effect = [
+            OperationFailure("error processing query: planner returned error :: caused by :: hint provided does not correspond to an existing index"),
+            tasks_cursor.to_list.return_value
+        ]
+
+        response = await service.get_executions("a")
+
+        assert [call.args[0] for call in tasks_cursor.hint.call_args_list] == ["councilor_exec_agent_created", None]
+        assert response.count == 1
+
+    @pytest.mark.asyncio
+    async def test_output_included_on_request(self, service, mock_db, tasks_cursor):
+        """Testa inclusão da saída quando solicitada"""
+        response = await service.get_executions("a", include_output=True)
+
+        projection = mock_db.tasks.with_options.return_value.find.call_args.args[1]
+        assert projection is councilor_service._EXECUTION_TASK_PROJECTION
+        assert response.executions[0].output == "long output"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_reads_share_one_query(self, service, mock_db, tasks_cursor):
+        """Testa que leituras idênticas simultâneas compartilham uma única consulta"""
+        responses = await asyncio.gather(*(service.get_executions("a") for _ in range(5)))
+
+        assert all(response is responses[0] for response in responses)
+        tasks_cursor.to_list.assert_awaited_once()
+        assert councilor_service._executions_pending == {}
+
+        await service.get_executions("a")
+        assert tasks_cursor.to_list.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_existence_checked_only_when_empty(self, service, mock_db, tasks_cursor):
+        """Testa que a existência do agente só é verificada sem execuções"""
+        await service.get_executions("a")
+        mock_db.agents.find_one.assert_not_called()
+
+        tasks_cursor.to_list.return_value = []
+        mock_db.agents.find_one = AsyncMock(return_value=None)
+
+        with pytest.raises(ValueError, match="not found"):
+            await service.get_executions("missing")
+
+
+class TestGetCouncilorReport:
+    """Testes para get_councilor_report"""
+
+    @pytest.mark.asyncio
+    async def test_report_without_existence_check(self, service, mock_db, tasks_cursor):
+        """Testa relatório buscando agente e execuções sem verificação extra"""
+        mock_db.agents.find_one = AsyncMock(return_value={
+            "display_name": "A", "is_councilor": True, "stats": {"total_executions": 4, "success_rate": 75.0}
+        })
+
+        report = await service.get_councilor_report("a")
+
+        assert report.councilor_name == "A"
+        assert report.total_executions == 4
+        mock_db.agents.find_one.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_report_not_councilor(self, service, mock_db, tasks_cursor):
+        """Testa erro quando o agente não é conselheiro"""
+        mock_db.agents.find_one = AsyncMock(return_value={"is_councilor": False})
+
+        with pytest.raises(ValueError, match="not a councilor"):
+            await service.get_councilor_report("a")
+
+    @pytest.mark.asyncio
+    async def test_report_cached_until_councilor_changes(self, service, mock_db, tasks_cursor):
+        """Testa cache do relatório e invalidação após alteração do conselheiro"""
+        mock_db.agents.find_one = AsyncMock(return_value={"is_councilor": True, "stats": {}})
+        mock_db.agents.find_one_and_update = AsyncMock(return_value={
+            "_id": ObjectId(), "agent_id": "a", "is_councilor": False
+        })
+
+        first = await service.get_councilor_report("a")
+        assert await service.get_councilor_report("a") is first
+        assert mock_db.agents.find_one.await_count == 1
+
+        await service.get_councilor_report("a", limit=5)
+        assert mock_db.agents.find_one.await_count == 2
+
+        await service.demote_councilor("a")
+        await service.get_councilor_report("a")
+        assert mock_db.agents.find_one.await_count == 3
+
+
+class TestUpdateCouncilorConfig:
+    """Testes para update_councilor_config"""
+
+    @pytest.mark.asyncio
+    async def test_only_provided_fields_are_set(self, service, mock_db):
+        """Testa que apenas os campos informados são atualizados"""
+        mock_db.agents.find_one_and_update = AsyncMock(return_value={
+            "_id": ObjectId(), "agent_id": "a", "is_councilor": True
+        })
+        request = UpdateCouncilorConfigRequest(task={"name": "Nova", "prompt": "Analise"})
+
+        await service.update_councilor_config("a", request)
+
+        update = mock_db.agents.find_one_and_update.await_args.args[1]
+        assert list(update["$set"]) == ["councilor_config.task"]
+        assert update["$set"]["councilor_config.task"]["name"] == "Nova"
+
+    @pytest.mark.asyncio
+    async def test_empty_patch_skips_database(self, service, mock_db):
+        """Testa que uma requisição sem campos não acessa o banco"""
+        mock_db.agents.find_one_and_update = AsyncMock()
+
+        with pytest.raises(ValueError, match="No fields provided"):
+            await service.update_councilor_config("a", UpdateCouncilorConfigRequest())
+
+        mock_db.agents.find_one_and_update.assert_not_called()
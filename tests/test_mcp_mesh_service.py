@@ -0,0 +1,212 @@
+"""
+Testes unitários para MCPMeshService
+"""
+
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+
+from src.services.mcp_mesh_service import MCPMeshService, MeshNode
+
+
+@pytest.fixture
+def mesh():
+    """Instância do MCPMeshService com faixa de portas reduzida"""
+    service = MCPMeshService()
+    service._port_range = range(13000, 13050)
+    return service
+
+
+def make_node(port: int) -> MeshNode:
+    """Cria um nó saudável para a porta"""
+    return MeshNode(
+        name=f"sidecar-{port}",
+        url=f"http://host:{port}/sse",
+        status="healthy",
+        last_verified=datetime.utcnow()
+    )
+
+
+class TestRefreshMesh:
+    """Testes para _refresh_mesh"""
+
+    @pytest.mark.asyncio
+    async def test_probes_are_bounded(self, mesh, monkeypatch):
+        """Testa que no máximo 20 sondagens rodam ao mesmo tempo"""
+        in_flight = 0
+        peak = 0
+
+        async def probe(client, port, url):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return make_node(port) if port % 10 == 0 else None
+
+        async def tcp_open(host, port):
+            return True
+
+        monkeypatch.setattr(mesh, "_tcp_open", tcp_open)
+        monkeypatch.setattr(mesh, "_probe_node", probe)
+
+        await mesh._refresh_mesh()
+
+        assert peak == 20
+        assert sorted(mesh._mesh_cache) == [f"sidecar-{port}" for port in range(13000, 13050, 10)]
+
+    @pytest.mark.asyncio
+    async def test_closed_ports_skip_http_probe(self, mesh, monkeypatch):
+        """Testa que portas fechadas não recebem requisição HTTP"""
+        probed = []
+
+        async def tcp_open(host, port):
+            return port == 13007
+
+        async def probe(client, port, url):
+            probed.append(port)
+            return make_node(port)
+
+        monkeypatch.setattr(mesh, "_tcp_open", tcp_open)
+        monkeypatch.setattr(mesh, "_probe_node", probe)
+
+        await mesh._refresh_mesh()
+
+        assert probed == [13007]
+        assert list(mesh._mesh_cache) == ["sidecar-13007"]
+        topology = mesh.get_mesh_topology_as_dict()
+        assert [node["name"] for node in topology] == ["sidecar-13007"]
+        assert isinstance(topology[0]["last_verified"], str)
+
+    @pytest.mark.asyncio
+    async def test_incremental_scan_reprobes_live_ports_only(self, mesh, monkeypatch):
+        """Testa que a varredura incremental sonda só as portas vivas e remove as que caíram"""
+        open_ports = {13001, 13002}
+        probed = []
+
+        async def tcp_open(host, port):
+            return port in open_ports
+
+        async def probe(client, port, url):
+            probed.append(port)
+            return make_node(port) if port in open_ports else None
+
+        monkeypatch.setattr(mesh, "_tcp_open", tcp_open)
+        monkeypatch.setattr(mesh, "_probe_node", probe)
+
+        await mesh._refresh_mesh()
+        assert mesh._live_ports == {13001, 13002}
+
+        open_ports.discard(13002)
+        open_ports.add(13003)
+        probed.clear()
+        await mesh._refresh_mesh(mesh._live_ports)
+
+        assert sorted(probed) == [13001, 13002]
+        assert mesh._live_ports == {13001}
+        assert list(mesh._mesh_cache) == ["sidecar-13001"]
+
+
+class TestProbeClient:
+    """Testes para o ciclo de vida do cliente HTTP"""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_across_scans_and_closed_on_stop(self, mesh, monkeypatch):
+        """Testa que o cliente é reaproveitado entre varreduras e fechado ao parar"""
+        clients = []
+
+        async def tcp_open(host, port):
+            return True
+
+        async def probe(client, port, url):
+            clients.append(client)
+            return None
+
+        monkeypatch.setattr(mesh, "_tcp_open", tcp_open)
+        monkeypatch.setattr(mesh, "_probe_node", probe)
+
+        await mesh._refresh_mesh()
+        await mesh._refresh_mesh()
+        client = mesh._client
+
+        assert {id(c) for c in clients} == {id(client)}
+
+        await mesh.stop_background_scan()
+
+        assert client.is_closed
+        assert mesh._client is None
+
+
+class TestTcpOpen:
+    """Testes para _tcp_open"""
+
+    @pytest.mark.asyncio
+    async def test_open_and_closed_ports(self):
+        """Testa porta aberta e porta fechada"""
+        server = await asyncio.start_server(lambda reader, writer: writer.close(), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+
+        assert await MCPMeshService._tcp_open("127.0.0.1", port) is True
+
+        server.close()
+        await server.wait_closed()
+        assert await MCPMeshService._tcp_open("127.0.0.1", port) is False
+
+
+class TestProbeNode:
+    """Testes para _probe_node"""
+
+    @pytest.mark.asyncio
+    async def test_healthy_sidecar(self, mesh):
+        """Testa sidecar saudável com corpo JSON"""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=b'{"name": "files", "tools_count": 3}')
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            node = await mesh._probe_node(client, 13005, "http://host:13005/health")
+
+        assert node.name == "files"
+        assert node.tools_count == 3
+        assert node.url.endswith(":13005/sse")
+
+    @pytest.mark.asyncio
+    async def test_connect_error(self, mesh):
+        """Testa porta sem resposta"""
+        def refuse(request):
+            raise httpx.ConnectError("refused")
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(refuse)) as client:
+            assert await mesh._probe_node(client, 13005, "http://host:13005/health") is None
+
+
+class TestStopBackgroundScan:
+    """Testes para stop_background_scan"""
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_in_flight_probes(self, mesh, monkeypatch):
+        """Testa que parar o scanner cancela as sondagens em andamento"""
+        started = asyncio.Event()
+        cancelled = []
+
+        async def tcp_open(host, port):
+            return True
+
+        async def probe(client, port, url):
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(port)
+                raise
+
+        monkeypatch.setattr(mesh, "_tcp_open", tcp_open)
+        monkeypatch.setattr(mesh, "_probe_node", probe)
+
+        await mesh.start_background_scan()
+        await started.wait()
+        await mesh.stop_background_scan()
+
+        assert len(cancelled) == 20
+        assert mesh._mesh_cache == {}
@@ -0,0 +1,414 @@
+"""
+Testes unitários para MCPRegistryService
+"""
+
+import asyncio
+import re
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from pymongo.errors import OperationFailure
+
+from src.mcps.registry import MCP_REGISTRY
+from src.models.mcp_registry import MCPRegisterRequest
+from src.services.mcp_registry_service import _CONFIG_FIELD_PATTERN, MCPRegistryService
+
+
+class AsyncCursor:
+    """Cursor assíncrono mínimo (Motor)"""
+
+    def __init__(self, docs):
+        self.docs = list(docs)
+
+    def sort(self, *args):
+        return self
+
+    def batch_size(self, size):
+        self.size = size
+        return self
+
+    async def to_list(self, length):
+        return self.docs[:length] if length else self.docs
+
+    async def __aiter__(self):
+        for doc in self.docs:
+            yield doc
+
+
+@pytest.fixture
+def mock_db():
+    """Mock do banco de dados (coleções por nome)"""
+    collections = {}
+    db = MagicMock()
+    db.__getitem__.side_effect = lambda name: collections.setdefault(name, MagicMock(name=name))
+    return db
+
+
+@pytest.fixture
+def registry(mock_db):
+    """Instância do MCPRegistryService"""
+    return MCPRegistryService(mock_db)
+
+
+class TestEnsureIndexes:
+    """Testes para _ensure_indexes"""
+
+    def test_compound_indexes_replace_single_field(self, registry):
+        """Testa criação dos índices compostos (coleção síncrona subjacente) e remoção dos antigos"""
+        indexes = registry.collection.delegate.create_indexes.call_args.args[0]
+
+        assert [index.document["key"] for index in indexes] == [
+            {"name": 1},
+            {"type": 1, "status": 1},
+            {"metadata.category": 1, "type": 1},
+            {"type": 1, "last_heartbeat": 1},
+            {"last_heartbeat": 1}
+        ]
+        ttl = indexes[-1].document
+        assert ttl["expireAfterSeconds"] == 24 * 3600
+        assert ttl["partialFilterExpression"] == {"type": "external"}
+        dropped = [call.args[0] for call in registry.collection.delegate.drop_index.call_args_list]
+        assert dropped == ["type_1", "status_1", "last_heartbeat_1", "metadata.category_1"]
+
+
+class TestSyncInternalMcps:
+    """Testes para _sync_internal_mcps"""
+
+    def test_single_bulk_upsert(self, registry):
+        """Testa sincronização dos MCPs internos em um único bulk_write"""
+        registry.collection.delegate.bulk_write.assert_called_once()
+        ops = registry.collection.delegate.bulk_write.call_args.args[0]
+
+        assert len(ops) == len(MCP_REGISTRY)
+        assert all(op._upsert for op in ops)
+        update = ops[0]._doc
+        assert "registered_at" not in update["$set"]
+        assert set(update["$setOnInsert"]) == {"registered_at"}
+
+
+class TestStaleHeartbeats:
+    """Testes para a marcação de MCPs sem heartbeat"""
+
+    @pytest.mark.asyncio
+    async def test_mark_stale_unhealthy_single_update(self, registry):
+        """Testa marcação em lote dos MCPs externos sem heartbeat recente"""
+        registry.collection.update_many = AsyncMock(return_value=MagicMock(modified_count=2))
+
+        assert await registry.mark_stale_unhealthy() == 2
+
+        query, update = registry.collection.update_many.call_args.args
+        assert query["type"] == "external" and query["status"] == "healthy"
+        assert "$lt" in query["last_heartbeat"]
+        assert update == {"$set": {"status": "unhealthy"}}
+
+    @pytest.mark.asyncio
+    async def test_reads_do_not_update_status(self, registry):
+        """Testa que leituras não fazem escrita por documento"""
+        registry.collection.find_one = AsyncMock(return_value={
+            "name": "x", "type": "external", "url": "http://x/sse", "status": "healthy",
+            "last_heartbeat": datetime(2000, 1, 1)
+        })
+        registry.collection.update_one = AsyncMock()
+
+        entry = await registry.get_by_name("x")
+
+        assert entry.status.value == "healthy"
+        registry.collection.update_one.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_monitor_start_stop(self, registry, monkeypatch):
+        """Testa ciclo de vida do monitor em segundo plano"""
+        monkeypatch.setattr(registry, "mark_stale_unhealthy", AsyncMock(return_value=0))
+
+        await registry.start_stale_monitor()
+        await asyncio.sleep(0)
+        await registry.stop_stale_monitor()
+
+        registry.mark_stale_unhealthy.assert_awaited_once()
+        assert registry._stale_monitor_task is None
+
+
+class TestListAll:
+    """Testes para list_all"""
+
+    @pytest.mark.asyncio
+    async def test_projected_batched_listing(self, registry):
+        """Testa listagem com projeção e lotes grandes"""
+        cursor = AsyncCursor([
+            {"name": "a", "type": "internal", "url": "http://a/sse", "status": "healthy", "metadata": {"category": "core"}},
+            {"name": "b", "type": "external", "url": "http://b/sse", "status": "unknown"}
+        ])
+        registry.collection.find.return_value = cursor
+
+        entries = await registry.list_all(healthy_only=True)
+
+        assert [(e.name, e.metadata and e.metadata.category) for e in entries] == [("a", "core"), ("b", None)]
+        query, projection = registry.collection.find.call_args.args
+        assert query == {"status": "healthy"}
+        assert "auth" not in projection and projection["_id"] == 0
+        assert projection["status"] == {"$ifNull": ["$status", "unknown"]}
+        assert cursor.size == 256
+
+
+class TestGetStats:
+    """Testes para get_stats"""
+
+    @pytest.mark.asyncio
+    async def test_totals_counted_server_side(self, registry):
+        """Testa totais calculados em um único $group"""
+        registry.collection.aggregate.return_value = AsyncCursor([{
+            "_id": None, "total": 3, "internal": 1, "external": 2, "healthy": 2, "unhealthy": 0, "unknown": 1
+        }])
+
+        stats = await registry.get_stats()
+
+        assert stats == {"total": 3, "internal": 1, "external": 2, "healthy": 2, "unhealthy": 0, "unknown": 1}
+        pipeline = registry.collection.aggregate.call_args.args[0]
+        assert len(pipeline) == 1 and pipeline[0]["$group"]["_id"] is None
+
+    @pytest.mark.asyncio
+    async def test_empty_registry(self, registry):
+        """Testa registro vazio"""
+        registry.collection.aggregate.return_value = AsyncCursor([])
+
+        assert await registry.get_stats() == {
+            "total": 0, "internal": 0, "external": 0, "healthy": 0, "unhealthy": 0, "unknown": 0
+        }
+
+
+class TestResolveNames:
+    """Testes para resolve_names"""
+
+    @pytest.mark.asyncio
+    async def test_single_in_query(self, registry):
+        """Testa resolução de todos os nomes com uma única consulta"""
+        registry.collection.find.return_value = AsyncCursor([
+            {"name": "b", "url": "http://b/sse"},
+            {"name": "a", "url": "http://a/sse"}
+        ])
+        registry.collection.find_one = AsyncMock()
+
+        resolved, not_found = await registry.resolve_names(["a", "b", "c"])
+
+        assert list(resolved.items()) == [("a", "http://a/sse"), ("b", "http://b/sse")]
+        assert not_found == ["c"]
+        query = registry.collection.find.call_args.args[0]
+        assert query == {"name": {"$in": ["a", "b", "c"]}, "status": {"$ne": "unhealthy"}}
+        registry.collection.find_one.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_lookups_cached_until_registration(self, registry):
+        """Testa cache das resoluções por nome e invalidação no registro"""
+        registry.collection.find.side_effect = lambda query, projection: AsyncCursor([{"name": "a", "url": "http://a/sse"}])
+
+        assert await registry.resolve_names(["a", "b"]) == ({"a": "http://a/sse"}, ["b"])
+        assert await registry.resolve_names(["b", "a"]) == ({"a": "http://a/sse"}, ["b"])
+        assert registry.collection.find.call_count == 1
+
+        registry.collection.find_one = AsyncMock(return_value=None)
+        registry.collection.update_one = AsyncMock()
+        await registry.register(MCPRegisterRequest(name="b", url="http://b/sse"))
+        registry.collection.find.side_effect = lambda query, projection: AsyncCursor([{"name": "b", "url": "http://b/sse"}])
+
+        assert await registry.resolve_names(["a", "b"]) == ({"a": "http://a/sse", "b": "http://b/sse"}, [])
+        assert registry.collection.find.call_args.args[0]["name"] == {"$in": ["b"]}
+
+
+class TestCheckHealth:
+    """Testes para check_health e check_health_many"""
+
+    @pytest.mark.asyncio
+    async def test_many_probes_share_client_and_bulk_write(self, registry):
+        """Testa sondagem em lote com um único cliente HTTP e um único bulk_write"""
+        registry.collection.find.return_value = AsyncCursor([
+            {"name": "a", "type": "external", "url": "http://a/sse", "status": "unhealthy"},
+            {"name": "b", "type": "external", "url": "http://b/sse", "status": "healthy"},
+            {"name": "c", "type": "external", "url": "http://c/sse", "status": "healthy"}
+        ])
+        registry.collection.bulk_write = AsyncMock()
+
+        def handler(request):
+            if request.url.host == "c":
+                raise httpx.ConnectError("refused")
+            return httpx.Response(200 if request.url.host == "a" else 503)
+
+        registry._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        registry._config_cache["key"] = "config"
+
+        results = await registry.check_health_many(["c", "a", "missing", "b"])
+
+        assert [(r.name, r.status.value) for r in results] == [
+            ("c", "unhealthy"), ("a", "healthy"), ("missing", "unknown"), ("b", "unhealthy")
+        ]
+        ops = registry.collection.bulk_write.await_args.args[0]
+        assert {op._filter["name"]: op._doc["$set"]["status"] for op in ops} == {"c": "unhealthy", "a": "healthy"}
+        registry.collection.bulk_write.assert_awaited_once()
+        assert "key" not in registry._config_cache
+
+        await registry.close()
+        assert registry._http is None
+
+    @pytest.mark.asyncio
+    async def test_unchanged_status_keeps_cache(self, registry):
+        """Testa que sondagem sem mudança de status não invalida o cache"""
+        registry.collection.find_one = AsyncMock(return_value={
+            "name": "a", "type": "external", "url": "http://a/sse", "status": "healthy"
+        })
+        registry.collection.bulk_write = AsyncMock()
+        registry._http = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+        registry._config_cache["key"] = "config"
+
+        health = await registry.check_health("a")
+
+        assert health.status.value == "healthy"
+        registry.collection.bulk_write.assert_awaited_once()
+        assert "key" in registry._config_cache
+        await registry.close()
+
+    @pytest.mark.asyncio
+    async def test_any_2xx_is_healthy(self, registry):
+        """Testa que qualquer resposta 2xx conta como saudável"""
+        registry.collection.find_one = AsyncMock(return_value={
+            "name": "a", "type": "external", "url": "http://a/sse", "status": "healthy"
+        })
+        registry.collection.bulk_write = AsyncMock()
+        registry._http = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(204)))
+
+        assert (await registry.check_health("a")).status.value == "healthy"
+        await registry.close()
+
+    @pytest.mark.asyncio
+    async def test_sweep_probes_external_mcps(self, registry):
+        """Testa varredura de todos os MCPs externos com um único bulk_write"""
+        cursor = AsyncCursor([
+            {"name": "a", "type": "external", "url": "http://a/sse", "status": "healthy"},
+            {"name": "b", "type": "external", "url": "http://b/sse", "status": "unknown"}
+        ])
+        registry.collection.find.return_value = cursor
+        registry.collection.bulk_write = AsyncMock()
+        registry._http = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+
+        results = await registry.sweep_health()
+
+        assert [(r.name, r.status.value) for r in results] == [("a", "healthy"), ("b", "healthy")]
+        assert registry.collection.find.call_args.args[0] == {"type": "external"}
+        assert len(registry.collection.bulk_write.await_args.args[0]) == 2
+        registry.collection.bulk_write.assert_awaited_once()
+        await registry.close()
+
+
+class TestGetMcpConfig:
+    """Testes para get_mcp_config"""
+
+    @pytest.mark.asyncio
+    async def test_instance_config_from_single_aggregation(self, registry, mock_db):
+        """Testa montagem da configuração com uma única agregação a partir da instância"""
+        mock_db["agent_instances"].aggregate.return_value = AsyncCursor([{
+            "agent_id": "a",
+            "mcp_names": ["x", "y", "z"],
+            "mcps": [
+                {"name": "x", "url": "http://x/sse", "auth": "k"},
+                {"name": "y", "url": "http://y/sse", "host_url": "http://localhost:13001/sse"}
+            ]
+        }])
+
+        config = await registry.get_mcp_config(instance_id="i")
+
+        assert {name: server.url for name, server in config.mcpServers.items()} == {
+            "x": "http://x/sse?auth=k",
+            "y": "http://localhost:13001/sse"
+        }
+        pipeline = mock_db["agent_instances"].aggregate.call_args.args[0]
+        assert pipeline[0] == {"$match": {"instance_id": "i"}}
+        assert pipeline[2]["$lookup"]["let"] == {"agent_id": "$agent_id"}
+        assert pipeline[2]["$lookup"]["pipeline"][0]["$match"]["agent_id"] == {"$type": "string"}
+        assert pipeline[-1]["$lookup"]["from"] == "mcp_registry"
+        mock_db["agents"].aggregate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_agent_fallback_when_instance_missing(self, registry, mock_db):
+        """Testa uso do template do agente quando a instância não existe"""
+        mock_db["agent_instances"].aggregate.return_value = AsyncCursor([])
+        mock_db["agents"].aggregate.return_value = AsyncCursor([{"agent_id": "a", "mcp_names": [], "mcps": []}])
+
+        config = await registry.get_mcp_config(instance_id="i", agent_id="a")
+
+        assert config.mcpServers == {}
+        instance_lookup = mock_db["agent_instances"].aggregate.call_args.args[0][2]["$lookup"]
+        assert instance_lookup["pipeline"][0] == {"$match": {"agent_id": "a"}}
+        assert mock_db["agents"].aggregate.call_args.args[0][0] == {"$match": {"agent_id": "a"}}
+
+    @pytest.mark.asyncio
+    async def test_config_cached_until_registry_changes(self, registry, mock_db):
+        """Testa cache da configuração e invalidação por escrita no registro"""
+        mock_db["agents"].aggregate.side_effect = lambda pipeline: AsyncCursor([
+            {"agent_id": "a", "mcp_names": ["x"], "mcps": [{"name": "x", "url": "http://x/sse"}]}
+        ])
+
+        first = await registry.get_mcp_config(agent_id="a")
+        assert await registry.get_mcp_config(agent_id="a") is first
+        assert mock_db["agents"].aggregate.call_count == 1
+
+        registry.collection.find_one = AsyncMock(return_value=None)
+        registry.collection.update_one = AsyncMock()
+        await registry.register(MCPRegisterRequest(name="y", url="http://y/sse"))
+        await registry.get_mcp_config(agent_id="a")
+        assert mock_db["agents"].aggregate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_reviving_mcp_clears_cache(self, registry):
+        """Testa que só o heartbeat que reativa um MCP invalida o cache"""
+        registry._config_cache["key"] = "config"
+        registry.collection.find_one_and_update = AsyncMock(return_value={"status": "healthy"})
+        assert await registry.heartbeat("x") is True
+        assert "key" in registry._config_cache
+
+        registry.collection.find_one_and_update.return_value = {"status": "unhealthy"}
+        assert await registry.heartbeat("x") is True
+        assert "key" not in registry._config_cache
+
+        registry.collection.find_one_and_update.return_value = None
+        assert await registry.heartbeat("missing") is False
+
+
+class TestConfigWatch:
+    """Testes para a invalidação via change streams"""
+
+    @pytest.mark.asyncio
+    async def test_change_event_clears_cache(self, registry, mock_db):
+        """Testa limpeza do cache ao receber evento do change stream"""
+        mock_db.watch.return_value.__aenter__.return_value = AsyncCursor([{"operationType": "update"}])
+        registry._config_cache["key"] = "config"
+
+        await registry.start_config_watch()
+        await registry._config_watch_task
+
+        assert "key" not in registry._config_cache
+        await registry.stop_config_watch()
+
+    @pytest.mark.asyncio
+    async def test_standalone_server_falls_back_to_ttl(self, registry, mock_db):
+        """Testa que a ausência de change streams não é um erro"""
+        mock_db.watch.side_effect = OperationFailure("The $changeStream stage is only supported on replica sets")
+
+        await registry.start_config_watch()
+        await registry.stop_config_watch()
+
+        assert registry._config_watch_task is None
+
+    @pytest.mark.parametrize("path,relevant", [
+        ("mcp_configs", True),
+        ("mcp_configs.0", True),
+        ("definition.mcp_configs", True),
+        ("definition", True),
+        ("agent_id", True),
+        ("definition.name", False),
+        ("stats.total_executions", False),
+        ("statistics.last_execution", False),
+        ("status", False),
+    ])
+    def test_only_config_fields_trigger_invalidation(self, path, relevant):
+        """Testa que apenas atualizações de campos de MCP invalidam o cache"""
+        assert bool(re.search(_CONFIG_FIELD_PATTERN, path)) is relevant
@@ -62,10 +62,11 @@ class TestCreatePersona:
         with patch.object(service.validator, 'validate_agent_exists', return_value=True):
             with patch.object(service.validator, 'validate_persona_content', return_value={"is_valid": True}):
                 with patch.object(service.validator, 'validate_persona_metadata', return_value=sample_persona_data.metadata):
-                    # Mock do banco de dados
-                    service.db.personas.find_one = AsyncMock(return_value=None)  # Nenhuma persona existente
-                    service.db.personas.insert_one = AsyncMock(return_value=MagicMock(inserted_id=sample_persona_doc["_id"]))
-                    service.db.personas.find_one = AsyncMock(return_value=sample_persona_doc)
+                    # Mock do banco de dados (insert_one preenche o _id no documento)
+                    service.db.personas.insert_one = AsyncMock(
+                        side_effect=lambda doc: doc.update(_id=sample_persona_doc["_id"])
+                    )
+                    service.db.personas.find_one = AsyncMock()
                     
                     result = await service.create_persona(agent_id, sample_persona_data)
                     
@@ -75,6 +76,7 @@ class TestCreatePersona:
                     assert result.content == sample_persona_doc["content"]
                     assert result.metadata == sample_persona_doc["metadata"]
                     assert result.version == sample_persona_doc["version"]
+                    service.db.personas.find_one.assert_not_awaited()
     
     @pytest.mark.asyncio
     async def test_create_persona_agent_not_found(self, service, sample_persona_data):
@@ -93,8 +95,8 @@ class TestCreatePersona:
         with patch.object(service.validator, 'validate_agent_exists', return_value=True):
             with patch.object(service.validator, 'validate_persona_content', return_value={"is_valid": True}):
                 with patch.object(service.validator, 'validate_persona_metadata', return_value=sample_persona_data.metadata):
-                    # Mock do banco de dados - persona já existe
-                    service.db.personas.find_one = AsyncMock(return_value=sample_persona_doc)
+                    # Mock do banco de dados - persona já existe (violação do índice único)
+                    service.db.personas.insert_one = AsyncMock(side_effect=DuplicateKeyError("E11000 duplicate key"))
                     
                     with pytest.raises(ValueError, match="Agente já possui uma persona. Use PUT para atualizar."):
                         await service.create_persona(agent_id, sample_persona_data)
@@ -179,16 +181,12 @@ class TestUpdatePersona:
         with patch.object(service.validator, 'validate_agent_exists', return_value=True):
             with patch.object(service.validator, 'validate_persona_content', return_value={"is_valid": True}):
                 with patch.object(service.validator, 'validate_persona_metadata', return_value=update_data.metadata):
-                    # Mock do banco de dados
-                    service.db.personas.find_one = AsyncMock(return_value=sample_persona_doc)
-                    service.db.personas.update_one = AsyncMock(return_value=MagicMock(modified_count=1))
-                    
-                    # Mock da busca após atualização
+                    # Mock da atualização (documento após atualização)
                     updated_doc = sample_persona_doc.copy()
                     updated_doc["content"] = update_data.content
                     updated_doc["metadata"] = update_data.metadata
                     updated_doc["version"] = 2
-                    service.db.personas.find_one = AsyncMock(return_value=updated_doc)
+                    service.db.personas.find_one_and_update = AsyncMock(return_value=updated_doc)
                     
                     result = await service.update_persona(agent_id, update_data)
                     
@@ -196,6 +194,10 @@ class TestUpdatePersona:
                     assert result.content == update_data.content
                     assert result.metadata == update_data.metadata
                     assert result.version == 2
+                    query, update = service.db.personas.find_one_and_update.call_args.args
+                    assert query == {"agent_id": agent_id}
+                    assert update["$inc"] == {"version": 1}
+                    assert "version" not in update["$set"]
     
     @pytest.mark.asyncio
     async def test_update_persona_agent_not_found(self, service):
@@ -214,7 +216,7 @@ class TestUpdatePersona:
         update_data = PersonaUpdate(content="# Teste Atualizado")
         
         with patch.object(service.validator, 'validate_agent_exists', return_value=True):
-            service.db.personas.find_one = AsyncMock(return_value=None)
+            service.db.personas.find_one_and_update = AsyncMock(return_value=None)
             
             with pytest.raises(ValueError, match="Persona não encontrada para este agente"):
                 await service.update_persona(agent_id, update_data)
@@ -239,8 +241,7 @@ class TestUpdatePersona:
         
         with patch.object(service.validator, 'validate_agent_exists', return_value=True):
             with patch.object(service.validator, 'validate_persona_content', return_value={"is_valid": True}):
-                service.db.personas.find_one = AsyncMock(return_value=sample_persona_doc)
-                service.db.personas.update_one = AsyncMock(side_effect=PyMongoError("Database error"))
+                service.db.personas.find_one_and_update = AsyncMock(side_effect=PyMongoError("Database error"))
                 
                 with pytest.raises(PyMongoError, match="Erro ao atualizar persona: Database error"):
                     await service.update_persona(agent_id, update_data)
@@ -306,7 +307,7 @@ class TestListPersonas:
         mock_cursor = MagicMock()
         mock_cursor.to_list = AsyncMock(return_value=personas_docs)
         service.db.personas.find = MagicMock(return_value=mock_cursor)
-        service.db.personas.count_documents = AsyncMock(return_value=1)
+        service.db.personas.estimated_document_count = AsyncMock(return_value=1)
         
         result = await service.list_personas(page=1, per_page=10)
         
@@ -345,7 +346,7 @@ class TestListPersonas:
         mock_cursor = MagicMock()
         mock_cursor.to_list = AsyncMock(return_value=personas_docs)
         service.db.personas.find = MagicMock(return_value=mock_cursor)
-        service.db.personas.count_documents = AsyncMock(return_value=25)  # Total de 25 personas
+        service.db.personas.estimated_document_count = AsyncMock(return_value=25)  # Total de 25 personas
         
         result = await service.list_personas(page=2, per_page=10)
         
@@ -356,6 +357,22 @@ class TestListPersonas:
         assert result.has_next is True
         assert result.has_prev is True
     
+    @pytest.mark.asyncio
+    async def test_list_personas_count_strategy(self, service):
+        """Testa contagem estimada sem filtro e contagem exata com filtro"""
+        mock_cursor = MagicMock()
+        mock_cursor.sort.return_value.skip.return_value.limit.return_value.to_list = AsyncMock(return_value=[])
+        service.db.personas.find = MagicMock(return_value=mock_cursor)
+        service.db.personas.estimated_document_count = AsyncMock(return_value=40)
+        service.db.personas.count_documents = AsyncMock(return_value=1)
+
+        assert (await service.list_personas(page=1, per_page=10)).total == 40
+        service.db.personas.count_documents.assert_not_awaited()
+
+        assert (await service.list_personas(page=1, per_page=10, agent_id="agent_a")).total == 1
+        service.db.personas.count_documents.assert_awaited_once_with({"agent_id": "agent_a"})
+        service.db.personas.estimated_document_count.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_list_personas_invalid_page(self, service):
         """Testa listagem de personas com página inválida"""
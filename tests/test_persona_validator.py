@@ -8,9 +8,16 @@ from unittest.mock import AsyncMock, MagicMock
 from bson import ObjectId
 from pymongo.errors import PyMongoError
 
+from src.services import persona_validator
 from src.services.persona_validator import PersonaValidator
 
 
+@pytest.fixture(autouse=True)
+def clear_agent_cache():
+    """Limpa o cache de existência de agentes entre os testes"""
+    persona_validator._agent_exists_cache.clear()
+
+
 @pytest.fixture
 def mock_db():
     """Mock do banco de dados"""
@@ -52,6 +59,21 @@ class TestValidateAgentExists:
         result = await validator.validate_agent_exists(agent_id)
         assert result is False
     
+    @pytest.mark.asyncio
+    async def test_validate_agent_exists_cached(self, validator):
+        """Testa que agentes encontrados ficam em cache até serem removidos"""
+        validator.db.agents.find_one = AsyncMock(return_value={"_id": ObjectId()})
+
+        assert await validator.validate_agent_exists("agent_a") is True
+        assert await validator.validate_agent_exists("agent_a") is True
+        validator.db.agents.find_one.assert_awaited_once()
+
+        persona_validator.invalidate_agent_cache("agent_a")
+        validator.db.agents.find_one = AsyncMock(return_value=None)
+        assert await validator.validate_agent_exists("agent_a") is False
+        assert await validator.validate_agent_exists("agent_a") is False
+        assert validator.db.agents.find_one.await_count == 2
+
     @pytest.mark.asyncio
     async def test_validate_agent_exists_invalid_id(self, validator):
         """Testa validação com ID inválido"""
@@ -208,14 +230,27 @@ class TestValidatePersonaUpdate:
         agent_id = "507f1f77bcf86cd799439011"
         persona_id = "507f1f77bcf86cd799439012"
         
-        validator.db.agents.find_one = AsyncMock(return_value={"_id": ObjectId(agent_id)})
-        validator.db.personas.find_one = AsyncMock(return_value={
-            "_id": ObjectId(persona_id),
-            "agent_id": ObjectId(agent_id)
-        })
+        validator.db.agents.aggregate = MagicMock(
+            return_value=MagicMock(to_list=AsyncMock(return_value=[{"has_persona": True}]))
+        )
+
+        result = await validator.validate_persona_update(agent_id, persona_id)
+        assert result is True
+        validator.db.agents.aggregate.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_validate_persona_update_cached_agent(self, validator):
+        """Testa que agente já confirmado dispensa a agregação"""
+        agent_id = "507f1f77bcf86cd799439011"
+        persona_id = "507f1f77bcf86cd799439012"
+
+        persona_validator._agent_exists_cache[agent_id] = True
+        validator.db.agents.aggregate = MagicMock()
+        validator.db.personas.find_one = AsyncMock(return_value={"_id": persona_id})
         
         result = await validator.validate_persona_update(agent_id, persona_id)
         assert result is True
+        validator.db.agents.aggregate.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_validate_persona_update_agent_not_found(self, validator):
@@ -223,7 +258,9 @@ class TestValidatePersonaUpdate:
         agent_id = "507f1f77bcf86cd799439011"
         persona_id = "507f1f77bcf86cd799439012"
         
-        validator.db.agents.find_one = AsyncMock(return_value=None)
+        validator.db.agents.aggregate = MagicMock(
+            return_value=MagicMock(to_list=AsyncMock(return_value=[]))
+        )
         
         with pytest.raises(ValueError, match="Agente não encontrado"):
             await validator.validate_persona_update(agent_id, persona_id)
@@ -234,8 +271,9 @@ class TestValidatePersonaUpdate:
         agent_id = "507f1f77bcf86cd799439011"
         persona_id = "507f1f77bcf86cd799439012"
         
-        validator.db.agents.find_one = AsyncMock(return_value={"_id": ObjectId(agent_id)})
-        validator.db.personas.find_one = AsyncMock(return_value=None)
+        validator.db.agents.aggregate = MagicMock(
+            return_value=MagicMock(to_list=AsyncMock(return_value=[{"has_persona": False}]))
+        )
         
         with pytest.raises(ValueError, match="Persona não encontrada ou não pertence ao agente"):
             await validator.validate_persona_update(agent_id, persona_id)
@@ -308,6 +346,17 @@ def hello():
         assert stats["markdown_elements"]["code_blocks"] == 1
         assert stats["markdown_elements"]["links"] == 1
     
+    def test_calculate_content_stats_single_pass(self, validator):
+        """Testa que cada trecho conta para um único elemento"""
+        content = "**Bold** *it* ![img](a.png) [link](b)\n```\n# não é header\n```\n- item"
+
+        elements = validator._calculate_content_stats(content)["markdown_elements"]
+
+        assert elements == {
+            "headers": 0, "bold": 1, "italic": 1, "code_blocks": 1,
+            "links": 1, "images": 1, "lists": 1
+        }
+
     def test_calculate_content_stats_empty(self, validator):
         """Testa cálculo de estatísticas com conteúdo vazio"""
         content = ""